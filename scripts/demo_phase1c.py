@@ -24,7 +24,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.utils.web3_provider import get_web3, check_network_health, Web3Provider
+from src.utils.web3_provider import get_web3, check_network_health_many, Web3Provider
 from src.utils.config import get_settings
 from src.protocols.aerodrome import AerodromeProtocol
 from src.tokens import ERC20Token
@@ -67,20 +67,22 @@ async def demo_multi_network():
 
     networks = ["base-mainnet", "arbitrum-sepolia"]
 
-    for network_id in networks:
-        try:
-            health = check_network_health(network_id)
-
-            if health["connected"]:
-                print(f"\n✅ {network_id.upper()}")
-                print(f"   Chain ID:    {health['chain_id']}")
-                print(f"   Block:       {health['block_number']:,}")
-                print(f"   Gas Price:   {health['gas_price_gwei']:.4f} gwei")
-            else:
-                print(f"\n❌ {network_id}: {health.get('error', 'Unknown error')}")
-
-        except Exception as e:
-            print(f"\n❌ {network_id}: {e}")
+    # Probe all networks at once; failures come back as error entries
+    try:
+        results = await check_network_health_many(networks)
+    except Exception as e:
+        print(f"\n❌ Health checks failed: {e}")
+        return
+
+    for health in results:
+        network_id = health["network_id"]
+        if health["connected"]:
+            print(f"\n✅ {network_id.upper()}")
+            print(f"   Chain ID:    {health['chain_id']}")
+            print(f"   Block:       {health['block_number']:,}")
+            print(f"   Gas Price:   {health['gas_price_gwei']:.4f} gwei")
+        else:
+            print(f"\n❌ {network_id}: {health.get('error', 'Unknown error')}")
 
 
 async def demo_cache_performance():
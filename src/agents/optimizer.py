@@ -301,7 +301,7 @@ class OptimizerAgent:
         target_opportunities = [
             opp
             for opp in opportunities
-            if self.target_token.upper() in [t.upper() for t in opp.tokens]
+            if self.target_token.upper() in opp.upper_tokens
         ]
         logger.info(
             f"🔍 DEBUG: {len(target_opportunities)}/{len(opportunities)} opportunities "
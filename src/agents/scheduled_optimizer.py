@@ -172,6 +172,8 @@ class ScheduledOptimizer:
         self.status = SchedulerStatus()
         self._task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
+        # Set after each completed scheduled scan; cleared by start()
+        self._cycle_complete_event = asyncio.Event()
 
     async def start(self) -> None:
         """Start the autonomous scheduler.
@@ -191,6 +193,7 @@ class ScheduledOptimizer:
         self.status.running = True
         self.status.start_time = datetime.now(UTC)
         self._stop_event.clear()
+        self._cycle_complete_event.clear()
 
         # Start background task
         self._task = asyncio.create_task(self._run_loop())
@@ -272,6 +275,7 @@ class ScheduledOptimizer:
                     # Update scan time
                     self.status.last_scan_time = datetime.now(UTC)
                     self.status.total_scans += 1
+                    self._cycle_complete_event.set()
 
                     # Wait for next interval (or stop signal)
                     await asyncio.wait_for(
@@ -5,7 +5,8 @@ all supported DeFi protocols to identify yield opportunities.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional
 from decimal import Decimal
 from datetime import datetime, UTC, timedelta
 from src.protocols.aerodrome import AerodromeProtocol
@@ -67,6 +68,26 @@ class YieldOpportunity:
         self.tokens = tokens
         self.metadata = metadata or {}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the cached token set if tokens change.
+
+        Args:
+            name: Attribute name
+            value: New value
+        """
+        if name == "tokens":
+            self.__dict__.pop("upper_tokens", None)
+        super().__setattr__(name, value)
+
+    @cached_property
+    def upper_tokens(self) -> FrozenSet[str]:
+        """Upper-cased token symbols, for case-insensitive membership checks.
+
+        Returns:
+            Frozen set of upper-cased token symbols
+        """
+        return frozenset(t.upper() for t in self.tokens)
+
 
 class YieldScannerAgent:
     """Agent for scanning and comparing yields across DeFi protocols.
@@ -310,7 +331,7 @@ class YieldScannerAgent:
                 continue
 
             # Check token filter (if specified)
-            if token and token.upper() not in [t.upper() for t in opp.tokens]:
+            if token and token.upper() not in opp.upper_tokens:
                 continue
 
             filtered.append(opp)
@@ -430,7 +451,7 @@ class YieldScannerAgent:
         token_opportunities = [
             opp
             for opp in all_opportunities
-            if token.upper() in [t.upper() for t in opp.tokens]
+            if token.upper() in opp.upper_tokens
         ]
 
         if protocol_allowlist is not None:
@@ -500,7 +521,7 @@ class YieldScannerAgent:
             opportunities = [
                 opp
                 for opp in all_opportunities
-                if token.upper() in [t.upper() for t in opp.tokens]
+                if token.upper() in opp.upper_tokens
             ]
             logger.info(f"Filtered to {len(opportunities)} {token} opportunities")
         else:
@@ -7,18 +7,57 @@ This module provides comprehensive gas estimation including:
 - Caching for performance
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
 from decimal import Decimal
 from enum import Enum
+import asyncio
+import bisect
 import time
 from web3 import Web3
 
+from src.utils.constants import WEI_PER_ETH
 from src.utils.logger import get_logger
-from src.utils.web3_provider import get_web3
+from src.utils.web3_provider import batch_rpc_reads, get_web3
 from src.data.oracles import PriceOracle
 
 logger = get_logger(__name__)
 
+# Calldata complexity tiers, keyed on the calldata hex string length
+# (including "0x"). Each entry applies from its threshold up to the next.
+_TIER_THRESHOLDS: Tuple[int, ...] = (0, 100, 500)
+_TIER_BUFFERS: Tuple[float, ...] = (1.30, 1.50, 2.00)
+_TIER_NAMES: Tuple[str, ...] = ("simple_contract", "dex_swap", "complex_operation")
+
+
+def _calldata_length(data: Union[str, bytes]) -> int:
+    """Measure calldata in hex-string characters (including "0x").
+
+    Raw bytes are measured without hex-encoding them first. Empty calldata
+    ("0x" or b"") counts as 0.
+
+    Args:
+        data: Calldata as a hex string or raw bytes
+
+    Returns:
+        Calldata length in hex-string characters, 0 if empty
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return 2 + 2 * len(data) if data else 0
+    return len(data) if data and data != "0x" else 0
+
+
+def _classify_tier(data_length: int) -> Tuple[float, str]:
+    """Pick the contract-call buffer tier for a calldata length.
+
+    Args:
+        data_length: Calldata length from _calldata_length()
+
+    Returns:
+        Tuple of (buffer multiplier, complexity name)
+    """
+    tier = bisect.bisect_right(_TIER_THRESHOLDS, data_length) - 1
+    return _TIER_BUFFERS[tier], _TIER_NAMES[tier]
+
 
 class GasEstimateMode(Enum):
     """Gas estimation strategies."""
@@ -49,6 +88,7 @@ class GasEstimator:
         cache_ttl_seconds: int = 300,
         max_gas_price_gwei: Optional[int] = None,
         estimate_mode: GasEstimateMode = GasEstimateMode.DIRECT,
+        web3: Optional[Web3] = None,
     ) -> None:
         """Initialize gas estimator.
 
@@ -58,9 +98,11 @@ class GasEstimator:
             cache_ttl_seconds: Cache time-to-live (default: 300s)
             max_gas_price_gwei: Maximum acceptable gas price in gwei (None = no limit)
             estimate_mode: Estimation mode (simulation or direct)
+            web3: Web3 instance to share with the caller (optional, defaults
+                to the cached instance for the network)
         """
         self.network = network
-        self.w3 = get_web3(network)
+        self.w3 = web3 if web3 is not None else get_web3(network)
         self.price_oracle = price_oracle
         self.cache_ttl = cache_ttl_seconds
         self.max_gas_price_gwei = max_gas_price_gwei
@@ -69,6 +111,7 @@ class GasEstimator:
         # Cache: {cache_key: (value, timestamp)}
         self._gas_price_cache: Optional[Tuple[int, float]] = None
         self._estimate_cache: Dict[str, Tuple[int, float]] = {}
+        self._tx_context_cache: Dict[str, Tuple[Dict[str, int], float]] = {}
 
         # Network characteristics
         self.supports_eip1559 = self._check_eip1559_support()
@@ -170,11 +213,71 @@ class GasEstimator:
             logger.warning(f"Using default gas price: {default_gwei} gwei for {self.network}")
             return default_gas_price
 
+    async def prefetch_tx_context(self, address: str) -> Dict[str, int]:
+        """Fetch gas price, nonce and ETH balance for an address in one round-trip.
+
+        The three reads are sent as a single JSON-RPC batch (one HTTP POST).
+        Multicall3 cannot serve eth_gasPrice or eth_getTransactionCount, so a
+        batch is used instead. If the provider rejects batching, the calls
+        fall back to individual requests.
+
+        The result is cached per address for cache_ttl seconds. The nonce
+        goes stale as soon as a transaction is sent, so call
+        invalidate_tx_context() after submitting.
+
+        Args:
+            address: Account address
+
+        Returns:
+            Dict with gas_price (wei), nonce and balance (wei)
+
+        Raises:
+            ValueError: If gas price exceeds configured maximum
+        """
+        checksum_address = Web3.to_checksum_address(address)
+
+        cached = self._tx_context_cache.get(checksum_address)
+        if cached:
+            context, cached_time = cached
+            if time.time() - cached_time < self.cache_ttl:
+                logger.debug(f"Using cached tx context for {checksum_address}")
+                return context
+
+        gas_price, nonce, balance = await asyncio.to_thread(
+            batch_rpc_reads,
+            self.w3,
+            lambda: self.w3.eth.gas_price,
+            lambda: self.w3.eth.get_transaction_count(checksum_address),
+            lambda: self.w3.eth.get_balance(checksum_address),
+        )
+
+        if self.max_gas_price_gwei:
+            max_gas_price_wei = self.w3.to_wei(self.max_gas_price_gwei, "gwei")
+            if gas_price > max_gas_price_wei:
+                raise ValueError(
+                    f"Gas price {self.w3.from_wei(gas_price, 'gwei'):.2f} gwei "
+                    f"exceeds maximum {self.max_gas_price_gwei} gwei"
+                )
+
+        context = {"gas_price": gas_price, "nonce": nonce, "balance": balance}
+        self._tx_context_cache[checksum_address] = (context, time.time())
+
+        logger.debug(f"Prefetched tx context for {checksum_address}: {context}")
+        return context
+
+    def invalidate_tx_context(self, address: str) -> None:
+        """Drop the cached tx context for an address (e.g. after sending).
+
+        Args:
+            address: Account address
+        """
+        self._tx_context_cache.pop(Web3.to_checksum_address(address), None)
+
     async def estimate_gas(
         self,
         to: str,
         value: int = 0,
-        data: str = "0x",
+        data: Union[str, bytes] = "0x",
         from_address: Optional[str] = None,
     ) -> int:
         """Estimate gas limit for a transaction.
@@ -185,14 +288,19 @@ class GasEstimator:
         Args:
             to: Target address
             value: ETH value in wei
-            data: Transaction data
+            data: Transaction data as a hex string or raw bytes (e.g. ABI-encoded)
             from_address: Sender address (optional)
 
         Returns:
             Estimated gas limit with safety buffer
         """
+        data_length = _calldata_length(data)
+
         # Check cache (using transaction hash as key)
-        cache_key = f"{to}:{value}:{data[:20]}"  # Truncate data for cache key
+        data_prefix = (
+            "0x" + bytes(data[:9]).hex() if isinstance(data, (bytes, bytearray)) else data[:20]
+        )
+        cache_key = f"{to}:{value}:{data_prefix}"  # Truncate data for cache key
         if cache_key in self._estimate_cache:
             cached_estimate, cached_time = self._estimate_cache[cache_key]
             if time.time() - cached_time < self.cache_ttl:
@@ -206,7 +314,7 @@ class GasEstimator:
                 "value": value,
             }
 
-            if data and data != "0x":
+            if data_length:
                 tx_params["data"] = data
 
             if from_address:
@@ -215,34 +323,23 @@ class GasEstimator:
             # Simulation mode: try eth_call first
             if self.estimate_mode == GasEstimateMode.SIMULATION:
                 try:
-                    self.w3.eth.call(tx_params)
+                    await asyncio.to_thread(self.w3.eth.call, tx_params)
                     logger.debug("Transaction simulation succeeded")
                 except Exception as e:
                     logger.warning(f"Transaction simulation failed: {e}")
                     # Continue to estimation anyway
 
-            # Estimate gas
-            estimated_gas = self.w3.eth.estimate_gas(tx_params)
+            # Estimate gas (blocking RPC runs off the event loop)
+            estimated_gas = await asyncio.to_thread(self.w3.eth.estimate_gas, tx_params)
 
             # Apply tiered safety buffer based on complexity
-            data_length = len(data) if data and data != "0x" else 0
-
             if value > 0 and data_length == 0:
                 # Simple ETH transfer
                 buffer_percent = 1.20  # 20%
                 complexity = "simple_transfer"
-            elif data_length < 100:
-                # Simple contract call (e.g., ERC20 transfer)
-                buffer_percent = 1.30  # 30%
-                complexity = "simple_contract"
-            elif data_length < 500:
-                # DEX swap or moderate complexity
-                buffer_percent = 1.50  # 50%
-                complexity = "dex_swap"
             else:
-                # Complex operation (multi-hop, batch)
-                buffer_percent = 2.00  # 100%
-                complexity = "complex_operation"
+                # Contract call: 30% / 50% / 100% by calldata size
+                buffer_percent, complexity = _classify_tier(data_length)
 
             gas_with_buffer = int(estimated_gas * buffer_percent)
 
@@ -259,9 +356,9 @@ class GasEstimator:
         except Exception as e:
             logger.error(f"Gas estimation failed: {e}")
             # Provide conservative default
-            if data and len(data) > 100:
+            if data_length > 100:
                 default_gas = 500000  # Complex operation default
-            elif data and data != "0x":
+            elif data_length:
                 default_gas = 100000  # Contract call default
             else:
                 default_gas = 21000  # Simple transfer default
@@ -290,7 +387,7 @@ class GasEstimator:
         total_cost_wei = gas_limit * gas_price_wei
 
         # Convert to ETH
-        total_cost_eth = Decimal(str(self.w3.from_wei(total_cost_wei, "ether")))
+        total_cost_eth = Decimal(total_cost_wei) / WEI_PER_ETH
 
         if not in_usd:
             return total_cost_eth
@@ -338,20 +435,22 @@ class GasEstimator:
         # Get gas price
         gas_price_wei = await self.get_gas_price()
 
-        # Calculate gas cost
-        gas_cost_eth = await self.calculate_gas_cost(gas_limit, in_usd=False)
-        gas_cost_usd = await self.calculate_gas_cost(gas_limit, in_usd=True)
+        # Keep amounts as integer wei; convert to Decimal ETH once each
+        gas_cost_wei = gas_limit * gas_price_wei
+        gas_cost_eth = Decimal(gas_cost_wei) / WEI_PER_ETH
+        value_eth = Decimal(value) / WEI_PER_ETH
+        total_value_eth = Decimal(value + gas_cost_wei) / WEI_PER_ETH
 
-        # Calculate total value (value + gas)
-        value_eth = Decimal(str(self.w3.from_wei(value, "ether")))
-        total_value_eth = value_eth + gas_cost_eth
-
-        # Convert total to USD
+        # Convert to USD with a single oracle lookup
         try:
             eth_price_usd = await self.price_oracle.get_price("ETH", "USD")
+            gas_cost_usd = gas_cost_eth * eth_price_usd
             total_cost_usd = total_value_eth * eth_price_usd
-        except:
-            total_cost_usd = gas_cost_usd  # Fallback to just gas cost in USD
+        except Exception as e:
+            logger.error(f"Failed to convert transaction cost to USD: {e}")
+            # Same fallback as calculate_gas_cost: gas cost in ETH
+            gas_cost_usd = gas_cost_eth
+            total_cost_usd = gas_cost_usd
 
         return {
             "gas_limit": gas_limit,
@@ -368,4 +467,5 @@ class GasEstimator:
         """Clear all cached gas data."""
         self._gas_price_cache = None
         self._estimate_cache.clear()
+        self._tx_context_cache.clear()
         logger.debug("Cleared gas estimator cache")
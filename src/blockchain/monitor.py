@@ -8,6 +8,7 @@ from typing import Any, Callable, Dict, List, Optional
 from decimal import Decimal
 import asyncio
 import time
+from web3 import Web3
 from src.utils.logger import get_logger
 from src.utils.web3_provider import get_web3
 
@@ -61,21 +62,37 @@ class ChainMonitor:
         network: Network ID (e.g., "base-sepolia")
         listeners: Event listeners
         monitoring_active: Whether monitoring is active
+        web3: Optional Web3 instance shared with the caller
     """
 
-    def __init__(self, config: Dict[str, Any], wallet_address: str) -> None:
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        wallet_address: str,
+        web3: Optional[Web3] = None,
+    ) -> None:
         """Initialize the chain monitor.
 
         Args:
             config: Monitoring configuration
             wallet_address: Wallet address to monitor
+            web3: Optional Web3 instance to reuse (e.g. the wallet's), so the
+                monitor shares its HTTP connection pool instead of opening
+                another. Defaults to the cached instance from get_web3().
         """
         self.config = config
         self.wallet_address = wallet_address
         self.network = config.get("network", "base-sepolia")
+        self.web3 = web3
         self.listeners: List[Callable[[ChainEvent], None]] = []
         self.monitoring_active = False
 
+    def _get_web3(self) -> Web3:
+        """Return the injected Web3 instance, or the cached one for the network."""
+        if self.web3 is not None:
+            return self.web3
+        return get_web3(self.network)
+
     async def start_monitoring(self) -> None:
         """Start monitoring the blockchain."""
         self.monitoring_active = True
@@ -93,7 +110,7 @@ class ChainMonitor:
             Current max fee per gas in wei
         """
         try:
-            w3 = get_web3(self.network)
+            w3 = self._get_web3()
             latest_block = w3.eth.get_block("latest")
             base_fee = latest_block.get("baseFeePerGas", 0)
 
@@ -118,7 +135,7 @@ class ChainMonitor:
             Current block number
         """
         try:
-            w3 = get_web3(self.network)
+            w3 = self._get_web3()
             block_number = w3.eth.block_number
             logger.debug(f"Current block number: {block_number}")
             return block_number
@@ -147,7 +164,7 @@ class ChainMonitor:
             True if confirmed, False if timeout or failed
         """
         try:
-            w3 = get_web3(self.network)
+            w3 = self._get_web3()
             start_time = time.time()
             poll_interval = 2  # seconds
 
@@ -214,7 +231,7 @@ class ChainMonitor:
             Transaction receipt dict or None if not found
         """
         try:
-            w3 = get_web3(self.network)
+            w3 = self._get_web3()
             receipt = w3.eth.get_transaction_receipt(tx_hash)
 
             if receipt is None:
@@ -246,7 +263,7 @@ class ChainMonitor:
             Revert reason string or None
         """
         try:
-            w3 = get_web3(self.network)
+            w3 = self._get_web3()
 
             # Get transaction
             tx = w3.eth.get_transaction(tx_hash)
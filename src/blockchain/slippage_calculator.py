@@ -19,6 +19,23 @@ class PriceDeviationError(Exception):
     pass
 
 
+def slippage_ratio(expected_amount: Decimal, minimum_amount: Decimal) -> Decimal:
+    """Fraction of the expected amount given up by accepting the minimum.
+
+    Shared primitive for slippage checks on the swap and transaction paths.
+    Callers compare the result against a tolerance ratio precomputed once
+    (e.g. 0.005 for 0.5%) instead of re-deriving percentages per call.
+
+    Args:
+        expected_amount: Expected amount (must be non-zero)
+        minimum_amount: Minimum acceptable amount
+
+    Returns:
+        Slippage as a ratio (0.005 = 0.5%)
+    """
+    return (expected_amount - minimum_amount) / expected_amount
+
+
 class SlippageCalculator:
     """Calculator for slippage protection and price validation.
 
@@ -304,9 +321,7 @@ class SlippageCalculator:
             return 0
 
         # slippage = (expected - minimum) / expected * 10000
-        slippage_bps = int(
-            (expected_amount - minimum_amount) / expected_amount * Decimal(10000)
-        )
+        slippage_bps = int(slippage_ratio(expected_amount, minimum_amount) * Decimal(10000))
 
         logger.debug(
             f"Calculated slippage: {slippage_bps}bps "
@@ -115,7 +115,7 @@ class SwapExecutor:
         # Initialize components
         self.quoter = UniswapV3Quoter(w3, network)
         self.router = UniswapV3Router(w3, network)
-        self.gas_estimator = GasEstimator(network, price_oracle)
+        self.gas_estimator = GasEstimator(network, price_oracle, web3=w3)
         self.slippage_calc = SlippageCalculator(
             default_slippage_bps=default_slippage_bps,
             max_price_deviation_percent=max_price_deviation_percent,
@@ -7,6 +7,7 @@ with proper error handling and retry logic.
 from typing import Any, Dict, Optional
 from decimal import Decimal
 from enum import Enum
+from src.blockchain.slippage_calculator import slippage_ratio
 from src.utils.logger import get_logger
 from src.utils.web3_provider import get_web3
 
@@ -87,6 +88,9 @@ class TransactionBuilder:
         self.config = config
         self.network = config.get("network", "base-sepolia")
         self.max_slippage_percent = config.get("max_slippage_percent", 1.0)
+        # Tolerance as a ratio, computed once so validate_slippage is a
+        # subtract/divide/compare on Decimals
+        self._max_slippage_ratio = Decimal(str(self.max_slippage_percent)) / Decimal(100)
 
     async def simulate_transaction(
         self,
@@ -238,16 +242,16 @@ class TransactionBuilder:
         if expected_output == 0:
             return False
 
-        actual_slippage = ((expected_output - min_output) / expected_output) * 100
+        actual_ratio = slippage_ratio(expected_output, min_output)
 
-        if actual_slippage > self.max_slippage_percent:
+        if actual_ratio > self._max_slippage_ratio:
             logger.warning(
-                f"Slippage too high: {actual_slippage:.2f}% > "
+                f"Slippage too high: {actual_ratio * 100:.2f}% > "
                 f"{self.max_slippage_percent}%"
             )
             return False
 
-        logger.info(f"Slippage acceptable: {actual_slippage:.2f}%")
+        logger.info(f"Slippage acceptable: {actual_ratio * 100:.2f}%")
         return True
 
     async def build_transaction(
@@ -8,6 +8,7 @@ import asyncio
 from typing import Any, Dict, Optional
 from decimal import Decimal
 from datetime import datetime
+from eth_account import Account
 from src.wallet.base_provider import WalletProvider
 from src.wallet.local_wallet_provider import LocalWalletProvider
 from src.wallet.cdp_mpc_provider import CdpMpcWalletProvider
@@ -21,6 +22,7 @@ from src.security.transaction_validator import (
 )
 from src.security.contract_whitelist import get_contract_whitelist
 from src.utils.logger import get_logger
+from src.utils.networks import get_network
 from src.utils.validators import is_valid_ethereum_address
 from src.utils.web3_provider import get_web3
 from src.utils.config import get_settings
@@ -70,6 +72,9 @@ class WalletManager:
             config: Configuration with wallet credentials and network settings
             price_oracle: Optional price oracle for USD conversions (defaults to MockPriceOracle)
             approval_manager: Optional approval manager for transaction authorization
+
+        Raises:
+            NetworkNotFoundError: If the configured network is not supported
         """
         self.config = config
         self.use_local_wallet = config.get("use_local_wallet", True)
@@ -79,6 +84,7 @@ class WalletManager:
         self.wallet_provider: Optional[WalletProvider] = None
         self.address: Optional[str] = None
         self.network = config.get("network", "base-sepolia")
+        get_network(self.network)  # Reject unknown networks before any setup
         self.dry_run_mode = config.get("dry_run_mode", True)
         self.audit_logger = AuditLogger()
 
@@ -157,14 +163,20 @@ class WalletManager:
     async def _initialize_local_wallet(self) -> None:
         """Initialize local wallet from seed phrase.
 
+        A "wallet_private_key" config entry may stand in for "wallet_seed"
+        (e.g. in tests) to skip seed derivation.
+
         Raises:
-            ValueError: If seed phrase is missing or invalid
+            ValueError: If both seed phrase and private key are missing, or
+                the one given is invalid
         """
         seed_phrase = self.config.get("wallet_seed")
-        if not seed_phrase:
+        private_key = self.config.get("wallet_private_key")
+        if not seed_phrase and not private_key:
             raise ValueError(
                 "WALLET_SEED not found in configuration. "
-                "Please set WALLET_SEED in .env file."
+                "Please set WALLET_SEED in .env file "
+                "(or pass wallet_private_key in the wallet config)."
             )
 
         logger.info(f"Initializing local wallet for network: {self.network}")
@@ -174,11 +186,22 @@ class WalletManager:
         w3 = get_web3(self.network, config=settings)
 
         # Create local wallet provider
-        self.wallet_provider = LocalWalletProvider(
-            seed_phrase=seed_phrase,
-            web3=w3,
-            config=self.config,
-        )
+        if seed_phrase:
+            self.wallet_provider = LocalWalletProvider(
+                seed_phrase=seed_phrase,
+                web3=w3,
+                config=self.config,
+            )
+        else:
+            try:
+                account = Account.from_key(private_key)
+            except Exception as e:
+                raise ValueError(f"Invalid private key: {e}")
+            self.wallet_provider = LocalWalletProvider.from_account(
+                account=account,
+                web3=w3,
+                config=self.config,
+            )
 
         # Get wallet address
         self.address = self.wallet_provider.get_address()
@@ -1169,7 +1192,11 @@ class WalletManager:
 
                 from src.blockchain.monitor import ChainMonitor
 
-                monitor = ChainMonitor({"network": self.network}, self.address)
+                monitor = ChainMonitor(
+                    {"network": self.network},
+                    self.address,
+                    web3=self.wallet_provider.web3,
+                )
                 confirmed = await monitor.wait_for_confirmation(
                     tx_hash, confirmations=confirmation_blocks, timeout=300
                 )
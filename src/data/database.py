@@ -4,16 +4,23 @@ This module handles database connections, session management,
 and provides repository patterns for data access.
 """
 
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Type, TypeVar
 from contextlib import asynccontextmanager
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from .models import Base, Position, Transaction, Decision, PerformanceMetric, AuditLog, YieldHistory
+from .models import (
+    Base, Position, Transaction, Decision, PerformanceMetric, AuditLog, YieldHistory, Pool,
+)
 
 
 T = TypeVar("T", bound=Base)
 
+# URLs that address a private in-memory SQLite database
+_SQLITE_MEMORY_URLS = {":memory:", "sqlite://", "sqlite:///:memory:"}
+
 
 class Database:
     """Database connection and session manager.
@@ -32,13 +39,24 @@ class Database:
         Args:
             database_url: Database connection URL
         """
-        self.database_url = database_url
-        # Add timeout to prevent hanging on database locks (SQLite specific)
-        connect_args = {}
-        if database_url.startswith("sqlite:"):
-            connect_args = {"timeout": 10}  # 10 second timeout for SQLite
-
-        self.engine = create_engine(database_url, connect_args=connect_args)
+        engine_kwargs: Dict[str, Any] = {}
+        if database_url in _SQLITE_MEMORY_URLS:
+            # In-memory SQLite: every session must share ONE connection, or
+            # each new connection would see a fresh, empty database. StaticPool
+            # also skips per-session connect/schema work entirely.
+            self.database_url = "sqlite://"
+            connect_args = {"check_same_thread": False}
+            engine_kwargs["poolclass"] = StaticPool
+        else:
+            self.database_url = database_url
+            # Add timeout to prevent hanging on database locks (SQLite specific)
+            connect_args = {}
+            if database_url.startswith("sqlite:"):
+                connect_args = {"timeout": 10}  # 10 second timeout for SQLite
+
+        self.engine = create_engine(
+            self.database_url, connect_args=connect_args, **engine_kwargs
+        )
         self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
 
     def create_all_tables(self) -> None:
@@ -262,6 +280,32 @@ class YieldHistoryRepository(BaseRepository):
         """
         super().__init__(session, YieldHistory)
 
+    @staticmethod
+    def _snapshot_row(pool: "Pool", snapshot_timestamp: datetime) -> Dict[str, Any]:
+        """Build YieldHistory column values for a Pool snapshot.
+
+        Args:
+            pool: Pool instance to snapshot
+            snapshot_timestamp: Snapshot time
+
+        Returns:
+            Dict of YieldHistory column values
+        """
+        import json
+
+        return {
+            "protocol": pool.protocol,
+            "pool_id": pool.pool_id,
+            "pool_name": pool.name,
+            "apy": pool.apy,
+            "borrow_apy": pool.borrow_apy,
+            "tvl": pool.tvl,
+            "utilization": pool.utilization,
+            "tokens": json.dumps(pool.tokens),
+            "snapshot_timestamp": snapshot_timestamp,
+            "pool_metadata": json.dumps(pool.metadata) if pool.metadata else None,
+        }
+
     def record_snapshot(self, pool: "Pool") -> YieldHistory:
         """Record a yield snapshot from a Pool instance.
 
@@ -271,21 +315,34 @@ class YieldHistoryRepository(BaseRepository):
         Returns:
             Created YieldHistory record
         """
-        import json
-        from datetime import datetime
-
-        return self.create(
-            protocol=pool.protocol,
-            pool_id=pool.pool_id,
-            pool_name=pool.name,
-            apy=pool.apy,
-            borrow_apy=pool.borrow_apy,
-            tvl=pool.tvl,
-            utilization=pool.utilization,
-            tokens=json.dumps(pool.tokens),
-            snapshot_timestamp=datetime.utcnow(),
-            metadata=json.dumps(pool.metadata) if pool.metadata else None,
+        # Single INSERT ... RETURNING; the row comes back as an ORM instance
+        # without a unit-of-work flush
+        stmt = (
+            insert(YieldHistory)
+            .values(**self._snapshot_row(pool, datetime.utcnow()))
+            .returning(YieldHistory)
         )
+        return self.session.execute(stmt).scalar_one()
+
+    def record_snapshot_bulk(self, pools: List["Pool"]) -> int:
+        """Record yield snapshots for many pools in a single executemany INSERT.
+
+        All rows share one snapshot timestamp. Unlike record_snapshot(), no
+        ORM instances are created or flushed one by one.
+
+        Args:
+            pools: Pool instances to snapshot
+
+        Returns:
+            Number of snapshots recorded
+        """
+        if not pools:
+            return 0
+
+        snapshot_timestamp = datetime.utcnow()
+        rows = [self._snapshot_row(pool, snapshot_timestamp) for pool in pools]
+        self.session.execute(insert(YieldHistory), rows)
+        return len(rows)
 
     def get_by_protocol(self, protocol: str, limit: int = 100) -> List[YieldHistory]:
         """Get yield history for a specific protocol.
@@ -13,6 +13,7 @@ from src.utils.web3_provider import get_web3
 from src.utils.config import get_settings
 from src.utils.aerodrome_abis import AERODROME_FACTORY_ABI, AERODROME_POOL_ABI
 from src.utils.contracts import ERC20_ABI, ContractHelper, get_protocol_address
+from src.utils.multicall import aggregate3, decode_results
 from src.data.oracles import PriceOracle, create_price_oracle
 from src.api.aerodrome_bitquery import create_bitquery_client
 from .base import BaseProtocol, ProtocolPool
@@ -58,6 +59,7 @@ class AerodromeProtocol(BaseProtocol):
         router_address: Aerodrome router contract address
         dry_run_mode: If True, returns mock data
         audit_logger: Audit logging instance
+        web3: Base mainnet Web3 instance shared via config, or None to use get_web3
     """
 
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -72,6 +74,9 @@ class AerodromeProtocol(BaseProtocol):
         self.dry_run_mode = config.get("dry_run_mode", True)
         self.audit_logger = AuditLogger()
 
+        # Shared Base mainnet Web3 instance, if provided in config
+        self.web3 = config.get("web3")
+
         # Initialize price oracle for TVL calculations
         self._init_price_oracle(config)
 
@@ -411,6 +416,16 @@ class AerodromeProtocol(BaseProtocol):
         logger.warning(f"⚠️ LIVE MODE: Building real swap transaction")
         return tx
 
+    def _get_mainnet_web3(self) -> Any:
+        """Get the Web3 instance for Base mainnet pool queries.
+
+        Returns:
+            The Web3 instance shared via config, else the cached provider one
+        """
+        if self.web3 is not None:
+            return self.web3
+        return get_web3("base-mainnet", config=get_settings())
+
     async def _get_real_pools_from_mainnet(self) -> List[ProtocolPool]:
         """Query real Aerodrome pools from Base mainnet (read-only).
 
@@ -509,8 +524,7 @@ class AerodromeProtocol(BaseProtocol):
             )
 
             # Get Web3 instance for on-chain validation
-            settings = get_settings()
-            w3 = get_web3("base-mainnet", config=settings)
+            w3 = self._get_mainnet_web3()
             factory_address = AERODROME_CONTRACTS["base-mainnet"]["factory"]
             factory = ContractHelper.get_contract(w3, factory_address, AERODROME_FACTORY_ABI)
 
@@ -524,24 +538,21 @@ class AerodromeProtocol(BaseProtocol):
             )
             print(f"🔄 [BITQUERY] Validating top {max_to_fetch} pools on-chain...", flush=True)
 
-            for i, pool_info in enumerate(bitquery_pools[:max_to_fetch]):
-                print(f"   [{i+1}/{max_to_fetch}] Validating pool {pool_info.get('pool_address', 'unknown')[:10]}...", flush=True)
-                try:
-                    pool_address = pool_info["pool_address"]
+            # Query real-time pool data on-chain for all candidates together
+            pool_addresses = [
+                pool_info["pool_address"]
+                for pool_info in bitquery_pools[:max_to_fetch]
+                if pool_info.get("pool_address")
+            ]
+            pools_data = await self._query_pools_data(w3, pool_addresses, factory)
 
-                    # Query real-time pool data on-chain
-                    pool_data = await self._query_pool_data(w3, pool_address, factory)
-
-                    if pool_data:
-                        pools.append(pool_data)
-                        logger.debug(
-                            f"[{i+1}/{max_to_fetch}] Validated {pool_data.pool_id} "
-                            f"(TVL: ${pool_data.tvl:.2f})"
-                        )
-
-                except Exception as e:
-                    logger.warning(f"Failed to validate pool {pool_address}: {e}")
-                    continue
+            for i, pool_data in enumerate(pools_data):
+                if pool_data:
+                    pools.append(pool_data)
+                    logger.debug(
+                        f"[{i+1}/{max_to_fetch}] Validated {pool_data.pool_id} "
+                        f"(TVL: ${pool_data.tvl:.2f})"
+                    )
 
             logger.info(f"✅ BitQuery method: Successfully fetched {len(pools)} validated pools")
             return pools
@@ -561,8 +572,7 @@ class AerodromeProtocol(BaseProtocol):
         logger.info(f"📡 Using factory method (max {self.max_pools} pools)...")
 
         # Get Web3 instance for Base mainnet
-        settings = get_settings()
-        w3 = get_web3("base-mainnet", config=settings)
+        w3 = self._get_mainnet_web3()
 
         # Get factory contract
         factory_address = AERODROME_CONTRACTS["base-mainnet"]["factory"]
@@ -581,28 +591,45 @@ class AerodromeProtocol(BaseProtocol):
             f"(out of {pool_count} total). Consider enabling BitQuery for better coverage."
         )
 
-        for i in range(fetch_count):
-            try:
-                # Get pool address
-                pool_address = await asyncio.to_thread(factory.functions.allPools(i).call)
-
-                # Query pool data
-                pool_data = await self._query_pool_data(w3, pool_address, factory)
-
-                if pool_data:
-                    # Filter: Only include pools with supported tokens
-                    tokens = pool_data.tokens
-                    if any(token.upper() in self.supported_tokens for token in tokens):
-                        pools.append(pool_data)
-                    else:
-                        logger.debug(
-                            f"Skipping Aerodrome {'/'.join(tokens)} pool "
-                            f"(tokens not in supported list)"
-                        )
-
-            except Exception as e:
-                logger.warning(f"Failed to fetch pool {i}: {e}")
-                continue
+        # Get pool addresses in one Multicall3 eth_call
+        pool_addresses = []
+        try:
+            results = await asyncio.to_thread(
+                aggregate3,
+                w3,
+                [
+                    (factory.address, factory.encode_abi("allPools", args=[i]))
+                    for i in range(fetch_count)
+                ],
+            )
+        except Exception as e:
+            logger.warning(f"Multicall3 allPools batch failed ({e}), fetching pools one by one")
+            for i in range(fetch_count):
+                try:
+                    pool_addresses.append(
+                        await asyncio.to_thread(factory.functions.allPools(i).call)
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to fetch pool {i}: {e}")
+        else:
+            for i, decoded in enumerate(decode_results(factory, "allPools", results)):
+                if decoded:
+                    pool_addresses.append(decoded[0])
+                else:
+                    logger.warning(f"Failed to fetch pool {i}: allPools call reverted")
+
+        # Query pool data for all pools together
+        for pool_data in await self._query_pools_data(w3, pool_addresses, factory):
+            if pool_data:
+                # Filter: Only include pools with supported tokens
+                tokens = pool_data.tokens
+                if any(token.upper() in self.supported_tokens for token in tokens):
+                    pools.append(pool_data)
+                else:
+                    logger.debug(
+                        f"Skipping Aerodrome {'/'.join(tokens)} pool "
+                        f"(tokens not in supported list)"
+                    )
 
         logger.info(f"✅ Factory method: Successfully fetched {len(pools)} pools")
         return pools
@@ -640,59 +667,211 @@ class AerodromeProtocol(BaseProtocol):
             except:
                 pool_name = f"{token0_symbol}/{token1_symbol} Pool"
 
-            # Calculate TVL using Chainlink price oracle (with timeout protection)
-            try:
-                tvl, tvl_metadata = await asyncio.wait_for(
-                    self._estimate_tvl(
-                        reserve0, reserve1, dec0, dec1, token0_symbol, token1_symbol
-                    ),
-                    timeout=15.0  # 15 second timeout for TVL estimation
-                )
-            except asyncio.TimeoutError:
-                logger.warning(f"TVL estimation timed out for {token0_symbol}/{token1_symbol}")
-                tvl = Decimal("0")
-                tvl_metadata = {"error": "timeout"}
-
             # Get fee from factory (wrap blocking call in thread pool)
             fee = await asyncio.to_thread(factory.functions.getFee(pool_address, is_stable).call)
-            fee_percent = Decimal(fee) / Decimal(10000)  # Convert basis points to percent
-
-            # Create pool ID
-            pool_id = f"aero-{token0_symbol.lower()}-{token1_symbol.lower()}"
-            if is_stable:
-                pool_id += "-stable"
-
-            # Create ProtocolPool with accurate TVL pricing metadata
-            pool_metadata = {
-                "pool_address": pool_address,
-                "token0": token0_addr,
-                "token1": token1_addr,
-                "reserve0": str(reserve0),
-                "reserve1": str(reserve1),
-                "decimals0": dec0,
-                "decimals1": dec1,
-                "is_stable": is_stable,
-                "fee_percent": str(fee_percent),
-                "source": "base_mainnet",
-            }
-
-            # Merge TVL pricing metadata
-            pool_metadata.update(tvl_metadata)
 
-            pool = ProtocolPool(
-                pool_id=pool_id,
-                name=pool_name,
-                tokens=[token0_symbol, token1_symbol],
-                apy=Decimal("0"),  # APY calculation requires historical data
-                tvl=tvl,
-                metadata=pool_metadata,
+            return await self._build_pool(
+                pool_address, metadata, pool_name, token0_symbol, token1_symbol, fee
             )
-            return pool
 
         except Exception as e:
             logger.error(f"Failed to query pool {pool_address}: {e}")
             return None
 
+    async def _query_pools_data(
+        self, w3: Any, pool_addresses: List[str], factory: Any
+    ) -> List[Optional[ProtocolPool]]:
+        """Query data for many pools with two Multicall3 round-trips.
+
+        Round 1 reads metadata() and name() of every pool. Round 2 reads
+        symbol() of every distinct token together with the factory fee of
+        every pool (the fee needs the stable flag from round 1). Per-pool
+        failures yield None without affecting the other pools. If a
+        Multicall3 round itself fails, every pool is queried individually
+        instead.
+
+        Args:
+            w3: Web3 instance
+            pool_addresses: Pool contract addresses
+            factory: Factory contract instance
+
+        Returns:
+            ProtocolPool (or None if that pool's query failed) per address, in order
+        """
+        pool_addresses = [w3.to_checksum_address(address) for address in pool_addresses]
+        # Address-less contracts, used only to encode calldata and decode results
+        pool_abi = w3.eth.contract(abi=AERODROME_POOL_ABI)
+        token_abi = w3.eth.contract(abi=ERC20_ABI)
+
+        # Round 1: pool metadata and names
+        encoded_metadata = pool_abi.encode_abi("metadata")
+        encoded_name = pool_abi.encode_abi("name")
+        calls = []
+        for address in pool_addresses:
+            calls.append((address, encoded_metadata))
+            calls.append((address, encoded_name))
+        try:
+            results = await asyncio.to_thread(aggregate3, w3, calls)
+        except Exception as e:
+            return await self._query_pools_individually(w3, pool_addresses, factory, e)
+
+        metadatas = []
+        for metadata in decode_results(pool_abi, "metadata", results[0::2]):
+            if metadata:
+                # Raw ABI decoding yields lowercase addresses; checksum like .call() does
+                metadata = (
+                    *metadata[:5],
+                    w3.to_checksum_address(metadata[5]),
+                    w3.to_checksum_address(metadata[6]),
+                )
+            metadatas.append(metadata)
+        names = decode_results(pool_abi, "name", results[1::2])
+
+        # Round 2: token symbols and factory fees
+        encoded_symbol = token_abi.encode_abi("symbol")
+        tokens = list(
+            dict.fromkeys(
+                token for metadata in metadatas if metadata for token in metadata[5:7]
+            )
+        )
+        live_pools = [
+            (address, metadata)
+            for address, metadata in zip(pool_addresses, metadatas)
+            if metadata
+        ]
+        calls = [(token, encoded_symbol) for token in tokens]
+        calls += [
+            (factory.address, factory.encode_abi("getFee", args=[address, metadata[4]]))
+            for address, metadata in live_pools
+        ]
+        try:
+            results = await asyncio.to_thread(aggregate3, w3, calls)
+        except Exception as e:
+            return await self._query_pools_individually(w3, pool_addresses, factory, e)
+
+        symbols = {}
+        decoded_symbols = decode_results(token_abi, "symbol", results[: len(tokens)])
+        for token, decoded in zip(tokens, decoded_symbols):
+            # Fall back to a shortened address, as _get_token_symbol does
+            symbols[token] = decoded[0] if decoded else f"{token[:6]}...{token[-4:]}"
+        fees = {
+            address: fee
+            for (address, _), fee in zip(
+                live_pools, decode_results(factory, "getFee", results[len(tokens):])
+            )
+        }
+
+        pools: List[Optional[ProtocolPool]] = []
+        for address, metadata, name in zip(pool_addresses, metadatas, names):
+            if not metadata or not fees.get(address):
+                logger.error(f"Failed to query pool {address}: metadata or fee call reverted")
+                pools.append(None)
+                continue
+            token0_symbol = symbols[metadata[5]]
+            token1_symbol = symbols[metadata[6]]
+            pool_name = name[0] if name else f"{token0_symbol}/{token1_symbol} Pool"
+            try:
+                pools.append(
+                    await self._build_pool(
+                        address, metadata, pool_name, token0_symbol, token1_symbol,
+                        fees[address][0],
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Failed to query pool {address}: {e}")
+                pools.append(None)
+        return pools
+
+    async def _query_pools_individually(
+        self, w3: Any, pool_addresses: List[str], factory: Any, error: Exception
+    ) -> List[Optional[ProtocolPool]]:
+        """Query pools one at a time after a failed Multicall3 round.
+
+        Args:
+            w3: Web3 instance
+            pool_addresses: Checksummed pool addresses
+            factory: Factory contract instance
+            error: Exception raised by the Multicall3 call
+
+        Returns:
+            ProtocolPool (or None if that pool's query failed) per address, in order
+        """
+        logger.warning(f"Multicall3 pool query failed ({error}), querying pools one by one")
+        return [
+            await self._query_pool_data(w3, address, factory) for address in pool_addresses
+        ]
+
+    async def _build_pool(
+        self,
+        pool_address: str,
+        metadata: tuple,
+        pool_name: str,
+        token0_symbol: str,
+        token1_symbol: str,
+        fee: int,
+    ) -> ProtocolPool:
+        """Build a ProtocolPool from on-chain pool data, pricing its TVL.
+
+        Args:
+            pool_address: Checksummed pool address
+            metadata: Pool metadata() result
+            pool_name: Pool name
+            token0_symbol: Symbol of token0
+            token1_symbol: Symbol of token1
+            fee: Factory fee in basis points
+
+        Returns:
+            ProtocolPool with real data
+        """
+        dec0, dec1, reserve0, reserve1, is_stable, token0_addr, token1_addr = metadata
+
+        # Calculate TVL using Chainlink price oracle (with timeout protection)
+        try:
+            tvl, tvl_metadata = await asyncio.wait_for(
+                self._estimate_tvl(
+                    reserve0, reserve1, dec0, dec1, token0_symbol, token1_symbol
+                ),
+                timeout=15.0  # 15 second timeout for TVL estimation
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"TVL estimation timed out for {token0_symbol}/{token1_symbol}")
+            tvl = Decimal("0")
+            tvl_metadata = {"error": "timeout"}
+
+        fee_percent = Decimal(fee) / Decimal(10000)  # Convert basis points to percent
+
+        # Create pool ID
+        pool_id = f"aero-{token0_symbol.lower()}-{token1_symbol.lower()}"
+        if is_stable:
+            pool_id += "-stable"
+
+        # Create ProtocolPool with accurate TVL pricing metadata
+        pool_metadata = {
+            "pool_address": pool_address,
+            "token0": token0_addr,
+            "token1": token1_addr,
+            "reserve0": str(reserve0),
+            "reserve1": str(reserve1),
+            "decimals0": dec0,
+            "decimals1": dec1,
+            "is_stable": is_stable,
+            "fee_percent": str(fee_percent),
+            "source": "base_mainnet",
+        }
+
+        # Merge TVL pricing metadata
+        pool_metadata.update(tvl_metadata)
+
+        pool = ProtocolPool(
+            pool_id=pool_id,
+            name=pool_name,
+            tokens=[token0_symbol, token1_symbol],
+            apy=Decimal("0"),  # APY calculation requires historical data
+            tvl=tvl,
+            metadata=pool_metadata,
+        )
+        return pool
+
     async def _get_token_symbol(self, w3: Any, token_address: str) -> str:
         """Get token symbol from contract (async to avoid blocking).
 
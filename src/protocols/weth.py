@@ -5,11 +5,13 @@ This is the simplest DeFi operation - perfect for validating security layers.
 """
 
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from web3 import Web3
 from web3.contract import Contract
 
+from src.utils.constants import WEI_PER_ETH
 from src.utils.logger import get_logger
+from src.utils.web3_provider import batch_rpc_reads
 
 logger = get_logger(__name__)
 
@@ -60,6 +62,28 @@ WETH_ADDRESSES = {
     "base-mainnet": "0x4200000000000000000000000000000000000006",
 }
 
+# Pre-encoded calldata. deposit() takes no arguments, so its calldata is just
+# the selector; withdraw(uint256) appends the 32-byte big-endian amount.
+# Both are hex strings, matching what contract.build_transaction() emits.
+DEPOSIT_CALLDATA = "0xd0e30db0"  # keccak256("deposit()")[:4]
+WITHDRAW_SELECTOR = "0x2e1a7d4d"  # keccak256("withdraw(uint256)")[:4]
+
+
+def encode_withdraw_calldata(amount_wei: int) -> str:
+    """Encode withdraw(uint256) calldata without an ABI round-trip.
+
+    Args:
+        amount_wei: Amount of WETH to unwrap in wei
+
+    Returns:
+        Hex-encoded calldata
+    """
+    return WITHDRAW_SELECTOR + amount_wei.to_bytes(32, "big").hex()
+
+
+# Number of most recent blocks whose balance reads are kept in the cache
+BALANCE_CACHE_BLOCKS = 3
+
 
 class WETHProtocol:
     """WETH protocol integration for wrapping/unwrapping ETH."""
@@ -79,11 +103,15 @@ class WETHProtocol:
             raise ValueError(f"WETH not supported on {network}")
 
         self.weth_address = WETH_ADDRESSES[network]
+        self._weth_checksum_address = self.w3.to_checksum_address(self.weth_address)
         self.weth_contract = self.w3.eth.contract(
-            address=self.w3.to_checksum_address(self.weth_address),
+            address=self._weth_checksum_address,
             abi=WETH_ABI,
         )
 
+        # Per-block balanceOf cache: (checksum account, block number) -> balance
+        self._balance_cache: Dict[Tuple[str, int], Decimal] = {}
+
         logger.info(
             f"Initialized WETH protocol on {network}",
             extra={"weth_address": self.weth_address},
@@ -92,17 +120,33 @@ class WETHProtocol:
     def get_weth_balance(self, account: str) -> Decimal:
         """Get WETH balance for an account.
 
+        Balances are read at the current block and cached per
+        (account, block), so repeated queries within a block (e.g. before
+        and after building a wrap) skip the balanceOf eth_call. Only the
+        last BALANCE_CACHE_BLOCKS blocks are retained.
+
         Args:
             account: Account address
 
         Returns:
             WETH balance in ETH units
         """
-        balance_wei = self.weth_contract.functions.balanceOf(
-            self.w3.to_checksum_address(account)
-        ).call()
+        checksum_account = self.w3.to_checksum_address(account)
+        block_number = self.w3.eth.block_number
+
+        cache_key = (checksum_account, block_number)
+        cached = self._balance_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        balance_eth = Decimal(balance_wei) / Decimal(10**18)
+        balance_wei = self.weth_contract.functions.balanceOf(checksum_account).call(
+            block_identifier=block_number
+        )
+
+        balance_eth = Decimal(balance_wei) / WEI_PER_ETH
+
+        self._evict_stale_balances(block_number)
+        self._balance_cache[cache_key] = balance_eth
 
         logger.debug(
             f"WETH balance for {account}: {balance_eth}",
@@ -111,32 +155,76 @@ class WETHProtocol:
 
         return balance_eth
 
+    def _evict_stale_balances(self, block_number: int) -> None:
+        """Drop cached balances older than the last BALANCE_CACHE_BLOCKS blocks.
+
+        Args:
+            block_number: Current block number
+        """
+        oldest_kept = block_number - BALANCE_CACHE_BLOCKS + 1
+        stale = [key for key in self._balance_cache if key[1] < oldest_kept]
+        for key in stale:
+            del self._balance_cache[key]
+
+    def _resolve_gas_price_and_nonce(
+        self, sender: str, tx_context: Optional[Dict[str, int]]
+    ) -> Tuple[int, int]:
+        """Take gas price and nonce from a prefetched context, else query the node.
+
+        Without a context both reads go out as one JSON-RPC batch, falling
+        back to two requests if the provider rejects batching. The chainId
+        read that follows is served from the provider's request cache after
+        the first build (see web3_provider._create_http_provider).
+
+        Args:
+            sender: Checksummed sender address
+            tx_context: Optional context from GasEstimator.prefetch_tx_context()
+
+        Returns:
+            Tuple of (gas_price, nonce)
+        """
+        if tx_context is not None:
+            return tx_context["gas_price"], tx_context["nonce"]
+
+        gas_price, nonce = batch_rpc_reads(
+            self.w3,
+            lambda: self.w3.eth.gas_price,
+            lambda: self.w3.eth.get_transaction_count(sender),
+        )
+        return gas_price, nonce
+
     def build_wrap_transaction(
-        self, from_address: str, amount_eth: Decimal
+        self,
+        from_address: str,
+        amount_eth: Decimal,
+        tx_context: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         """Build a transaction to wrap ETH into WETH.
 
         Args:
             from_address: Address wrapping ETH
             amount_eth: Amount of ETH to wrap
+            tx_context: Optional prefetched gas price/nonce (from
+                GasEstimator.prefetch_tx_context) to skip those RPCs
 
         Returns:
             Transaction dict ready for signing
         """
-        amount_wei = int(amount_eth * Decimal(10**18))
-
-        # Build deposit transaction (payable function)
-        tx = self.weth_contract.functions.deposit().build_transaction(
-            {
-                "from": self.w3.to_checksum_address(from_address),
-                "value": amount_wei,
-                "gas": 50000,  # Standard WETH deposit gas limit
-                "gasPrice": self.w3.eth.gas_price,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.w3.to_checksum_address(from_address)
-                ),
-            }
-        )
+        amount_wei = int(amount_eth * WEI_PER_ETH)
+        sender = self.w3.to_checksum_address(from_address)
+        gas_price, nonce = self._resolve_gas_price_and_nonce(sender, tx_context)
+
+        # Build deposit transaction (payable function, constant calldata)
+        tx = {
+            "from": sender,
+            "to": self._weth_checksum_address,
+            "value": amount_wei,
+            "data": DEPOSIT_CALLDATA,
+            "gas": 50000,  # Standard WETH deposit gas limit
+            "gasPrice": gas_price,
+            "nonce": nonce,
+            "chainId": self.w3.eth.chain_id,
+        }
 
         logger.info(
             f"Built wrap transaction: {amount_eth} ETH → WETH",
@@ -152,30 +240,37 @@ class WETHProtocol:
         return tx
 
     def build_unwrap_transaction(
-        self, from_address: str, amount_eth: Decimal
+        self,
+        from_address: str,
+        amount_eth: Decimal,
+        tx_context: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         """Build a transaction to unwrap WETH into ETH.
 
         Args:
             from_address: Address unwrapping WETH
             amount_eth: Amount of WETH to unwrap
+            tx_context: Optional prefetched gas price/nonce (from
+                GasEstimator.prefetch_tx_context) to skip those RPCs
 
         Returns:
             Transaction dict ready for signing
         """
-        amount_wei = int(amount_eth * Decimal(10**18))
+        amount_wei = int(amount_eth * WEI_PER_ETH)
+        sender = self.w3.to_checksum_address(from_address)
+        gas_price, nonce = self._resolve_gas_price_and_nonce(sender, tx_context)
 
         # Build withdraw transaction
-        tx = self.weth_contract.functions.withdraw(amount_wei).build_transaction(
-            {
-                "from": self.w3.to_checksum_address(from_address),
-                "gas": 50000,  # Standard WETH withdraw gas limit
-                "gasPrice": self.w3.eth.gas_price,
-                "nonce": self.w3.eth.get_transaction_count(
-                    self.w3.to_checksum_address(from_address)
-                ),
-            }
-        )
+        tx = {
+            "from": sender,
+            "to": self._weth_checksum_address,
+            "value": 0,
+            "data": encode_withdraw_calldata(amount_wei),
+            "gas": 50000,  # Standard WETH withdraw gas limit
+            "gasPrice": gas_price,
+            "nonce": nonce,
+            "chainId": self.w3.eth.chain_id,
+        }
 
         logger.info(
             f"Built unwrap transaction: {amount_eth} WETH → ETH",
@@ -200,12 +295,14 @@ class WETHProtocol:
         Returns:
             Estimated gas units
         """
-        amount_wei = int(amount_eth * Decimal(10**18))
+        amount_wei = int(amount_eth * WEI_PER_ETH)
 
-        gas_estimate = self.weth_contract.functions.deposit().estimate_gas(
+        gas_estimate = self.w3.eth.estimate_gas(
             {
                 "from": self.w3.to_checksum_address(from_address),
+                "to": self._weth_checksum_address,
                 "value": amount_wei,
+                "data": DEPOSIT_CALLDATA,
             }
         )
 
@@ -226,10 +323,14 @@ class WETHProtocol:
         Returns:
             Estimated gas units
         """
-        amount_wei = int(amount_eth * Decimal(10**18))
+        amount_wei = int(amount_eth * WEI_PER_ETH)
 
-        gas_estimate = self.weth_contract.functions.withdraw(amount_wei).estimate_gas(
-            {"from": self.w3.to_checksum_address(from_address)}
+        gas_estimate = self.w3.eth.estimate_gas(
+            {
+                "from": self.w3.to_checksum_address(from_address),
+                "to": self._weth_checksum_address,
+                "data": encode_withdraw_calldata(amount_wei),
+            }
         )
 
         logger.debug(
@@ -8,6 +8,7 @@ from typing import Any, Callable, Dict, Optional
 from decimal import Decimal
 from enum import Enum
 from datetime import datetime, timedelta
+from functools import cached_property
 import asyncio
 import uuid
 
@@ -36,6 +37,26 @@ class ApprovalRequest:
         expires_at: Request expiration time
     """
 
+    # Attributes rendered by display_message; assigning any of them drops
+    # the cached rendering
+    _DISPLAY_FIELDS = frozenset(
+        {
+            "request_id",
+            "transaction_type",
+            "amount_usd",
+            "from_protocol",
+            "to_protocol",
+            "rationale",
+            "gas_estimate_wei",
+            "gas_cost_usd",
+            "price_impact",
+            "slippage_bps",
+            "expected_output",
+            "min_output",
+            "expires_at",
+        }
+    )
+
     def __init__(
         self,
         request_id: str,
@@ -100,9 +121,35 @@ class ApprovalRequest:
         self.status = new_status
         self._status_changed.set()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the cached display message if it is shown.
+
+        Writes to non-display attributes (status, timestamps, the status
+        event) only pay for one frozenset membership check.
+
+        Args:
+            name: Attribute name
+            value: New value
+        """
+        if name in self._DISPLAY_FIELDS:
+            self.__dict__.pop("display_message", None)
+        super().__setattr__(name, value)
+
     def get_display_message(self) -> str:
         """Get formatted approval request message for display.
 
+        Returns:
+            Formatted approval message with all relevant details
+        """
+        return self.display_message
+
+    @cached_property
+    def display_message(self) -> str:
+        """Formatted approval message, rendered once and cached.
+
+        The cache is dropped whenever a displayed attribute is reassigned.
+        Status changes don't affect the rendering.
+
         Returns:
             Formatted approval message with all relevant details
         """
@@ -4,11 +4,21 @@ This module provides comprehensive audit logging for all critical
 operations, creating an immutable audit trail.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, TextIO, Union
 from datetime import datetime, UTC
 from enum import Enum
+import asyncio
 import json
 
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Buffered mode: a batch is written once it holds this many events, or once
+# its first event has waited AUDIT_FLUSH_INTERVAL_S, whichever comes first
+AUDIT_BATCH_SIZE = 64
+AUDIT_FLUSH_INTERVAL_S = 0.01
+
 
 class AuditEventType(Enum):
     """Types of auditable events."""
@@ -75,24 +85,41 @@ class AuditLogger:
     Logs all critical operations with full context for security
     monitoring, compliance, and debugging.
 
+    By default every event is appended to the log file before log_event
+    returns. With buffered=True, events are queued and a background task
+    writes them in batches; call close() before the event loop ends (or
+    before reading the file) so no queued event is lost.
+
+    log_file may also be an open text stream (e.g. io.StringIO in tests);
+    events are then written to it and nothing touches the filesystem.
+
     Attributes:
-        log_file: Path to audit log file
+        log_file: Path to audit log file, or a text stream
         database: Optional database for structured logging
+        buffered: Whether file writes are batched by a background task
     """
 
     def __init__(
         self,
-        log_file: str = "audit.log",
+        log_file: Union[str, TextIO] = "audit.log",
         database: Optional[Any] = None,
+        buffered: bool = False,
     ) -> None:
         """Initialize the audit logger.
 
         Args:
-            log_file: Path to audit log file
+            log_file: Path to audit log file, or a text stream to write to
             database: Optional database connection
+            buffered: Batch file writes in a background task (default: False)
         """
         self.log_file = log_file
         self.database = database
+        self.buffered = buffered
+
+        # Created on first buffered event, inside the running event loop
+        self._queue: Optional[asyncio.Queue[Optional[str]]] = None
+        self._writer_task: Optional[asyncio.Task[None]] = None
+        self._write_error: Optional[OSError] = None
 
     async def log_event(
         self,
@@ -121,7 +148,10 @@ class AuditLogger:
         }
 
         # Write to file
-        self._write_to_file(event)
+        if self.buffered:
+            self._enqueue(json.dumps(event) + "\n")
+        else:
+            self._write_to_file(event)
 
         # Write to database if available
         if self.database:
@@ -133,8 +163,89 @@ class AuditLogger:
         Args:
             event: Event data
         """
+        self._write_lines([json.dumps(event) + "\n"])
+
+    def _write_lines(self, lines: List[str]) -> None:
+        """Append serialized events to the log file in one write.
+
+        Args:
+            lines: Newline-terminated JSON events
+        """
+        if not isinstance(self.log_file, str):
+            self.log_file.write("".join(lines))
+            return
         with open(self.log_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+            f.write("".join(lines))
+
+    def _enqueue(self, line: str) -> None:
+        """Queue a serialized event for the background writer.
+
+        Args:
+            line: Newline-terminated JSON event
+        """
+        queue = self._queue
+        if queue is None:
+            queue = self._queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._drain_queue(queue))
+        queue.put_nowait(line)
+
+    async def _drain_queue(self, queue: asyncio.Queue[Optional[str]]) -> None:
+        """Write queued events in batches until close() sends None.
+
+        Args:
+            queue: Queue of serialized events, ended by None
+        """
+        loop = asyncio.get_running_loop()
+        closing = False
+
+        while not closing:
+            line = await queue.get()
+            if line is None:
+                return
+
+            lines = [line]
+            deadline = loop.time() + AUDIT_FLUSH_INTERVAL_S
+            while len(lines) < AUDIT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                try:
+                    if timeout > 0:
+                        line = await asyncio.wait_for(queue.get(), timeout)
+                    else:
+                        line = queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+                if line is None:
+                    closing = True
+                    break
+                lines.append(line)
+
+            try:
+                await asyncio.to_thread(self._write_lines, lines)
+            except OSError as e:
+                # Keep draining; close() re-raises the first failure
+                logger.error(f"Audit log write failed, {len(lines)} events lost: {e}")
+                self._write_error = self._write_error or e
+
+    async def close(self) -> None:
+        """Write any queued events and stop the background writer.
+
+        A no-op for unbuffered loggers. The logger can be used again after
+        close(); a new writer starts with the next buffered event.
+
+        Raises:
+            OSError: If a batched write failed since the writer started
+        """
+        # Detach first so events logged while closing start a new writer
+        queue, writer_task = self._queue, self._writer_task
+        if queue is None or writer_task is None:
+            return
+        self._queue = self._writer_task = None
+        queue.put_nowait(None)
+        await writer_task
+
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
 
     def _write_to_database(self, event: Dict[str, Any]) -> None:
         """Write audit event to database.
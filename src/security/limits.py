@@ -8,7 +8,7 @@ tier-aware limit enforcement.
 """
 
 from typing import Any, Callable, Dict, Optional
-from decimal import Decimal
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
 from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
@@ -25,6 +25,23 @@ except ImportError:
     WalletTier = None  # type: ignore
 
 
+_CENT = Decimal("0.01")
+
+
+def _to_cents(amount_usd: Decimal, rounding: str = ROUND_CEILING) -> int:
+    """Convert a USD Decimal to integer cents.
+
+    Amounts round up and limits round down (ROUND_FLOOR), so sub-cent
+    precision can never let a transaction slip under a limit.
+    """
+    return int(Decimal(amount_usd).quantize(_CENT, rounding=rounding) * 100)
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a USD Decimal."""
+    return Decimal(cents) / 100
+
+
 class LimitType(Enum):
     """Types of spending limits."""
 
@@ -92,7 +109,14 @@ class SpendingLimits:
         else:
             raise ValueError("Must provide either config or tier_config")
 
-        self.spending_history: list[tuple[datetime, Decimal]] = []
+        # Hot-path state is kept as integer cents: limits are converted once
+        # here and amounts once on entry, so checks are int add + compare.
+        # Decimal is only used at the API boundary.
+        self._max_transaction_cents = _to_cents(self.max_transaction_usd, ROUND_FLOOR)
+        self._daily_limit_cents = _to_cents(self.daily_limit_usd, ROUND_FLOOR)
+        self._weekly_limit_cents = _to_cents(self.weekly_limit_usd, ROUND_FLOOR)
+        self._monthly_limit_cents = _to_cents(self.monthly_limit_usd, ROUND_FLOOR)
+        self._history_cents: list[tuple[datetime, int]] = []
 
         # CRITICAL: Lock for preventing race conditions in concurrent transactions
         self._lock = asyncio.Lock()
@@ -100,6 +124,32 @@ class SpendingLimits:
         # Optional callback for auto-pause on limit breach
         self._auto_pause_callback = auto_pause_callback
 
+    @property
+    def spending_history(self) -> list[tuple[datetime, Decimal]]:
+        """Recorded transactions as (timestamp, amount_usd) pairs."""
+        return [(ts, _from_cents(cents)) for ts, cents in self._history_cents]
+
+    def _spent_since_cents(self, cutoff: datetime) -> int:
+        """Sum recorded spending (in cents) at or after cutoff."""
+        return sum(cents for ts, cents in self._history_cents if ts >= cutoff)
+
+    def _window_totals_cents(self) -> tuple[int, int, int]:
+        """Daily, weekly and monthly rolling totals in cents (single pass)."""
+        now = datetime.now()
+        yesterday = now - timedelta(days=1)
+        week_ago = now - timedelta(days=7)
+        month_ago = now - timedelta(days=30)
+
+        daily = weekly = monthly = 0
+        for ts, cents in self._history_cents:
+            if ts >= month_ago:
+                monthly += cents
+                if ts >= week_ago:
+                    weekly += cents
+                    if ts >= yesterday:
+                        daily += cents
+        return daily, weekly, monthly
+
     def check_transaction_limit(self, amount_usd: Decimal) -> bool:
         """Check if transaction is within single transaction limit.
 
@@ -109,7 +159,7 @@ class SpendingLimits:
         Returns:
             True if within limit, False otherwise
         """
-        return amount_usd <= self.max_transaction_usd
+        return _to_cents(amount_usd) <= self._max_transaction_cents
 
     def check_daily_limit(self, amount_usd: Decimal) -> bool:
         """Check if transaction would exceed daily limit.
@@ -120,17 +170,8 @@ class SpendingLimits:
         Returns:
             True if within limit, False otherwise
         """
-        # Calculate spending in last 24 hours
-        now = datetime.now()
-        yesterday = now - timedelta(days=1)
-
-        daily_spending = sum(
-            amount for timestamp, amount in self.spending_history
-            if timestamp >= yesterday
-        )
-
-        total_with_transaction = daily_spending + amount_usd
-        return total_with_transaction <= self.daily_limit_usd
+        daily_spent = self._spent_since_cents(datetime.now() - timedelta(days=1))
+        return daily_spent + _to_cents(amount_usd) <= self._daily_limit_cents
 
     def check_weekly_limit(self, amount_usd: Decimal) -> bool:
         """Check if transaction would exceed weekly limit.
@@ -143,16 +184,8 @@ class SpendingLimits:
         Returns:
             True if within limit, False otherwise
         """
-        now = datetime.now()
-        week_ago = now - timedelta(days=7)
-
-        weekly_spending = sum(
-            amount for timestamp, amount in self.spending_history
-            if timestamp >= week_ago
-        )
-
-        total_with_transaction = weekly_spending + amount_usd
-        return total_with_transaction <= self.weekly_limit_usd
+        weekly_spent = self._spent_since_cents(datetime.now() - timedelta(days=7))
+        return weekly_spent + _to_cents(amount_usd) <= self._weekly_limit_cents
 
     def check_monthly_limit(self, amount_usd: Decimal) -> bool:
         """Check if transaction would exceed monthly limit.
@@ -165,16 +198,8 @@ class SpendingLimits:
         Returns:
             True if within limit, False otherwise
         """
-        now = datetime.now()
-        month_ago = now - timedelta(days=30)
-
-        monthly_spending = sum(
-            amount for timestamp, amount in self.spending_history
-            if timestamp >= month_ago
-        )
-
-        total_with_transaction = monthly_spending + amount_usd
-        return total_with_transaction <= self.monthly_limit_usd
+        monthly_spent = self._spent_since_cents(datetime.now() - timedelta(days=30))
+        return monthly_spent + _to_cents(amount_usd) <= self._monthly_limit_cents
 
     def check_all_limits(self, amount_usd: Decimal) -> tuple[bool, str]:
         """Check all spending limits comprehensively.
@@ -190,49 +215,41 @@ class SpendingLimits:
             - (True, "") if all limits pass
             - (False, reason) if any limit exceeded
         """
-        now = datetime.now()
+        return self._check_all_limits_cents(amount_usd, _to_cents(amount_usd))
 
+    def _check_all_limits_cents(self, amount_usd: Decimal, amount_cents: int) -> tuple[bool, str]:
+        """check_all_limits on a pre-converted amount (amount_usd is for messages)."""
         # 1. Per-transaction limit
-        if not self.check_transaction_limit(amount_usd):
+        if amount_cents > self._max_transaction_cents:
             return (
                 False,
                 f"Exceeds per-transaction limit: ${amount_usd} > ${self.max_transaction_usd}"
             )
 
+        daily_spent, weekly_spent, monthly_spent = self._window_totals_cents()
+
         # 2. Daily limit (24-hour rolling window)
-        if not self.check_daily_limit(amount_usd):
-            yesterday = now - timedelta(days=1)
-            daily_spending = sum(
-                amount for timestamp, amount in self.spending_history
-                if timestamp >= yesterday
-            )
+        if daily_spent + amount_cents > self._daily_limit_cents:
             return (
                 False,
-                f"Exceeds daily limit: ${daily_spending} + ${amount_usd} > ${self.daily_limit_usd}"
+                f"Exceeds daily limit: ${_from_cents(daily_spent)} + ${amount_usd} "
+                f"> ${self.daily_limit_usd}"
             )
 
         # 3. Weekly limit (7-day rolling window)
-        if not self.check_weekly_limit(amount_usd):
-            week_ago = now - timedelta(days=7)
-            weekly_spending = sum(
-                amount for timestamp, amount in self.spending_history
-                if timestamp >= week_ago
-            )
+        if weekly_spent + amount_cents > self._weekly_limit_cents:
             return (
                 False,
-                f"Exceeds weekly limit: ${weekly_spending} + ${amount_usd} > ${self.weekly_limit_usd}"
+                f"Exceeds weekly limit: ${_from_cents(weekly_spent)} + ${amount_usd} "
+                f"> ${self.weekly_limit_usd}"
             )
 
         # 4. Monthly limit (30-day rolling window)
-        if not self.check_monthly_limit(amount_usd):
-            month_ago = now - timedelta(days=30)
-            monthly_spending = sum(
-                amount for timestamp, amount in self.spending_history
-                if timestamp >= month_ago
-            )
+        if monthly_spent + amount_cents > self._monthly_limit_cents:
             return (
                 False,
-                f"Exceeds monthly limit: ${monthly_spending} + ${amount_usd} > ${self.monthly_limit_usd}"
+                f"Exceeds monthly limit: ${_from_cents(monthly_spent)} + ${amount_usd} "
+                f"> ${self.monthly_limit_usd}"
             )
 
         return (True, "")
@@ -243,7 +260,7 @@ class SpendingLimits:
         Args:
             amount_usd: Transaction amount in USD
         """
-        self.spending_history.append((datetime.now(), amount_usd))
+        self._history_cents.append((datetime.now(), _to_cents(amount_usd)))
 
         # Clean old entries (older than monthly tracking period)
         self.cleanup_old_history()
@@ -260,44 +277,26 @@ class SpendingLimits:
             - monthly_spent, monthly_limit, monthly_remaining
             - max_transaction
         """
-        now = datetime.now()
-        yesterday = now - timedelta(days=1)
-        week_ago = now - timedelta(days=7)
-        month_ago = now - timedelta(days=30)
-
-        daily_spending = sum(
-            amount for timestamp, amount in self.spending_history
-            if timestamp >= yesterday
-        )
-
-        weekly_spending = sum(
-            amount for timestamp, amount in self.spending_history
-            if timestamp >= week_ago
-        )
-
-        monthly_spending = sum(
-            amount for timestamp, amount in self.spending_history
-            if timestamp >= month_ago
-        )
+        daily_spent, weekly_spent, monthly_spent = self._window_totals_cents()
 
         return {
             "max_transaction": self.max_transaction_usd,
-            "daily_spent": daily_spending,
+            "daily_spent": _from_cents(daily_spent),
             "daily_limit": self.daily_limit_usd,
-            "daily_remaining": max(Decimal("0"), self.daily_limit_usd - daily_spending),
-            "weekly_spent": weekly_spending,
+            "daily_remaining": _from_cents(max(0, self._daily_limit_cents - daily_spent)),
+            "weekly_spent": _from_cents(weekly_spent),
             "weekly_limit": self.weekly_limit_usd,
-            "weekly_remaining": max(Decimal("0"), self.weekly_limit_usd - weekly_spending),
-            "monthly_spent": monthly_spending,
+            "weekly_remaining": _from_cents(max(0, self._weekly_limit_cents - weekly_spent)),
+            "monthly_spent": _from_cents(monthly_spent),
             "monthly_limit": self.monthly_limit_usd,
-            "monthly_remaining": max(Decimal("0"), self.monthly_limit_usd - monthly_spending),
+            "monthly_remaining": _from_cents(max(0, self._monthly_limit_cents - monthly_spent)),
         }
 
     def cleanup_old_history(self) -> None:
         """Remove transaction history older than monthly period."""
         cutoff = datetime.now() - timedelta(days=30)
-        self.spending_history = [
-            (ts, amt) for ts, amt in self.spending_history if ts > cutoff
+        self._history_cents = [
+            (ts, cents) for ts, cents in self._history_cents if ts > cutoff
         ]
 
     async def atomic_check_and_record(self, amount_usd: Decimal) -> tuple[bool, str]:
@@ -331,9 +330,11 @@ class SpendingLimits:
             - (True, "") if transaction allowed and recorded
             - (False, reason) if transaction rejected
         """
+        amount_cents = _to_cents(amount_usd)
+
         async with self._lock:
             # Check ALL limits comprehensively (per-tx, daily, weekly, monthly)
-            is_allowed, reason = self.check_all_limits(amount_usd)
+            is_allowed, reason = self._check_all_limits_cents(amount_usd, amount_cents)
 
             if not is_allowed:
                 # Trigger auto-pause callback if configured (for hot wallet)
@@ -349,5 +350,6 @@ class SpendingLimits:
                 return (False, reason)
 
             # All checks passed - record transaction
-            self.record_transaction(amount_usd)
+            self._history_cents.append((datetime.now(), amount_cents))
+            self.cleanup_old_history()
             return (True, "")
@@ -9,6 +9,9 @@ from web3 import Web3
 from src.utils.web3_provider import get_web3
 from src.utils.contracts import ERC20_ABI, ContractHelper
 from src.utils.logger import get_logger
+from src.utils.multicall import aggregate3, decode_result
+from src.utils.networks import get_network
+from src.tokens import metadata_cache
 
 logger = get_logger(__name__)
 
@@ -27,6 +30,10 @@ class ERC20Token:
         symbol: Token symbol (cached after first query)
         decimals: Token decimals (cached after first query)
         name: Token name (cached after first query)
+
+    When the on-disk metadata_cache is enabled, metadata read from chain is
+    also persisted by chain ID and address, so later processes skip those
+    RPCs.
     """
 
     def __init__(self, network_id: str, token_address: str):
@@ -49,6 +56,8 @@ class ERC20Token:
         self._symbol: Optional[str] = None
         self._decimals: Optional[int] = None
         self._name: Optional[str] = None
+        self._disk_cache_checked = False
+        self._metadata_fallback = False  # A default stands in for an on-chain value
 
         logger.debug(f"Initialized ERC20Token for {token_address} on {network_id}")
 
@@ -60,13 +69,17 @@ class ERC20Token:
         Returns:
             Token symbol
         """
+        if self._symbol is None:
+            self._load_cached_metadata()
         if self._symbol is None:
             try:
                 self._symbol = self.contract.functions.symbol().call()
                 logger.debug(f"Token symbol: {self._symbol}")
+                self._save_cached_metadata()
             except Exception as e:
                 logger.warning(f"Failed to get symbol for {self.token_address}: {e}")
                 self._symbol = "UNKNOWN"
+                self._metadata_fallback = True
 
         return self._symbol
 
@@ -78,13 +91,17 @@ class ERC20Token:
         Returns:
             Number of decimals
         """
+        if self._decimals is None:
+            self._load_cached_metadata()
         if self._decimals is None:
             try:
                 self._decimals = self.contract.functions.decimals().call()
                 logger.debug(f"Token decimals: {self._decimals}")
+                self._save_cached_metadata()
             except Exception as e:
                 logger.warning(f"Failed to get decimals for {self.token_address}: {e}")
                 self._decimals = 18  # Default to 18
+                self._metadata_fallback = True
 
         return self._decimals
 
@@ -96,16 +113,85 @@ class ERC20Token:
         Returns:
             Token name
         """
+        if self._name is None:
+            self._load_cached_metadata()
         if self._name is None:
             try:
                 self._name = self.contract.functions.name().call()
                 logger.debug(f"Token name: {self._name}")
+                self._save_cached_metadata()
             except Exception as e:
                 logger.warning(f"Failed to get name for {self.token_address}: {e}")
                 self._name = "Unknown Token"
+                self._metadata_fallback = True
 
         return self._name
 
+    def _load_cached_metadata(self) -> None:
+        """Fill uncached metadata from the on-disk cache, once per instance."""
+        if self._disk_cache_checked:
+            return
+        self._disk_cache_checked = True
+
+        chain_id = get_network(self.network_id).chain_id
+        cached = metadata_cache.load_metadata(chain_id, self.token_address)
+        if cached:
+            self._symbol = self._symbol if self._symbol is not None else cached["symbol"]
+            self._decimals = self._decimals if self._decimals is not None else cached["decimals"]
+            self._name = self._name if self._name is not None else cached["name"]
+
+    def _save_cached_metadata(self) -> None:
+        """Persist metadata once all three fields are known from chain."""
+        if self._metadata_fallback or None in (self._symbol, self._decimals, self._name):
+            return
+        metadata_cache.save_metadata(
+            get_network(self.network_id).chain_id,
+            self.token_address,
+            {"symbol": self._symbol, "decimals": self._decimals, "name": self._name},
+        )
+
+    def get_metadata_batch(self) -> dict:
+        """Load symbol, decimals and name in a single Multicall3 eth_call.
+
+        Only fields not cached yet are requested. Results populate the same
+        caches get_symbol(), get_decimals() and get_name() use. A field the
+        batch could not read (or every field, if Multicall3 is unavailable)
+        falls back to its individual getter and that getter's default.
+
+        Returns:
+            Dict with symbol, decimals and name
+        """
+        self._load_cached_metadata()
+        missing = [
+            fn_name
+            for fn_name, cached in (
+                ("symbol", self._symbol),
+                ("decimals", self._decimals),
+                ("name", self._name),
+            )
+            if cached is None
+        ]
+
+        if missing:
+            try:
+                results = aggregate3(
+                    self.w3,
+                    [(self.token_address, self.contract.encode_abi(fn_name)) for fn_name in missing],
+                )
+                for fn_name, data in zip(missing, results):
+                    decoded = decode_result(self.contract, fn_name, data)
+                    if decoded is not None:
+                        setattr(self, f"_{fn_name}", decoded[0])
+                self._save_cached_metadata()
+            except Exception as e:
+                logger.debug(f"Multicall metadata read failed for {self.token_address}: {e}")
+
+        return {
+            "symbol": self.get_symbol(),
+            "decimals": self.get_decimals(),
+            "name": self.get_name(),
+        }
+
     def get_total_supply(self) -> int:
         """Get total token supply (in wei/smallest unit).
 
@@ -229,10 +315,11 @@ class ERC20Token:
         Returns:
             Dict with name, symbol, decimals, address, network
         """
+        metadata = self.get_metadata_batch()
         return {
-            "name": self.get_name(),
-            "symbol": self.get_symbol(),
-            "decimals": self.get_decimals(),
+            "name": metadata["name"],
+            "symbol": metadata["symbol"],
+            "decimals": metadata["decimals"],
             "address": self.token_address,
             "network": self.network_id,
         }
@@ -0,0 +1,123 @@
+"""Opt-in on-disk cache of ERC20 token metadata.
+
+A deployed token's decimals do not change and its symbol and name rarely
+do, yet every fresh process would otherwise re-read them over RPC. Entries
+are keyed by chain id and lower-cased address under
+METADATA_CACHE_VERSION; bumping the version makes old entries miss instead
+of being misread. Entries older than METADATA_TTL_SECONDS are re-read from
+chain, so a renamed (e.g. upgraded) token is picked up.
+
+The cache is disabled unless DEFAULT_CACHE_PATH is set or the
+TOKEN_METADATA_CACHE_PATH environment variable names a file. The file is
+read once per process and kept in memory.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+METADATA_CACHE_VERSION = 2
+METADATA_TTL_SECONDS = 7 * 24 * 3600
+CACHE_PATH_ENV = "TOKEN_METADATA_CACHE_PATH"
+DEFAULT_CACHE_PATH: Optional[Path] = None
+
+# Parsed cache files, by path
+_loaded: Dict[Path, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def _entry_key(chain_id: int, token_address: str) -> str:
+    return f"v{METADATA_CACHE_VERSION}:{chain_id}:{token_address.lower()}"
+
+
+def _resolve_path(cache_path: Optional[Path]) -> Optional[Path]:
+    """Pick the cache file: argument, then DEFAULT_CACHE_PATH, then the env var."""
+    if cache_path is not None:
+        return cache_path
+    if DEFAULT_CACHE_PATH is not None:
+        return DEFAULT_CACHE_PATH
+    env_path = os.getenv(CACHE_PATH_ENV)
+    return Path(env_path).expanduser() if env_path else None
+
+
+def _entries(cache_path: Path) -> Dict[str, Any]:
+    """Get the parsed cache file, reading it on first use. Caller holds _lock."""
+    if cache_path not in _loaded:
+        try:
+            _loaded[cache_path] = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            _loaded[cache_path] = {}
+    return _loaded[cache_path]
+
+
+def load_metadata(
+    chain_id: int, token_address: str, cache_path: Optional[Path] = None
+) -> Optional[Dict[str, Any]]:
+    """Look up cached metadata for a token.
+
+    Args:
+        chain_id: EVM chain ID
+        token_address: Token contract address
+        cache_path: Cache file (default: DEFAULT_CACHE_PATH, else
+            $TOKEN_METADATA_CACHE_PATH)
+
+    Returns:
+        Dict with symbol, decimals and name, or None on a miss, an expired
+        entry or a disabled cache
+    """
+    cache_path = _resolve_path(cache_path)
+    if cache_path is None:
+        return None
+
+    with _lock:
+        entry = _entries(cache_path).get(_entry_key(chain_id, token_address))
+    if entry is None or time.time() - entry.get("cached_at", 0) > METADATA_TTL_SECONDS:
+        return None
+    return {field: entry[field] for field in ("symbol", "decimals", "name")}
+
+
+def save_metadata(
+    chain_id: int,
+    token_address: str,
+    metadata: Dict[str, Any],
+    cache_path: Optional[Path] = None,
+) -> None:
+    """Store metadata for a token and write the cache file.
+
+    The file is replaced atomically through a uniquely named temporary
+    file, so concurrent processes never see (or clobber) a partial write.
+    Write failures are logged and otherwise ignored; the file is only a
+    cache.
+
+    Args:
+        chain_id: EVM chain ID
+        token_address: Token contract address
+        metadata: Dict with symbol, decimals and name
+        cache_path: Cache file (default: DEFAULT_CACHE_PATH, else
+            $TOKEN_METADATA_CACHE_PATH)
+    """
+    cache_path = _resolve_path(cache_path)
+    if cache_path is None:
+        return
+
+    with _lock:
+        entries = _entries(cache_path)
+        entries[_entry_key(chain_id, token_address)] = {**metadata, "cached_at": time.time()}
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as tmp_file:
+                json.dump(entries, tmp_file)
+            os.replace(tmp_file.name, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write token metadata cache {cache_path}: {e}")
@@ -5,11 +5,15 @@ variables with validation and security checks.
 """
 
 from decimal import Decimal
+from functools import cached_property
 from typing import Optional
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from src.utils.networks import validate_network, get_supported_networks
 
+# BIP39 mnemonic lengths
+VALID_MNEMONIC_LENGTHS = frozenset({12, 15, 18, 21, 24})
+
 
 class Settings(BaseSettings):
     """MAMMON configuration settings.
@@ -544,7 +548,7 @@ class Settings(BaseSettings):
 
         # Basic validation: should be 12-24 words
         word_count = len(v.strip().split())
-        if word_count not in (12, 15, 18, 21, 24):
+        if word_count not in VALID_MNEMONIC_LENGTHS:
             raise ValueError(
                 f"Invalid BIP39 seed phrase: found {word_count} words, "
                 f"expected 12, 15, 18, 21, or 24 words"
@@ -740,6 +744,11 @@ class Settings(BaseSettings):
 
         return v
 
+    @cached_property
+    def wallet_seed_word_count(self) -> int:
+        """Number of words in the wallet seed phrase (0 if unset)."""
+        return len(self.wallet_seed.split()) if self.wallet_seed else 0
+
     def is_production(self) -> bool:
         """Check if running in production environment.
 
@@ -3,8 +3,12 @@
 This module contains all contract addresses for protocols across different networks.
 """
 
+from decimal import Decimal
 from typing import Dict
 
+# Wei per ETH as a Decimal, built once at import for wei <-> ETH conversion
+WEI_PER_ETH = Decimal(10**18)
+
 # Uniswap V3 Contract Addresses
 UNISWAP_V3_ADDRESSES: Dict[str, Dict[str, str]] = {
     "base-sepolia": {
@@ -0,0 +1,128 @@
+"""Multicall3 helpers for batching contract reads into one eth_call.
+
+Multicall3 is deployed at the same address on every major EVM chain,
+including Base and Arbitrum. Aggregating N view calls through it makes the
+node run a single EVM execution instead of N separate eth_calls.
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+from eth_utils import get_abi_output_types
+from web3 import Web3
+from web3.contract import Contract
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Multicall3 ABI (aggregate3 only)
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+# (target address, ABI-encoded calldata)
+Call = Tuple[str, Union[str, bytes]]
+
+
+def aggregate3(
+    w3: Web3, calls: Sequence[Call], block_identifier: Union[str, int] = "latest"
+) -> List[Optional[bytes]]:
+    """Execute view calls in a single eth_call through Multicall3.
+
+    Every call is sent with allowFailure=True, so one reverting target does
+    not fail the batch.
+
+    Args:
+        w3: Web3 instance
+        calls: (target, calldata) pairs
+        block_identifier: Block to read at (default: "latest")
+
+    Returns:
+        Raw return data per call, in order, or None where the call reverted
+    """
+    if not calls:
+        return []
+
+    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+    call3 = [
+        (w3.to_checksum_address(target), True, calldata) for target, calldata in calls
+    ]
+    results = multicall.functions.aggregate3(call3).call(block_identifier=block_identifier)
+
+    logger.debug(f"Multicall3 aggregated {len(calls)} calls into one eth_call")
+    return [return_data if success else None for success, return_data in results]
+
+
+def _decode(
+    contract: Contract, fn_name: str, output_types: List[str], data: Optional[bytes]
+) -> Optional[tuple]:
+    if not data:
+        return None
+    try:
+        return contract.w3.codec.decode(output_types, data)
+    except Exception as e:
+        logger.debug(f"Could not decode {fn_name} result: {e}")
+        return None
+
+
+def decode_result(contract: Contract, fn_name: str, data: Optional[bytes]) -> Optional[tuple]:
+    """Decode one aggregate3 return value with the function's output ABI.
+
+    Args:
+        contract: Contract whose ABI declares fn_name
+        fn_name: Function that produced the data
+        data: Raw return data from aggregate3 (None if the call reverted)
+
+    Returns:
+        Decoded output tuple, or None if the call reverted or the data
+        does not decode
+    """
+    return decode_results(contract, fn_name, [data])[0]
+
+
+def decode_results(
+    contract: Contract, fn_name: str, datas: Sequence[Optional[bytes]]
+) -> List[Optional[tuple]]:
+    """Decode many aggregate3 return values of the same function.
+
+    The function's output types are resolved from the ABI once for the
+    whole batch rather than once per result.
+
+    Args:
+        contract: Contract whose ABI declares fn_name
+        fn_name: Function that produced the data
+        datas: Raw return data from aggregate3 (None where a call reverted)
+
+    Returns:
+        Decoded output tuple per entry, in order, or None where the call
+        reverted or the data does not decode
+    """
+    output_types = get_abi_output_types(contract.get_function_by_name(fn_name).abi)
+    return [_decode(contract, fn_name, output_types, data) for data in datas]
@@ -10,12 +10,12 @@ This module provides sophisticated RPC endpoint orchestration for MAMMON:
 
 import asyncio
 import random
-import re
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Any, Callable, Dict, List, Optional
 
 from src.utils.logger import get_logger
@@ -153,11 +153,12 @@ class RpcEndpoint:
                 f"{self.consecutive_failures} failures"
             )
 
-    def get_sanitized_url(self) -> str:
-        """Get URL with API key sanitized for logging.
+    @cached_property
+    def sanitized_url(self) -> str:
+        """URL with API key replaced by ***, for logging.
 
-        Returns:
-            URL with API key replaced by ***
+        Computed once per endpoint; url is not expected to change after
+        construction.
         """
         # Pattern: /v2/api_key or /api_key at end
         url = self.url
@@ -179,6 +180,14 @@ class RpcEndpoint:
 
         return url
 
+    def get_sanitized_url(self) -> str:
+        """Get URL with API key sanitized for logging.
+
+        Returns:
+            URL with API key replaced by ***
+        """
+        return self.sanitized_url
+
 
 class CircuitBreaker:
     """Circuit breaker to prevent hammering failed endpoints.
@@ -333,15 +342,27 @@ class RpcUsageTracker:
             endpoint: Endpoint that handled the request
             success: Whether request succeeded
         """
+        self.record_requests(endpoint, int(success), int(not success))
+
+    def record_requests(
+        self, endpoint: RpcEndpoint, success_count: int, failure_count: int = 0
+    ):
+        """Record a batch of requests to one endpoint for usage tracking.
+
+        Args:
+            endpoint: Endpoint that handled the requests
+            success_count: Number of requests that succeeded
+            failure_count: Number of requests that failed
+        """
         # Use enum value for consistent key naming
         priority_str = endpoint.priority.value if isinstance(endpoint.priority, EndpointPriority) else str(endpoint.priority)
         key = f"{endpoint.provider}_{priority_str}"
 
-        self.daily_usage[key] += 1
-        self.monthly_usage[key] += 1
+        self.daily_usage[key] += success_count + failure_count
+        self.monthly_usage[key] += success_count + failure_count
 
-        if not success:
-            self.daily_failures[key] += 1
+        if failure_count:
+            self.daily_failures[key] += failure_count
 
     def reset_daily_usage(self):
         """Reset daily usage counters."""
@@ -425,13 +446,21 @@ class RpcManager:
 
         # Gradual rollout settings
         self.premium_enabled = getattr(config, 'premium_rpc_enabled', False)
-        self.premium_percentage = getattr(config, 'premium_rpc_percentage', 10)
 
         logger.info(
             f"RpcManager initialized: premium_enabled={self.premium_enabled}, "
             f"rollout={self.premium_percentage}%"
         )
 
+    @property
+    def premium_percentage(self):
+        """Premium rollout percentage, read from config on every access.
+
+        Not cached, so a rollout change in config applies to the running
+        manager without rebuilding it.
+        """
+        return getattr(self.config, 'premium_rpc_percentage', 10)
+
     def add_endpoint(self, endpoint: RpcEndpoint):
         """Add an RPC endpoint to the manager.
 
@@ -456,7 +485,7 @@ class RpcManager:
 
         logger.info(
             f"Added {endpoint.priority} endpoint for {network_id}: "
-            f"{endpoint.get_sanitized_url()}"
+            f"{endpoint.sanitized_url}"
         )
 
     def get_healthy_endpoints(self, network_id: str) -> List[RpcEndpoint]:
@@ -497,8 +526,10 @@ class RpcManager:
         Returns:
             True if should try premium endpoint
         """
-        if not self.premium_enabled:
+        if not self.premium_enabled or self.premium_percentage <= 0:
             return False
+        if self.premium_percentage >= 100:
+            return True
 
         # Random selection based on rollout percentage
         return random.random() < (self.premium_percentage / 100.0)
@@ -9,7 +9,10 @@ Provides Web3 instances configured for different networks with:
 - Network-specific configuration
 """
 
-from typing import Dict, Optional
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.providers import HTTPProvider
 import time
@@ -37,6 +40,91 @@ _web3_instances: Dict[str, Web3] = {}
 # Global RPC manager instance
 _rpc_manager: Optional[RpcManager] = None
 
+# Shared keep-alive HTTP session for every HTTPProvider
+HTTP_POOL_CONNECTIONS = 50  # Distinct RPC hosts kept pooled
+HTTP_POOL_MAXSIZE = 50  # Keep-alive connections per host
+_http_session: Optional[requests.Session] = None
+
+# RPC results that never change for an endpoint, cached by the provider.
+# eth_chainId in particular is re-read by web3's validation middleware for
+# every transaction it estimates, calls or sends.
+_IMMUTABLE_RPC_METHODS = {"eth_chainId", "net_version"}
+
+
+def _get_http_session() -> requests.Session:
+    """Get the shared, connection-pooled HTTP session for RPC providers.
+
+    Every HTTPProvider reuses this session, so TCP/TLS connections to an RPC
+    host are set up once per process instead of once per provider. The pool
+    is sized above requests' default of 10 so concurrent RPCs issued from
+    worker threads (e.g. asyncio.to_thread fan-outs) don't queue on it.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            pool_block=False,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+def batch_rpc_reads(w3: Web3, *reads: Callable[[], Any]) -> List[Any]:
+    """Run independent web3 reads as one JSON-RPC batch.
+
+    Each read is a zero-argument callable such as
+    ``lambda: w3.eth.gas_price``; it is invoked inside the batch context to
+    queue the request, and again on its own if the provider rejects
+    batching, so callers get results either way.
+
+    Args:
+        w3: Web3 instance to query
+        *reads: Zero-argument callables performing one web3 read each
+
+    Returns:
+        Results in the order the reads were given
+    """
+    try:
+        with w3.batch_requests() as batch:
+            for read in reads:
+                batch.add(read())
+            results = list(batch.execute())
+        if len(results) != len(reads):
+            raise ValueError(f"Batch returned {len(results)} results for {len(reads)} reads")
+        return results
+    except Exception as e:
+        logger.debug(f"JSON-RPC batch unavailable, fetching individually: {e}")
+        return [read() for read in reads]
+
+
+def _create_http_provider(rpc_url: str) -> HTTPProvider:
+    """Create an HTTPProvider backed by the shared pooled session.
+
+    Chain metadata (eth_chainId, net_version) is cached by the provider so
+    it is fetched once per endpoint rather than per request.
+
+    Args:
+        rpc_url: RPC endpoint URL
+
+    Returns:
+        Configured HTTPProvider
+    """
+    return HTTPProvider(
+        rpc_url,
+        request_kwargs={"timeout": 60},  # 60 second timeout
+        session=_get_http_session(),
+        cache_allowed_requests=True,
+        cacheable_requests=_IMMUTABLE_RPC_METHODS,
+        request_cache_validation_threshold=None,  # No block-based entries to validate
+    )
+
 
 def _initialize_rpc_manager(config) -> RpcManager:
     """Initialize the global RPC manager with configured endpoints.
@@ -216,12 +304,7 @@ class Web3Provider:
 
         # Create new Web3 instance
         logger.info(f"Creating Web3 instance for {network_id} (direct connection)")
-        provider = HTTPProvider(
-            rpc_url,
-            request_kwargs={
-                "timeout": 60,  # 60 second timeout
-            },
-        )
+        provider = _create_http_provider(rpc_url)
 
         w3 = Web3(provider)
 
@@ -306,10 +389,7 @@ class Web3Provider:
                     f"({endpoint.priority})"
                 )
 
-                provider = HTTPProvider(
-                    endpoint.url,
-                    request_kwargs={"timeout": 60},
-                )
+                provider = _create_http_provider(endpoint.url)
 
                 w3 = Web3(provider)
 
@@ -361,6 +441,7 @@ class Web3Provider:
             True if connection is successful, False otherwise
         """
         import signal
+        import threading
         from contextlib import contextmanager
 
         @contextmanager
@@ -369,6 +450,13 @@ class Web3Provider:
             def timeout_handler(signum, frame):
                 raise TimeoutError(f"RPC call timed out after {seconds}s")
 
+            # Signal handlers can only be installed from the main thread; in
+            # worker threads (e.g. check_network_health_many) the HTTP
+            # provider's request timeout bounds the calls instead
+            if threading.current_thread() is not threading.main_thread():
+                yield
+                return
+
             # Set up signal handler (Unix only)
             old_handler = signal.signal(signal.SIGALRM, timeout_handler)
             signal.alarm(seconds)
@@ -426,10 +514,12 @@ class Web3Provider:
             w3 = Web3Provider.get_web3(network_id, custom_rpc_url)
             network = get_network(network_id)
 
-            # Get network stats
-            block_number = w3.eth.block_number
+            # Get network stats: chain ID is cached by the provider, the two
+            # live reads share one JSON-RPC batch
             chain_id = w3.eth.chain_id
-            gas_price = w3.eth.gas_price
+            block_number, gas_price = batch_rpc_reads(
+                w3, lambda: w3.eth.block_number, lambda: w3.eth.gas_price
+            )
 
             return {
                 "network_id": network_id,
@@ -533,3 +623,22 @@ def check_network_health(network_id: str) -> Dict:
         Dict with health status
     """
     return Web3Provider.check_connection_health(network_id)
+
+
+async def check_network_health_many(network_ids: Sequence[str]) -> List[Dict]:
+    """Check several networks' health concurrently.
+
+    Each probe runs check_network_health in a worker thread, so total wall
+    time is the slowest network's round trips rather than their sum.
+
+    Args:
+        network_ids: Network identifiers
+
+    Returns:
+        Health status dicts, in the order the networks were given
+    """
+    return list(
+        await asyncio.gather(
+            *(asyncio.to_thread(check_network_health, network_id) for network_id in network_ids)
+        )
+    )
@@ -65,8 +65,18 @@ class YieldSnapshotScheduler:
         """
         async with self.database.get_session() as session:
             repo = YieldHistoryRepository(session)
-            count = 0
 
+            try:
+                count = repo.record_snapshot_bulk(pools)
+                logger.info(f"Recorded {count}/{len(pools)} yield snapshots")
+                return count
+            except Exception as e:
+                # Fall back to per-pool inserts so one bad pool doesn't
+                # drop the whole batch
+                logger.warning(f"Bulk snapshot insert failed, retrying per pool: {e}")
+                session.rollback()
+
+            count = 0
             for pool in pools:
                 try:
                     repo.record_snapshot(pool)
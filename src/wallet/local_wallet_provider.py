@@ -6,17 +6,37 @@ MetaMask and hardware wallets.
 """
 
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from web3 import Web3
 from web3.types import TxParams, Wei, HexBytes
 from eth_account import Account
 from eth_account.hdaccount import ETHEREUM_DEFAULT_PATH
+from eth_account.signers.local import LocalAccount
 from src.wallet.base_provider import WalletProvider
 from src.wallet.nonce_tracker import NonceTracker
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Node error fragments meaning the nonce was already used by another sender
+_STALE_NONCE_ERRORS = (
+    "nonce too low",
+    "replacement transaction underpriced",
+)
+
+
+def _is_stale_nonce_error(error: Exception) -> bool:
+    """Check whether a send failed because the nonce is already taken.
+
+    Args:
+        error: Exception raised by send_raw_transaction
+
+    Returns:
+        True if the node rejected the transaction's nonce as used
+    """
+    message = str(error).lower()
+    return any(fragment in message for fragment in _STALE_NONCE_ERRORS)
+
 
 class LocalWalletProvider(WalletProvider):
     """Local wallet provider using BIP-39 seed phrase.
@@ -46,33 +66,39 @@ class LocalWalletProvider(WalletProvider):
 
     def __init__(
         self,
-        seed_phrase: str,
+        seed_phrase: Optional[str],
         web3: Web3,
         config: Dict[str, Any],
+        account: Optional[LocalAccount] = None,
     ):
         """Initialize local wallet from seed phrase.
 
         Args:
-            seed_phrase: BIP-39 mnemonic (12 or 24 words)
+            seed_phrase: BIP-39 mnemonic (12 or 24 words); ignored when
+                account is given
             web3: Web3 instance connected to network
             config: Configuration dict with gas limits
+            account: Already-derived account to sign with instead of
+                deriving one from seed_phrase (see from_account)
 
         Raises:
             ValueError: If seed phrase is invalid
         """
-        # Enable HD wallet features
-        Account.enable_unaudited_hdwallet_features()
+        if account is None:
+            # Enable HD wallet features
+            Account.enable_unaudited_hdwallet_features()
 
-        # Derive account from seed phrase
-        try:
-            self.account = Account.from_mnemonic(
-                seed_phrase,
-                account_path=ETHEREUM_DEFAULT_PATH
-            )
-        except Exception as e:
-            logger.error(f"Failed to derive account from seed phrase: {e}")
-            raise ValueError(f"Invalid seed phrase: {e}")
+            # Derive account from seed phrase
+            try:
+                account = Account.from_mnemonic(
+                    seed_phrase,
+                    account_path=ETHEREUM_DEFAULT_PATH
+                )
+            except Exception as e:
+                logger.error(f"Failed to derive account from seed phrase: {e}")
+                raise ValueError(f"Invalid seed phrase: {e}")
 
+        self.account = account
         self.web3 = web3
         self.address = self.account.address
         self.config = config
@@ -80,9 +106,38 @@ class LocalWalletProvider(WalletProvider):
         # Initialize thread-safe nonce tracker
         self.nonce_tracker = NonceTracker(web3, self.address)
 
+        # Fee caps in wei, fixed for the wallet's lifetime
+        self._max_fee_wei = int(config.get("max_gas_price_gwei", 100) * 10**9)
+        self._max_priority_wei = int(config.get("max_priority_fee_gwei", 2) * 10**9)
+
+        # Chain ID, looked up on the first transaction build
+        self._chain_id: Optional[int] = None
+
         logger.info(f"✅ LocalWalletProvider initialized: {self.address}")
         logger.debug(f"   Derivation path: {ETHEREUM_DEFAULT_PATH}")
 
+    @classmethod
+    def from_account(
+        cls,
+        account: LocalAccount,
+        web3: Web3,
+        config: Dict[str, Any],
+    ) -> "LocalWalletProvider":
+        """Create a wallet around an existing account.
+
+        Skips BIP-39 seed stretching and BIP-32 derivation entirely, so many
+        wallets can share one account derived up front.
+
+        Args:
+            account: Account used for signing
+            web3: Web3 instance connected to network
+            config: Configuration dict with gas limits
+
+        Returns:
+            LocalWalletProvider signing with the given account
+        """
+        return cls(None, web3, config, account=account)
+
     def get_address(self) -> str:
         """Get wallet address.
 
@@ -150,7 +205,8 @@ class LocalWalletProvider(WalletProvider):
         2. Adds nonce if not present
         3. Estimates gas with safety buffer
         4. Signs transaction locally
-        5. Sends to network
+        5. Sends to network, re-syncing the nonce and retrying once if the
+           node rejects it as stale (another sender used it)
         6. Resets nonce on failure
 
         Args:
@@ -164,6 +220,9 @@ class LocalWalletProvider(WalletProvider):
             ConnectionError: If unable to send transaction
         """
         try:
+            # Only nonces we allocated ourselves are safe to replace on retry
+            auto_nonce = 'nonce' not in transaction
+
             # Build complete transaction with nonce and gas
             tx = self._build_transaction(transaction)
 
@@ -172,17 +231,8 @@ class LocalWalletProvider(WalletProvider):
 
             # CRITICAL SECURITY: Simulate transaction before sending
             # This catches transactions that would revert on-chain
-            logger.debug("🧪 Simulating transaction...")
-            try:
-                self.web3.eth.call(tx, block_identifier='pending')
-                logger.debug("✅ Simulation passed")
-            except Exception as sim_error:
-                logger.error(f"❌ Transaction simulation failed: {sim_error}")
-                self.nonce_tracker.reset()  # Don't waste nonce on failed simulation
-                raise ValueError(
-                    f"Transaction would fail on-chain: {sim_error}. "
-                    f"Transaction aborted before sending."
-                )
+            # (a failure resets the nonce below, so it is not wasted)
+            self.simulate(tx)
 
             # Sign transaction
             signed = self.account.sign_transaction(tx)
@@ -193,7 +243,17 @@ class LocalWalletProvider(WalletProvider):
             logger.debug(f"   Max fee: {tx['maxFeePerGas'] / 1e9:.2f} gwei")
 
             # Send signed transaction
-            tx_hash = self.web3.eth.send_raw_transaction(signed.raw_transaction)
+            try:
+                tx_hash = self.web3.eth.send_raw_transaction(signed.raw_transaction)
+            except Exception as send_error:
+                if not (auto_nonce and _is_stale_nonce_error(send_error)):
+                    raise
+                # The chain moved past our in-memory counter; re-seed and retry once
+                logger.warning(f"Nonce {tx['nonce']} rejected ({send_error}), re-syncing with chain")
+                self.nonce_tracker.reset()
+                tx['nonce'] = self.nonce_tracker.get_next_nonce()
+                signed = self.account.sign_transaction(tx)
+                tx_hash = self.web3.eth.send_raw_transaction(signed.raw_transaction)
 
             logger.info(f"✅ Transaction sent: {tx_hash.hex()}")
             return tx_hash
@@ -204,6 +264,29 @@ class LocalWalletProvider(WalletProvider):
             self.nonce_tracker.reset()
             raise
 
+    def simulate(self, transaction: TxParams) -> None:
+        """Dry-run a transaction with eth_call against the pending block.
+
+        Needs no nonce or gas fields, so it costs one RPC. send_transaction
+        runs it on every transaction before signing.
+
+        Args:
+            transaction: Transaction parameters ("from" defaults to this wallet)
+
+        Raises:
+            ValueError: If the transaction would fail on-chain
+        """
+        logger.debug("🧪 Simulating transaction...")
+        try:
+            self.web3.eth.call({"from": self.address, **transaction}, block_identifier='pending')
+        except Exception as sim_error:
+            logger.error(f"❌ Transaction simulation failed: {sim_error}")
+            raise ValueError(
+                f"Transaction would fail on-chain: {sim_error}. "
+                f"Transaction aborted before sending."
+            )
+        logger.debug("✅ Simulation passed")
+
     def _build_transaction(self, tx: TxParams) -> TxParams:
         """Build complete transaction with nonce and gas parameters.
 
@@ -213,14 +296,30 @@ class LocalWalletProvider(WalletProvider):
         Returns:
             Complete transaction ready to sign
         """
+        # Add chain ID (fetched once per wallet)
+        if 'chainId' not in tx:
+            if self._chain_id is None:
+                self._chain_id = self.web3.eth.chain_id
+            tx['chainId'] = self._chain_id
+
+        # Fetch gas estimate, fee data and (until synced) the nonce in one round-trip
+        if 'nonce' not in tx and 'gas' not in tx:
+            build_inputs = self._fetch_build_inputs(
+                tx, include_nonce=self.nonce_tracker.needs_sync
+            )
+            if build_inputs is not None:
+                chain_nonce, estimated_gas, base_fee, max_priority = build_inputs
+                if chain_nonce is None:
+                    tx['nonce'] = self.get_nonce()
+                else:
+                    tx['nonce'] = self.nonce_tracker.allocate_nonce(chain_nonce)
+                tx.update(self._gas_params(estimated_gas, base_fee, max_priority))
+                return tx
+
         # Add nonce if not present
         if 'nonce' not in tx:
             tx['nonce'] = self.get_nonce()
 
-        # Add chain ID
-        if 'chainId' not in tx:
-            tx['chainId'] = self.web3.eth.chain_id
-
         # Estimate gas if not provided
         if 'gas' not in tx:
             gas_params = self._estimate_gas_with_buffer(tx)
@@ -228,6 +327,56 @@ class LocalWalletProvider(WalletProvider):
 
         return tx
 
+    def _fetch_build_inputs(
+        self, tx: TxParams, include_nonce: bool = True
+    ) -> Optional[Tuple[Optional[int], int, int, int]]:
+        """Read gas estimate, base fee, priority fee and nonce in one batch.
+
+        The reads go out as a single JSON-RPC batch POST. Returns None
+        if the provider rejects batching or any call in the batch fails
+        (e.g. the estimate reverts), so the caller falls back to the serial
+        path and its per-call defaults.
+
+        Args:
+            tx: Transaction to estimate gas for
+            include_nonce: Also read the pending transaction count; skipped
+                once the nonce tracker is synced
+
+        Returns:
+            Tuple of (chain_nonce, estimated_gas, base_fee, max_priority),
+            with chain_nonce None when not requested, or None to fall back
+            to individual requests
+        """
+        try:
+            with self.web3.batch_requests() as batch:
+                # chainId is left out: web3's chain ID validation middleware
+                # cannot resolve eth_chainId from inside a batch
+                batch.add(
+                    self.web3.eth.estimate_gas(
+                        {key: value for key, value in tx.items() if key != 'chainId'}
+                    )
+                )
+                batch.add(self.web3.eth.get_block('latest'))
+                batch.add(self.web3.eth.max_priority_fee)
+                if include_nonce:
+                    batch.add(
+                        self.web3.eth.get_transaction_count(
+                            self.address, block_identifier='pending'
+                        )
+                    )
+                results = batch.execute()
+            estimated_gas, latest_block, max_priority = results[:3]
+            chain_nonce = results[3] if include_nonce else None
+            return (
+                chain_nonce,
+                estimated_gas,
+                latest_block.get('baseFeePerGas', 0),
+                max_priority,
+            )
+        except Exception as e:
+            logger.debug(f"Batched transaction build unavailable, using serial RPCs: {e}")
+            return None
+
     def _estimate_gas_with_buffer(self, tx: TxParams) -> Dict[str, int]:
         """Estimate gas with tiered safety buffers and caps.
 
@@ -249,6 +398,30 @@ class LocalWalletProvider(WalletProvider):
             logger.warning(f"Gas estimation failed: {e}, using default")
             estimated_gas = 21000  # Default for simple transfer
 
+        # Get EIP-1559 fee parameters
+        latest_block = self.web3.eth.get_block('latest')
+        base_fee = latest_block.get('baseFeePerGas', 0)
+
+        try:
+            max_priority = self.web3.eth.max_priority_fee
+        except Exception:
+            max_priority = self.web3.to_wei(2, 'gwei')  # Default 2 gwei
+
+        return self._gas_params(estimated_gas, base_fee, max_priority)
+
+    def _gas_params(
+        self, estimated_gas: int, base_fee: int, max_priority: int
+    ) -> Dict[str, int]:
+        """Apply the tiered gas buffer and fee caps to fetched chain data.
+
+        Args:
+            estimated_gas: Node gas estimate
+            base_fee: Latest block base fee in wei
+            max_priority: Suggested priority fee in wei
+
+        Returns:
+            Dict with gas, maxFeePerGas, maxPriorityFeePerGas
+        """
         # Apply tiered buffer
         if estimated_gas < 50_000:
             buffer = self.config.get("gas_buffer_simple", 1.5)
@@ -259,31 +432,12 @@ class LocalWalletProvider(WalletProvider):
 
         gas_limit = int(estimated_gas * buffer)
 
-        # Get EIP-1559 fee parameters
-        latest_block = self.web3.eth.get_block('latest')
-        base_fee = latest_block.get('baseFeePerGas', 0)
-
-        try:
-            max_priority = self.web3.eth.max_priority_fee
-        except Exception:
-            max_priority = self.web3.to_wei(2, 'gwei')  # Default 2 gwei
-
         # Calculate max fee (base fee * 2 + priority for next block)
         max_fee = (base_fee * 2) + max_priority
 
         # Apply caps from config
-        max_gas_price = self.config.get(
-            "max_gas_price_gwei",
-            100
-        ) * 10**9  # Convert gwei to wei
-
-        max_priority_cap = self.config.get(
-            "max_priority_fee_gwei",
-            2
-        ) * 10**9
-
-        max_fee = min(max_fee, max_gas_price)
-        max_priority = min(max_priority, max_priority_cap)
+        max_fee = min(max_fee, self._max_fee_wei)
+        max_priority = min(max_priority, self._max_priority_wei)
 
         logger.debug(
             f"Gas estimation: limit={gas_limit}, "
@@ -1,7 +1,8 @@
 """Thread-safe nonce management for wallet transactions.
 
 Prevents nonce collisions in concurrent transaction scenarios by managing
-pending nonces in-memory with chain synchronization.
+pending nonces in-memory with chain synchronization. The chain is queried
+once to seed the counter and again only after a reset.
 """
 
 import threading
@@ -16,7 +17,9 @@ class NonceTracker:
     """Thread-safe nonce tracker with chain synchronization.
 
     Manages transaction nonces to prevent collisions in concurrent operations.
-    Syncs with on-chain state to handle restarts and failed transactions.
+    Seeds from the pending transaction count on first use, then hands out
+    nonces from an in-memory counter. Call reset() after a failed or
+    rejected transaction to re-sync with on-chain state.
 
     Attributes:
         _web3: Web3 instance for chain queries
@@ -44,10 +47,12 @@ class NonceTracker:
 
         This method:
         1. Acquires lock for thread safety
-        2. Queries chain for latest confirmed nonce
-        3. Returns max(pending_nonce, chain_nonce)
+        2. Queries chain for the pending nonce if not yet synced
+        3. Returns the pending counter
         4. Increments pending counter
 
+        Once synced, no RPC is made until reset() is called.
+
         Returns:
             Next nonce to use for transaction
 
@@ -56,26 +61,46 @@ class NonceTracker:
             tx = {'nonce': nonce, ...}
         """
         with self._lock:
-            # Get latest confirmed nonce from chain
-            chain_nonce = self._web3.eth.get_transaction_count(
-                self._address,
-                block_identifier='pending'  # Include pending transactions
-            )
-
-            # Initialize or sync with chain if needed
-            if self._pending_nonce is None or self._pending_nonce < chain_nonce:
-                logger.debug(
-                    f"Syncing nonce: pending={self._pending_nonce}, "
-                    f"chain={chain_nonce}"
+            if self._pending_nonce is None:
+                # Seed from chain, including pending transactions
+                chain_nonce = self._web3.eth.get_transaction_count(
+                    self._address,
+                    block_identifier='pending'
                 )
-                self._pending_nonce = chain_nonce
+                return self._allocate(chain_nonce)
+            return self._allocate(self._pending_nonce)
 
-            # Get current nonce and increment for next call
-            current_nonce = self._pending_nonce
-            self._pending_nonce += 1
+    def allocate_nonce(self, chain_nonce: int) -> int:
+        """Allocate the next nonce given an already-fetched chain nonce.
 
-            logger.debug(f"Allocated nonce {current_nonce} to transaction")
-            return current_nonce
+        Same bookkeeping as get_next_nonce(), for callers that read the
+        pending transaction count themselves (e.g. inside a JSON-RPC batch).
+
+        Args:
+            chain_nonce: Pending transaction count reported by the node
+
+        Returns:
+            Next nonce to use for transaction
+        """
+        with self._lock:
+            return self._allocate(chain_nonce)
+
+    def _allocate(self, chain_nonce: int) -> int:
+        """Sync with the chain nonce and hand out the next one (lock held)."""
+        # Initialize or sync with chain if needed
+        if self._pending_nonce is None or self._pending_nonce < chain_nonce:
+            logger.debug(
+                f"Syncing nonce: pending={self._pending_nonce}, "
+                f"chain={chain_nonce}"
+            )
+            self._pending_nonce = chain_nonce
+
+        # Get current nonce and increment for next call
+        current_nonce = self._pending_nonce
+        self._pending_nonce += 1
+
+        logger.debug(f"Allocated nonce {current_nonce} to transaction")
+        return current_nonce
 
     def reset(self) -> None:
         """Reset nonce tracking to sync with chain state.
@@ -106,6 +131,16 @@ class NonceTracker:
             block_identifier='pending'
         )
 
+    @property
+    def needs_sync(self) -> bool:
+        """Whether the next allocation must read the nonce from chain.
+
+        Returns:
+            True if the tracker is uninitialized or was reset
+        """
+        with self._lock:
+            return self._pending_nonce is None
+
     @property
     def pending_nonce(self) -> Optional[int]:
         """Get the current pending nonce value (thread-safe read).
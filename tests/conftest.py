@@ -1,8 +1,55 @@
 """Pytest configuration and fixtures for MAMMON tests."""
 
+import asyncio
 import pytest
 from decimal import Decimal
-from typing import Dict, Any
+from typing import Dict, Any, List
+from unittest.mock import patch
+from web3 import Web3
+from src.utils import web3_provider
+from src.utils.networks import NETWORKS, get_network
+from src.utils.web3_provider import get_web3, _get_http_session
+from tests.fake_chain import FakeChainProvider
+
+
+try:
+    import uvloop
+except ImportError:  # Optional: not a project dependency
+    uvloop = None
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --uvloop opt-in for running async tests on uvloop."""
+    parser.addoption(
+        "--uvloop",
+        action="store_true",
+        help="run async tests on uvloop (they are skipped if uvloop is not installed)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """Skip async tests when --uvloop is given but uvloop is missing.
+
+    Otherwise they would silently run on the default loop.
+    """
+    if not config.getoption("--uvloop") or uvloop is not None:
+        return
+    skip = pytest.mark.skip(reason="--uvloop given but uvloop is not installed")
+    for item in items:
+        if item.get_closest_marker("asyncio"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy(request: pytest.FixtureRequest) -> asyncio.AbstractEventLoopPolicy:
+    """Event loop policy pytest-asyncio runs async tests under.
+
+    Returns:
+        uvloop's event loop policy with --uvloop, else asyncio's default
+    """
+    if request.config.getoption("--uvloop") and uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 @pytest.fixture
@@ -51,3 +98,66 @@ def sample_yield_opportunity() -> Dict[str, Any]:
         "tvl": Decimal("1000000"),
         "token": "USDC",
     }
+
+
+class _Web3Pool(dict):
+    """Network id -> Web3 mapping that connects on first access."""
+
+    def __missing__(self, network_id: str) -> Web3:
+        self[network_id] = w3 = get_web3(network_id)
+        return w3
+
+
+@pytest.fixture(scope="session")
+def w3_pool() -> Dict[str, Web3]:
+    """Provide Web3 instances shared by every test in the session.
+
+    Each network is connected the first time a test asks for it, so an
+    unreachable network only affects the tests that use it.
+
+    Returns:
+        Mapping of network id to connected Web3 instance
+    """
+    return _Web3Pool()
+
+
+@pytest.fixture(scope="session")
+def mainnet_available() -> bool:
+    """Probe Base mainnet RPC once per session.
+
+    Sends a single eth_chainId with a 2 second timeout, so live-data tests
+    can skip up front instead of each waiting out get_web3's connection
+    retries when the RPC is unreachable.
+
+    Returns:
+        True if the public Base mainnet RPC answered with the right chain ID
+    """
+    network = get_network("base-mainnet")
+    try:
+        response = _get_http_session().post(
+            network.rpc_url,
+            json={"jsonrpc": "2.0", "id": 1, "method": "eth_chainId", "params": []},
+            timeout=2,
+        )
+        return int(response.json()["result"], 16) == network.chain_id
+    except Exception:
+        return False
+
+
+@pytest.fixture
+def offline_networks(monkeypatch):
+    """Make get_web3 build Web3 instances over in-process fake chains.
+
+    Only the HTTP transport is replaced: Web3Provider's caching, connection
+    check and clear_cache run unmodified, against an emptied instance cache
+    that is restored afterwards. For tests of Python-level provider behavior
+    that need no live chain.
+    """
+    chain_ids = {network.rpc_url: network.chain_id for network in NETWORKS.values()}
+    monkeypatch.setattr(
+        web3_provider,
+        "_create_http_provider",
+        lambda rpc_url: FakeChainProvider(chain_id=chain_ids[rpc_url]),
+    )
+    with patch.dict(web3_provider._web3_instances, clear=True):
+        yield
@@ -0,0 +1,186 @@
+"""Configurable in-process JSON-RPC chain shared by unit and integration tests.
+
+FakeChainProvider answers the RPCs the wallet, gas estimator, token and
+protocol code issue, so tests of Python-level behavior (batching, caching,
+fallbacks) run without a live endpoint. Contract reads are served by
+handlers registered per (address, function signature), both for direct
+eth_calls and for calls aggregated through Multicall3.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from eth_abi import decode, encode
+from web3 import Web3
+from web3.providers.base import JSONBaseProvider
+
+from src.utils.multicall import MULTICALL3_ADDRESS
+
+# Return data, or a function from the call's ABI-encoded arguments to it
+CallHandler = Union[bytes, Callable[[bytes], bytes]]
+
+
+def selector(signature: str) -> bytes:
+    """Four-byte function selector of a signature such as "symbol()"."""
+    return Web3.keccak(text=signature)[:4]
+
+
+class _Revert(Exception):
+    """A contract call the fake chain cannot serve."""
+
+
+class FakeChainProvider(JSONBaseProvider):
+    """Deterministic in-process chain.
+
+    eth_estimateGas follows intrinsic gas rules (21000 base plus 4 gas per
+    zero and 16 gas per non-zero calldata byte), so estimates scale with
+    calldata the way a real node's do for calls to an EOA. eth_call to an
+    address without registered handlers returns empty data, like a call to
+    an EOA; an unregistered function on a contract reverts.
+
+    Attributes:
+        chain_id: Chain ID reported by eth_chainId
+        block_number: Number of the latest block
+        base_fee_wei: baseFeePerGas of the latest block
+        priority_fee_wei: Result of eth_maxPriorityFeePerGas
+        nonce: Result of eth_getTransactionCount
+        balance_wei: Result of eth_getBalance
+        supports_batch: If False, batched requests raise NotImplementedError
+        multicall_fails: If True, every call to Multicall3 reverts
+        calls: Count of single (non-batched) requests per RPC method
+        batches: RPC methods of each batched request, in order
+    """
+
+    def __init__(
+        self,
+        chain_id: int = 84532,
+        block_number: int = 1,
+        base_fee_wei: int = 1_000_000,
+        priority_fee_wei: int = 1_000_000,
+        nonce: int = 0,
+        balance_wei: int = 10**18,
+        supports_batch: bool = True,
+    ) -> None:
+        super().__init__()
+        self.chain_id = chain_id
+        self.block_number = block_number
+        self.base_fee_wei = base_fee_wei
+        self.priority_fee_wei = priority_fee_wei
+        self.nonce = nonce
+        self.balance_wei = balance_wei
+        self.supports_batch = supports_batch
+        self.multicall_fails = False
+        self.calls: Dict[str, int] = {}
+        self.batches: List[List[str]] = []
+        self._contracts: Dict[Tuple[str, bytes], CallHandler] = {}
+        self._errors: Dict[str, List[str]] = {}
+
+    def add_call(self, address: str, signature: str, handler: CallHandler) -> None:
+        """Serve a contract function.
+
+        Args:
+            address: Contract address
+            signature: Function signature, e.g. "getFee(address,bool)"
+            handler: ABI-encoded return data, or a function from the
+                ABI-encoded arguments to it
+        """
+        self._contracts[(address.lower(), selector(signature))] = handler
+
+    def remove_call(self, address: str, signature: str) -> None:
+        """Stop serving a contract function, so calls to it revert."""
+        del self._contracts[(address.lower(), selector(signature))]
+
+    def fail_next(self, method: str, message: str) -> None:
+        """Answer the next request for method with a JSON-RPC error."""
+        self._errors.setdefault(method, []).append(message)
+
+    @staticmethod
+    def intrinsic_gas(tx: Dict[str, Any]) -> int:
+        """Intrinsic gas of a transaction's calldata, as eth_estimateGas reports it."""
+        data = bytes.fromhex(tx.get("data", tx.get("input", "0x"))[2:])
+        zero_bytes = data.count(0)
+        return 21000 + 4 * zero_bytes + 16 * (len(data) - zero_bytes)
+
+    def _execute(self, target: str, data: bytes) -> bytes:
+        target = target.lower()
+        handler = self._contracts.get((target, data[:4]))
+        if handler is None:
+            if any(address == target for address, _ in self._contracts):
+                raise _Revert(f"no handler for {data[:4].hex()} on {target}")
+            return b""
+        return handler(data[4:]) if callable(handler) else handler
+
+    def _aggregate3(self, data: bytes) -> bytes:
+        if self.multicall_fails:
+            raise _Revert("Multicall3 unavailable")
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        results = []
+        for target, _, call_data in calls:
+            try:
+                results.append((True, self._execute(target, call_data)))
+            except _Revert:
+                results.append((False, b""))
+        return encode(["(bool,bytes)[]"], [results])
+
+    def _eth_call(self, tx: Dict[str, Any]) -> str:
+        data = bytes.fromhex(tx.get("data", tx.get("input", "0x"))[2:])
+        if tx["to"].lower() == MULTICALL3_ADDRESS.lower():
+            return "0x" + self._aggregate3(data).hex()
+        return "0x" + self._execute(tx["to"], data).hex()
+
+    def _result(self, method: str, params: Any) -> Any:
+        if method == "eth_chainId":
+            return hex(self.chain_id)
+        if method == "eth_blockNumber":
+            return hex(self.block_number)
+        if method == "eth_getBlockByNumber":
+            return {
+                "number": hex(self.block_number),
+                "timestamp": hex(1_700_000_000),
+                "gasLimit": hex(30_000_000),
+                "gasUsed": hex(0),
+                "baseFeePerGas": hex(self.base_fee_wei),
+                "transactions": [],
+            }
+        if method == "eth_gasPrice":
+            return hex(self.base_fee_wei + self.priority_fee_wei)
+        if method == "eth_maxPriorityFeePerGas":
+            return hex(self.priority_fee_wei)
+        if method == "eth_estimateGas":
+            return hex(self.intrinsic_gas(params[0]))
+        if method == "eth_call":
+            return self._eth_call(params[0])
+        if method == "eth_getTransactionCount":
+            return hex(self.nonce)
+        if method == "eth_getBalance":
+            return hex(self.balance_wei)
+        if method == "eth_sendRawTransaction":
+            return "0x" + "ab" * 32
+        if method == "web3_clientVersion":
+            return "fake-chain"
+        raise ValueError(f"unsupported RPC method {method}")
+
+    def _response(self, request_id: int, method: str, params: Any) -> Dict[str, Any]:
+        if self._errors.get(method):
+            error = {"code": -32000, "message": self._errors[method].pop(0)}
+            return {"jsonrpc": "2.0", "id": request_id, "error": error}
+        try:
+            result = self._result(method, params)
+        except _Revert:
+            error = {"code": 3, "message": "execution reverted"}
+            return {"jsonrpc": "2.0", "id": request_id, "error": error}
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def make_request(self, method: str, params: Any) -> Dict[str, Any]:
+        self.calls[method] = self.calls.get(method, 0) + 1
+        return self._response(1, method, params)
+
+    def make_batch_request(self, requests: List[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+        if not self.supports_batch:
+            raise NotImplementedError("batching not supported")
+        self.batches.append([method for method, _ in requests])
+        return [
+            self._response(i, method, params) for i, (method, params) in enumerate(requests)
+        ]
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
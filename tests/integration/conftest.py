@@ -0,0 +1,27 @@
+"""Shared fixtures for integration tests.
+
+Provides an estimator over the in-process chain (tests.fake_chain) so tests
+that only exercise estimator logic (buffer tiers, fallback, caching) run
+without a live Base Sepolia endpoint.
+"""
+
+import pytest
+from web3 import Web3
+
+from src.blockchain.gas_estimator import GasEstimator
+from src.data.oracles import MockPriceOracle
+from tests.fake_chain import FakeChainProvider
+
+
+@pytest.fixture
+def fake_chain() -> FakeChainProvider:
+    """In-process chain provider with Base Sepolia defaults."""
+    return FakeChainProvider()
+
+
+@pytest.fixture
+def offline_estimator(fake_chain: FakeChainProvider) -> GasEstimator:
+    """GasEstimator wired to the in-process chain instead of a live RPC."""
+    return GasEstimator(
+        network="base-sepolia", price_oracle=MockPriceOracle(), web3=Web3(fake_chain)
+    )
@@ -0,0 +1,81 @@
+"""Helpers for integration tests that hit live RPC endpoints."""
+
+import asyncio
+import functools
+import inspect
+import random
+import re
+import time
+from typing import Any, Callable
+
+import pytest
+
+
+# Live-RPC retry policy: exponential backoff with jitter, then skip
+RPC_RETRY_ATTEMPTS = 4
+RPC_RETRY_INITIAL_WAIT_S = 0.5
+RPC_RETRY_MAX_WAIT_S = 8.0
+_RPC_THROTTLE_PATTERN = re.compile(
+    r"\b429\b|too many requests|rate.?limit|timed? ?out", re.IGNORECASE
+)
+
+
+def _is_rpc_throttle(error: Exception) -> bool:
+    """Whether an error looks like a transient rate limit or timeout."""
+    return not isinstance(error, AssertionError) and bool(
+        _RPC_THROTTLE_PATTERN.search(str(error))
+    )
+
+
+def _backoff_seconds(attempt: int) -> float:
+    """Wait before retry number attempt + 1 (0-based attempt)."""
+    wait = min(RPC_RETRY_MAX_WAIT_S, RPC_RETRY_INITIAL_WAIT_S * 2 ** attempt)
+    return wait + random.uniform(0, RPC_RETRY_INITIAL_WAIT_S)
+
+
+def retry_on_rpc_throttle(func: Callable) -> Callable:
+    """Retry a live-RPC test (or coroutine) when the endpoint throttles it.
+
+    Errors mentioning HTTP 429, rate limits or timeouts are retried up to
+    RPC_RETRY_ATTEMPTS times with exponential backoff; if the endpoint is
+    still throttling, the test is skipped rather than failed, so a
+    transient limit does not force a CI re-run against the same RPC.
+    Other errors and failed assertions propagate immediately.
+
+    Args:
+        func: Sync or async callable to wrap
+
+    Returns:
+        Wrapped callable with the same signature
+    """
+    def skip(error: Exception) -> None:
+        pytest.skip(f"RPC still throttled after {RPC_RETRY_ATTEMPTS} attempts: {error}")
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(RPC_RETRY_ATTEMPTS):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if not _is_rpc_throttle(e):
+                        raise
+                    if attempt == RPC_RETRY_ATTEMPTS - 1:
+                        skip(e)
+                await asyncio.sleep(_backoff_seconds(attempt))
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        for attempt in range(RPC_RETRY_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not _is_rpc_throttle(e):
+                    raise
+                if attempt == RPC_RETRY_ATTEMPTS - 1:
+                    skip(e)
+            time.sleep(_backoff_seconds(attempt))
+
+    return wrapper
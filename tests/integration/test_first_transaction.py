@@ -20,6 +20,19 @@ from src.security.approval import ApprovalManager
 from src.data.oracles import create_price_oracle
 
 
+def _auto_approve_callback(request):
+    """Automatically approve all requests for testing."""
+    return True
+
+
+# Shared auto-approve manager for TestSecurityHardening (instant response,
+# very high threshold). Pending requests are cleared after each test.
+_SHARED_APPROVAL_MGR = ApprovalManager(
+    approval_threshold_usd=Decimal("999999"),
+    approval_callback=_auto_approve_callback,
+)
+
+
 class TestFirstTransaction:
     """Test suite for first transaction execution on testnet."""
 
@@ -369,29 +382,24 @@ class TestSecurityHardening:
     5. Tiered gas estimation buffers
     """
 
+    @pytest.fixture(autouse=True)
+    def reset_shared_approval_manager(self):
+        """Drop any pending requests left on the shared approval manager."""
+        yield
+        _SHARED_APPROVAL_MGR.pending_requests.clear()
+
     @pytest.fixture
     async def wallet_manager(self):
         """Create wallet manager for security testing with auto-approve callback.
 
-        Uses event-driven approval manager with auto-approve callback
-        to prevent test timeouts while still testing approval integration.
+        Uses the shared event-driven approval manager with auto-approve
+        callback to prevent test timeouts while still testing approval
+        integration.
         """
         from src.utils.config import get_settings
-        from src.security.approval import ApprovalManager
 
         settings = get_settings()
 
-        # Auto-approve callback for tests (instant response)
-        def auto_approve_callback(request):
-            """Automatically approve all requests for testing."""
-            return True
-
-        # Create approval manager with high threshold + auto-approve
-        approval_mgr = ApprovalManager(
-            approval_threshold_usd=Decimal("999999"),  # Very high threshold
-            approval_callback=auto_approve_callback     # Auto-approve if needed
-        )
-
         config = {
             "cdp_api_key": settings.cdp_api_key,
             "cdp_api_secret": settings.cdp_api_secret,
@@ -409,7 +417,7 @@ class TestSecurityHardening:
         wallet = WalletManager(
             config=config,
             price_oracle=oracle,
-            approval_manager=approval_mgr,  # Use auto-approve manager
+            approval_manager=_SHARED_APPROVAL_MGR,  # Use auto-approve manager
         )
 
         return wallet
@@ -10,7 +10,7 @@ Tests cover the 5 required scenarios:
 
 import asyncio
 from decimal import Decimal
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock
 
 import pytest
 from web3 import Web3
@@ -20,27 +20,54 @@ from src.data.oracles import MockPriceOracle, create_price_oracle
 from src.security.approval import ApprovalManager
 
 
+# Valid EOA address for estimates against the in-process chain
+TEST_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
+
+
+@pytest.fixture(scope="module")
+def shared_estimator():
+    """One GasEstimator (and Web3 provider) shared by every test in the module."""
+    oracle = MockPriceOracle()
+    return GasEstimator(network="base-sepolia", price_oracle=oracle)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_estimator(request):
+    """Clear caches and restore default settings around each test.
+
+    Tests tweak the shared estimator by attribute mutation
+    (e.g. ``max_gas_price_gwei`` or oracle prices) instead of constructing
+    a new one.
+    """
+    if "shared_estimator" not in request.fixturenames:
+        yield
+        return
+
+    estimator = request.getfixturevalue("shared_estimator")
+    estimator.clear_cache()
+    yield
+    estimator.clear_cache()
+    estimator.cache_ttl = 300
+    estimator.max_gas_price_gwei = None
+    estimator.estimate_mode = GasEstimateMode.DIRECT
+    estimator.price_oracle = MockPriceOracle()  # Drop prices set via set_price()
+
+
 class TestGasEstimationAccuracy:
     """Test 1: Estimate succeeds, actual gas within 10%."""
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_simple_transfer_accuracy(self):
+    async def test_simple_transfer_accuracy(self, offline_estimator):
         """Test gas estimation for simple ETH transfer."""
-        # Create gas estimator
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-            estimate_mode=GasEstimateMode.DIRECT,
-        )
+        estimator = offline_estimator
+        estimator.estimate_mode = GasEstimateMode.DIRECT
 
         # Estimate gas for simple transfer
-        test_address = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb"
         value_wei = estimator.w3.to_wei(0.01, "ether")
 
         gas_estimate = await estimator.estimate_gas(
-            to=test_address,
+            to=TEST_ADDRESS,
             value=value_wei,
             data="0x",
         )
@@ -51,52 +78,44 @@ class TestGasEstimationAccuracy:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_buffer_tiers(self):
-        """Test that different transaction types get appropriate buffers."""
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
+    @pytest.mark.parametrize(
+        ("value", "data", "expected_ratio"),
+        [
+            # Simple transfer: 20% buffer
+            (10**16, "0x", 1.20),
+            # ERC20 transfer calldata (138 hex chars): 50% buffer
+            (0, "0xa9059cbb" + "0" * 128, 1.50),
+            # Medium data (DEX swap-like, 402 hex chars): 50% buffer
+            (0, "0x" + "0" * 400, 1.50),
+            # Complex data (1002 hex chars): 100% buffer
+            (0, "0x" + "0" * 1000, 2.00),
+        ],
+        ids=["simple_transfer", "erc20", "dex_swap", "complex"],
+    )
+    async def test_buffer_tier(
+        self, offline_estimator, fake_chain, value, data, expected_ratio
+    ):
+        """Test that each transaction type gets its tier buffer."""
+        gas_estimate = await offline_estimator.estimate_gas(
+            to=TEST_ADDRESS,
+            value=value,
+            data=data,
         )
 
-        test_address = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb"
+        # Node estimate (intrinsic gas for an EOA call) times the tier buffer
+        expected = int(fake_chain.intrinsic_gas({"data": data}) * expected_ratio)
+        assert gas_estimate == expected
 
-        # Simple transfer: 20% buffer
-        gas_simple = await estimator.estimate_gas(
-            to=test_address,
-            value=estimator.w3.to_wei(0.01, "ether"),
-            data="0x",
-        )
 
-        # Small data (ERC20-like): 30% buffer
-        gas_erc20 = await estimator.estimate_gas(
-            to=test_address,
-            data="0xa9059cbb" + "0" * 128,  # 68 bytes
-        )
+@pytest.fixture
+def failing_estimator(offline_estimator, monkeypatch):
+    """Offline estimator whose eth_estimateGas always raises."""
 
-        # Medium data (DEX swap-like): 50% buffer
-        gas_swap = await estimator.estimate_gas(
-            to=test_address,
-            data="0x" + "0" * 400,  # 202 bytes
-        )
+    def _fail(*args, **kwargs):
+        raise Exception("RPC error")
 
-        # Complex data: 100% buffer
-        gas_complex = await estimator.estimate_gas(
-            to=test_address,
-            data="0x" + "0" * 1000,  # 502 bytes
-        )
-
-        # Verify all estimates are positive (buffers applied)
-        assert gas_simple > 0
-        assert gas_erc20 > 0
-        assert gas_swap > 0
-        assert gas_complex > 0
-
-        # Verify simple transfer has minimum 20% buffer (21000 base * 1.2)
-        assert gas_simple >= 21000 * 1.2
-
-        # Verify complex is higher than simple (due to larger buffer)
-        assert gas_complex > gas_simple
+    monkeypatch.setattr(offline_estimator.w3.eth, "estimate_gas", _fail)
+    yield offline_estimator
 
 
 class TestGasEstimationFallback:
@@ -104,72 +123,56 @@ class TestGasEstimationFallback:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_estimation_failure_fallback(self):
+    async def test_estimation_failure_fallback(self, failing_estimator):
         """Test fallback when gas estimation fails."""
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-        )
+        estimator = failing_estimator
 
-        # Try to estimate for invalid address (should fail gracefully)
-        with patch.object(estimator.w3.eth, "estimate_gas", side_effect=Exception("RPC error")):
-            gas_estimate = await estimator.estimate_gas(
-                to="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb",
-                value=estimator.w3.to_wei(0.01, "ether"),
-            )
+        # Estimation fails, should fall back gracefully
+        gas_estimate = await estimator.estimate_gas(
+            to=TEST_ADDRESS,
+            value=estimator.w3.to_wei(0.01, "ether"),
+        )
 
-            # Should return default (21000 * 1.2 = 25,200)
-            assert gas_estimate == 25200
+        # Should return default (21000 * 1.2 = 25,200)
+        assert gas_estimate == 25200
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_fallback_conservative_defaults(self):
+    async def test_fallback_conservative_defaults(self, failing_estimator):
         """Test that fallback defaults are appropriately conservative."""
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
+        estimator = failing_estimator
+
+        # Simple transfer fallback
+        gas_simple = await estimator.estimate_gas(
+            to=TEST_ADDRESS,
+            value=100,
+        )
+        assert gas_simple == 25200  # 21000 * 1.2
+
+        # Contract call fallback
+        gas_contract = await estimator.estimate_gas(
+            to=TEST_ADDRESS,
+            data="0xa9059cbb" + "0" * 64,
         )
+        assert gas_contract == 120000  # 100000 * 1.2
 
-        # Mock eth_estimateGas to fail
-        with patch.object(estimator.w3.eth, "estimate_gas", side_effect=Exception("Failed")):
-            # Simple transfer fallback
-            gas_simple = await estimator.estimate_gas(
-                to="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb",
-                value=100,
-            )
-            assert gas_simple == 25200  # 21000 * 1.2
-
-            # Contract call fallback
-            gas_contract = await estimator.estimate_gas(
-                to="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb",
-                data="0xa9059cbb" + "0" * 64,
-            )
-            assert gas_contract == 120000  # 100000 * 1.2
-
-            # Complex operation fallback
-            gas_complex = await estimator.estimate_gas(
-                to="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb",
-                data="0x" + "0" * 500,
-            )
-            assert gas_complex == 600000  # 500000 * 1.2
+        # Complex operation fallback
+        gas_complex = await estimator.estimate_gas(
+            to=TEST_ADDRESS,
+            data="0x" + "0" * 500,
+        )
+        assert gas_complex == 600000  # 500000 * 1.2
 
 
 class TestGasPriceCap:
     """Test 3: Gas price exceeds cap → rejection."""
 
     @pytest.mark.asyncio
-    async def test_gas_price_cap_logic(self):
+    async def test_gas_price_cap_logic(self, shared_estimator):
         """Test gas price cap validation logic."""
-        oracle = MockPriceOracle()
-
-        # Create estimator with 50 gwei cap
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-            max_gas_price_gwei=50,
-        )
+        # Apply a 50 gwei cap to the shared estimator
+        estimator = shared_estimator
+        estimator.max_gas_price_gwei = 50
 
         # Test that validation logic works correctly
         high_gas_price = estimator.w3.to_wei(100, "gwei")
@@ -182,16 +185,11 @@ class TestGasPriceCap:
         assert estimator.max_gas_price_gwei == 50
 
     @pytest.mark.asyncio
-    async def test_gas_price_no_cap(self):
+    async def test_gas_price_no_cap(self, shared_estimator):
         """Test gas price fetching without cap."""
-        oracle = MockPriceOracle()
-
-        # Create estimator with no cap
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-            max_gas_price_gwei=None,
-        )
+        # Shared estimator has no cap by default
+        estimator = shared_estimator
+        assert estimator.max_gas_price_gwei is None
 
         # Should not raise error
         gas_price = await estimator.get_gas_price()
@@ -253,13 +251,9 @@ class TestNetworkSpecificBuffers:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_base_network_buffers(self):
+    async def test_base_network_buffers(self, shared_estimator):
         """Test buffer application on Base Sepolia."""
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-        )
+        estimator = shared_estimator
 
         test_address = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb"
 
@@ -273,28 +267,17 @@ class TestNetworkSpecificBuffers:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_eip1559_detection(self):
+    async def test_eip1559_detection(self, shared_estimator):
         """Test EIP-1559 support detection."""
-        oracle = MockPriceOracle()
-
         # Base should support EIP-1559
-        estimator_base = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-        )
-        assert estimator_base.supports_eip1559 is True
+        assert shared_estimator.supports_eip1559 is True
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_gas_cost_calculation(self):
+    async def test_gas_cost_calculation(self, shared_estimator):
         """Test complete gas cost calculation in USD."""
-        oracle = MockPriceOracle()
-        oracle.set_price("ETH", Decimal("3000.00"))
-
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-        )
+        estimator = shared_estimator
+        estimator.price_oracle.set_price("ETH", Decimal("3000.00"))
 
         # Calculate cost for 100,000 gas using real gas price
         gas_cost_usd = await estimator.calculate_gas_cost(100000, in_usd=True)
@@ -321,14 +304,10 @@ class TestGasEstimationCaching:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_gas_price_caching(self):
+    async def test_gas_price_caching(self, offline_estimator):
         """Test that gas prices are cached."""
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-            cache_ttl_seconds=300,
-        )
+        estimator = offline_estimator
+        estimator.cache_ttl = 300
 
         # First call should fetch and cache
         gas_price_1 = await estimator.get_gas_price()
@@ -342,13 +321,9 @@ class TestGasEstimationCaching:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_cache_clearing(self):
+    async def test_cache_clearing(self, offline_estimator):
         """Test cache clearing functionality."""
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-        )
+        estimator = offline_estimator
 
         # Populate cache
         await estimator.get_gas_price()
@@ -366,38 +341,32 @@ class TestSimulationMode:
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_simulation_mode_success(self):
+    async def test_simulation_mode_success(self, offline_estimator, fake_chain):
         """Test simulation mode with successful eth_call."""
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-            estimate_mode=GasEstimateMode.SIMULATION,
-        )
+        estimator = offline_estimator
+        estimator.estimate_mode = GasEstimateMode.SIMULATION
 
         # Should succeed with simulation
         gas_estimate = await estimator.estimate_gas(
-            to="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb",
+            to=TEST_ADDRESS,
             value=100,
         )
 
         assert gas_estimate > 0
+        assert fake_chain.calls["eth_call"] == 1
 
     @pytest.mark.integration
     @pytest.mark.asyncio
-    async def test_direct_mode(self):
+    async def test_direct_mode(self, offline_estimator, fake_chain):
         """Test direct estimation mode (no simulation)."""
-        oracle = MockPriceOracle()
-        estimator = GasEstimator(
-            network="base-sepolia",
-            price_oracle=oracle,
-            estimate_mode=GasEstimateMode.DIRECT,
-        )
+        estimator = offline_estimator
+        estimator.estimate_mode = GasEstimateMode.DIRECT
 
         # Should work without simulation
         gas_estimate = await estimator.estimate_gas(
-            to="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb",
+            to=TEST_ADDRESS,
             value=100,
         )
 
-        assert gas_estimate > 0
\ No newline at end of file
+        assert gas_estimate > 0
+        assert "eth_call" not in fake_chain.calls
\ No newline at end of file
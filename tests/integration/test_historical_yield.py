@@ -12,12 +12,12 @@ from src.data.models import Pool
 
 
 @pytest.fixture
-async def test_database():
+def test_database():
     """Create a test database instance."""
-    db = Database(":memory:")  # Use in-memory database for tests
-    await db.initialize()
+    db = Database(":memory:")  # Shared single-connection in-memory database
+    db.create_all_tables()
     yield db
-    # Cleanup happens automatically with in-memory DB
+    db.engine.dispose()
 
 
 @pytest.fixture
@@ -128,9 +128,32 @@ async def test_repository_record_snapshot(test_database, sample_pools):
         repo = YieldHistoryRepository(session)
 
         # Record a snapshot
-        repo.record_snapshot(sample_pools[0])
+        snapshot = repo.record_snapshot(sample_pools[0])
 
-        # Should not raise an error
+        # The inserted row is returned with generated columns populated
+        assert snapshot.id is not None
+        assert snapshot.created_at is not None
+        assert snapshot.pool_id == "morpho-usdc-market-1"
+        assert repo.get_by_id(snapshot.id) is snapshot
+
+
+@pytest.mark.asyncio
+async def test_repository_record_snapshot_bulk(test_database, sample_pools):
+    """Test bulk snapshot insert writes one row per pool with a shared timestamp."""
+    from sqlalchemy import select
+    from src.data.database import YieldHistory
+
+    async with test_database.get_session() as session:
+        repo = YieldHistoryRepository(session)
+
+        assert repo.record_snapshot_bulk(sample_pools) == len(sample_pools)
+        assert repo.record_snapshot_bulk([]) == 0
+
+        rows = session.execute(select(YieldHistory)).scalars().all()
+
+    assert sorted(row.pool_id for row in rows) == sorted(p.pool_id for p in sample_pools)
+    assert len({row.snapshot_timestamp for row in rows}) == 1
+    assert all(row.tokens.startswith("[") for row in rows)
 
 
 @pytest.mark.asyncio
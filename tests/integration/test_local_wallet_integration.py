@@ -7,22 +7,38 @@ Tests the complete local wallet implementation including:
 - Transaction building (without sending)
 """
 
+import re
+
 import pytest
 from decimal import Decimal
+from eth_account import Account
 from eth_account.hdaccount import ETHEREUM_DEFAULT_PATH
+from src.data.oracles import MockPriceOracle
 from src.wallet.local_wallet_provider import LocalWalletProvider
 from src.utils.web3_provider import get_web3
 
+TEST_SEED = "wine hero found plate sing hope field join pilot betray eyebrow note"
+TEST_ADDRESS = "0x81A2933C185e45f72755B35110174D57b5E1FC88"  # m/44'/60'/0'/0/0
+
+# Derived once at import for tests that don't exercise seed handling
+Account.enable_unaudited_hdwallet_features()
+TEST_PRIVKEY = Account.from_mnemonic(TEST_SEED, account_path=ETHEREUM_DEFAULT_PATH).key.hex()
+
+# Expected error messages, matched case-insensitively without lowercasing
+# (web3 errors can carry long revert payloads)
+_INSUFFICIENT = re.compile(r"insufficient|fail|balance", re.I)
+_LIMIT_EXCEEDED = re.compile(r"exceed|limit", re.I)
+
 
 class TestLocalWalletIntegration:
     """Integration tests for local wallet provider."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_seed(self):
         """Test seed phrase (standard test mnemonic)."""
-        return "wine hero found plate sing hope field join pilot betray eyebrow note"
+        return TEST_SEED
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_config(self):
         """Test configuration."""
         return {
@@ -33,57 +49,47 @@ class TestLocalWalletIntegration:
             "gas_buffer_complex": 1.2,
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def web3_instance(self):
         """Web3 instance for Base Sepolia."""
         return get_web3("base-sepolia")
 
-    def test_wallet_initialization(self, test_seed, web3_instance, test_config):
-        """Test wallet initializes correctly from seed phrase."""
-        wallet = LocalWalletProvider(
-            seed_phrase=test_seed,
-            web3=web3_instance,
-            config=test_config,
-        )
+    @pytest.fixture(scope="class")
+    def derived_account(self):
+        """Account for TEST_SEED, from the key derived once at import."""
+        return Account.from_key(TEST_PRIVKEY)
 
-        # Verify wallet initialized
-        assert wallet.address is not None
-        assert wallet.address.startswith("0x")
-        assert len(wallet.address) == 42
+    @pytest.fixture(scope="class")
+    def wallet(self, derived_account, web3_instance, test_config):
+        """Wallet shared by the tests that only inspect it."""
+        return LocalWalletProvider.from_account(derived_account, web3_instance, test_config)
 
-        # Expected address for this seed
-        expected = "0x81A2933C185e45f72755B35110174D57b5E1FC88"
-        assert wallet.address == expected
+    def test_wallet_initialization(self, wallet):
+        """Test wallet initializes correctly from seed phrase."""
+        # Expected (checksummed) address for this seed
+        assert wallet.address == TEST_ADDRESS
 
     def test_wallet_persistence(self, test_seed, web3_instance, test_config):
         """Test same seed produces same address (persistence)."""
-        wallet1 = LocalWalletProvider(test_seed, web3_instance, test_config)
-        wallet2 = LocalWalletProvider(test_seed, web3_instance, test_config)
+        # Derivation is deterministic, so one derivation against the known
+        # address suffices
+        wallet = LocalWalletProvider(test_seed, web3_instance, test_config)
 
-        # Same seed = same address
-        assert wallet1.address == wallet2.address
+        assert wallet.address == TEST_ADDRESS
 
-    def test_get_address(self, test_seed, web3_instance, test_config):
+    def test_get_address(self, wallet):
         """Test get_address method."""
-        wallet = LocalWalletProvider(test_seed, web3_instance, test_config)
-
-        address = wallet.get_address()
-        assert address == wallet.address
-        assert address.startswith("0x")
+        assert wallet.get_address() == TEST_ADDRESS
 
-    def test_get_balance(self, test_seed, web3_instance, test_config):
+    def test_get_balance(self, wallet):
         """Test balance checking."""
-        wallet = LocalWalletProvider(test_seed, web3_instance, test_config)
-
         # Get balance (may be zero on testnet)
         balance = wallet.get_balance("eth")
         assert isinstance(balance, Decimal)
         assert balance >= 0
 
-    def test_nonce_management(self, test_seed, web3_instance, test_config):
+    def test_nonce_management(self, wallet):
         """Test nonce tracker works."""
-        wallet = LocalWalletProvider(test_seed, web3_instance, test_config)
-
         # Get first nonce
         nonce1 = wallet.get_nonce()
         assert isinstance(nonce1, int)
@@ -98,9 +104,9 @@ class TestLocalWalletIntegration:
         nonce3 = wallet.get_nonce()
         assert isinstance(nonce3, int)
 
-    def test_transaction_building(self, test_seed, web3_instance, test_config):
+    def test_transaction_building(self, derived_account, web3_instance, test_config):
         """Test transaction building without sending."""
-        wallet = LocalWalletProvider(test_seed, web3_instance, test_config)
+        wallet = LocalWalletProvider.from_account(derived_account, web3_instance, test_config)
 
         # Build simple transfer transaction
         tx = {
@@ -120,9 +126,9 @@ class TestLocalWalletIntegration:
         assert complete_tx['to'] == tx['to']
         assert complete_tx['value'] == tx['value']
 
-    def test_gas_estimation(self, test_seed, web3_instance, test_config):
+    def test_gas_estimation(self, derived_account, web3_instance, test_config):
         """Test gas estimation with buffers."""
-        wallet = LocalWalletProvider(test_seed, web3_instance, test_config)
+        wallet = LocalWalletProvider.from_account(derived_account, web3_instance, test_config)
 
         # Simple transfer
         tx = {
@@ -150,32 +156,27 @@ class TestLocalWalletIntegration:
                 config=test_config,
             )
 
-    def test_unsupported_token(self, test_seed, web3_instance, test_config):
+    def test_unsupported_token(self, derived_account, web3_instance, test_config):
         """Test get_balance fails for unsupported tokens."""
-        wallet = LocalWalletProvider(test_seed, web3_instance, test_config)
+        wallet = LocalWalletProvider.from_account(derived_account, web3_instance, test_config)
 
         with pytest.raises(NotImplementedError):
             wallet.get_balance("USDC")
 
 
-    def test_simulation_catches_failing_transaction(self, test_seed, web3_instance, test_config):
+    def test_simulation_catches_failing_transaction(self, wallet, web3_instance):
         """Test transaction simulation prevents bad transactions."""
-        wallet = LocalWalletProvider(test_seed, web3_instance, test_config)
-
-        # Build transaction with insufficient balance (will fail simulation)
-        # Send way more ETH than the wallet has
+        # Send way more ETH than the wallet has (will fail simulation).
+        # send_transaction runs the same simulate() before signing; calling
+        # it directly skips the nonce and gas lookups.
         tx = {
             'to': '0x0000000000000000000000000000000000000001',
             'value': web3_instance.to_wei(1000000, 'ether'),  # 1 million ETH (we don't have)
         }
 
-        # This should raise ValueError with simulation failure or validation failure
-        with pytest.raises((ValueError, Exception)) as exc_info:
-            wallet.send_transaction(tx)
-
-        # Verify error message mentions insufficient funds or failure
-        error_msg = str(exc_info.value).lower()
-        assert "insufficient" in error_msg or "fail" in error_msg or "balance" in error_msg
+        # Error message should mention insufficient funds or failure
+        with pytest.raises(ValueError, match=_INSUFFICIENT):
+            wallet.simulate(tx)
 
 
 @pytest.mark.asyncio
@@ -188,7 +189,7 @@ class TestWalletManagerIntegration:
 
         config = {
             "use_local_wallet": True,
-            "wallet_seed": "wine hero found plate sing hope field join pilot betray eyebrow note",
+            "wallet_seed": TEST_SEED,
             "network": "arbitrum-sepolia",
             "dry_run_mode": True,
             "max_transaction_value_usd": 1000,
@@ -205,7 +206,7 @@ class TestWalletManagerIntegration:
         await wallet_manager.initialize()
 
         # Verify initialized correctly
-        assert wallet_manager.address == "0x81A2933C185e45f72755B35110174D57b5E1FC88"
+        assert wallet_manager.address == TEST_ADDRESS
         assert wallet_manager.use_local_wallet is True
         assert wallet_manager.wallet_provider is not None
 
@@ -220,7 +221,7 @@ class TestWalletManagerIntegration:
         # Config with LOW spending limit
         config = {
             "use_local_wallet": True,
-            "wallet_seed": "wine hero found plate sing hope field join pilot betray eyebrow note",
+            "wallet_private_key": TEST_PRIVKEY,  # Seed path is covered above
             "network": "arbitrum-sepolia",
             "dry_run_mode": False,  # Real mode to test limits
             "max_transaction_value_usd": 10,  # Only $10 max
@@ -233,23 +234,22 @@ class TestWalletManagerIntegration:
             "gas_buffer_complex": 1.2,
         }
 
-        wallet_manager = WalletManager(config=config)
+        # Pin ETH/USD so the limit check never depends on a live price
+        oracle = MockPriceOracle()
+        oracle.set_price("ETH", Decimal("2000.00"))
+
+        wallet_manager = WalletManager(config=config, price_oracle=oracle)
         await wallet_manager.initialize()
 
-        # Try to execute transaction > spending limit
-        # (This would be > $10 if ETH price is ~$2000)
-        try:
-            result = await wallet_manager.execute_transaction(
+        # Try to execute transaction > spending limit ($200 at $2000/ETH);
+        # the spending limit should block it
+        with pytest.raises(ValueError, match=_LIMIT_EXCEEDED):
+            await wallet_manager.execute_transaction(
                 to="0x0000000000000000000000000000000000000001",
-                amount=Decimal("0.1"),  # 0.1 ETH = ~$200
+                amount=Decimal("0.1"),  # 0.1 ETH = $200
                 data="0x",
                 token="ETH",
             )
-            # Should not reach here - should be blocked by spending limit
-            assert False, "Transaction should have been blocked by spending limit"
-        except ValueError as e:
-            # Expected: Spending limit should block this
-            assert "exceed" in str(e).lower() or "limit" in str(e).lower()
 
         # Verify spending limit was NOT consumed (transaction blocked before recording)
         # This is tested by checking the limit state doesn't change
@@ -6,41 +6,70 @@ Verifies that MAMMON's hybrid architecture works correctly:
 - No cross-network contamination
 
 Critical for Phase 2 where cross-network errors could cause transaction failures.
+
+Tests of Python-level caching and isolation run against in-process fake
+chains (the offline_networks fixture); only tests marked network need live
+RPC endpoints.
 """
 
+import asyncio
+
 import pytest
-from src.utils.web3_provider import get_web3, Web3Provider, check_network_health
+from src.utils.web3_provider import (
+    get_web3,
+    Web3Provider,
+    check_network_health,
+    check_network_health_many,
+)
 from src.protocols.aerodrome import AerodromeProtocol
 from src.tokens.erc20 import ERC20Token
 from src.utils.networks import get_network
 
+# xdist_group names the RPC targets a class's live tests hit, so under
+# --dist=loadgroup each target set warms its caches on one worker while
+# the Base-only class runs alongside. Offline classes are left ungrouped.
+BOTH_NETWORKS = "base-mainnet+arbitrum-sepolia"
+
+
+@pytest.fixture(scope="session")
+def chain_ids():
+    """Chain ID reported by each network's RPC, fetched once per session."""
+    return {
+        network_id: get_web3(network_id).eth.chain_id
+        for network_id in ("base-mainnet", "arbitrum-sepolia")
+    }
 
+
+@pytest.mark.xdist_group(BOTH_NETWORKS)
 class TestMultiNetworkInfrastructure:
     """Test multi-network Web3 infrastructure."""
 
-    def test_can_connect_to_base_mainnet(self):
+    @pytest.mark.network
+    def test_can_connect_to_base_mainnet(self, chain_ids):
         """Verify connection to Base mainnet works."""
         w3 = get_web3("base-mainnet")
 
         assert w3.is_connected(), "Should connect to Base mainnet"
-        assert w3.eth.chain_id == 8453, "Chain ID should be 8453 (Base)"
+        assert chain_ids["base-mainnet"] == 8453, "Chain ID should be 8453 (Base)"
 
         # Can query latest block
         block = w3.eth.block_number
         assert block > 0, "Should have blocks"
 
-    def test_can_connect_to_arbitrum_sepolia(self):
+    @pytest.mark.network
+    def test_can_connect_to_arbitrum_sepolia(self, chain_ids):
         """Verify connection to Arbitrum Sepolia works."""
         w3 = get_web3("arbitrum-sepolia")
 
         assert w3.is_connected(), "Should connect to Arbitrum Sepolia"
-        assert w3.eth.chain_id == 421614, "Chain ID should be 421614 (Arbitrum Sepolia)"
+        assert chain_ids["arbitrum-sepolia"] == 421614, \
+            "Chain ID should be 421614 (Arbitrum Sepolia)"
 
         # Can query latest block
         block = w3.eth.block_number
         assert block > 0, "Should have blocks"
 
-    def test_network_instances_are_isolated(self):
+    def test_network_instances_are_isolated(self, offline_networks):
         """Verify each network gets its own Web3 instance."""
         w3_base = get_web3("base-mainnet")
         w3_arb = get_web3("arbitrum-sepolia")
@@ -56,6 +85,7 @@ class TestMultiNetworkInfrastructure:
         # But different networks should have different instances
         assert w3_base is not w3_arb, "Different networks should have different instances"
 
+    @pytest.mark.network
     def test_network_health_checks_work(self):
         """Verify network health checks for both networks."""
         base_health = check_network_health("base-mainnet")
@@ -67,9 +97,11 @@ class TestMultiNetworkInfrastructure:
         assert arb_health["chain_id"] == 421614
 
 
+@pytest.mark.xdist_group("base-mainnet")
 class TestNetworkIsolation:
     """Test that network operations are properly isolated."""
 
+    @pytest.mark.network
     @pytest.mark.asyncio
     async def test_aerodrome_only_on_base(self):
         """Verify Aerodrome queries only work on Base (BASE-ONLY protocol)."""
@@ -87,7 +119,7 @@ class TestNetworkIsolation:
             assert pool.metadata.get("source") == "base_mainnet", \
                 "Pools should be from Base mainnet"
 
-    def test_token_queries_use_correct_network(self):
+    def test_token_queries_use_correct_network(self, offline_networks):
         """Verify token queries use the correct network."""
         # USDC on Base mainnet
         usdc_base = ERC20Token(
@@ -119,18 +151,23 @@ class TestNetworkIsolation:
             "Arbitrum RPC should be for Arbitrum network"
 
 
+@pytest.mark.xdist_group(BOTH_NETWORKS)
 class TestCrossNetworkScenarios:
     """Test scenarios involving multiple networks."""
 
-    def test_can_switch_between_networks(self):
+    @pytest.mark.network
+    @pytest.mark.asyncio
+    async def test_can_switch_between_networks(self):
         """Test switching between networks works correctly."""
         # Connect to Base
         w3_base = get_web3("base-mainnet")
-        base_block = w3_base.eth.block_number
 
-        # Switch to Arbitrum
-        w3_arb = get_web3("arbitrum-sepolia")
-        arb_block = w3_arb.eth.block_number
+        # Different hosts on separate pooled connections: read both heads at once
+        base_block, arb_block = await asyncio.gather(
+            asyncio.to_thread(lambda: w3_base.eth.block_number),
+            asyncio.to_thread(lambda: get_web3("arbitrum-sepolia").eth.block_number),
+        )
+        assert arb_block > 0
 
         # Switch back to Base
         w3_base_again = get_web3("base-mainnet")
@@ -142,11 +179,14 @@ class TestCrossNetworkScenarios:
         # Block numbers might differ slightly (new blocks)
         assert base_block_again >= base_block
 
-    def test_concurrent_network_operations(self):
+    @pytest.mark.network
+    @pytest.mark.asyncio
+    async def test_concurrent_network_operations(self):
         """Test that concurrent operations on different networks work."""
-        # Query both networks concurrently (in practice)
-        base_health = check_network_health("base-mainnet")
-        arb_health = check_network_health("arbitrum-sepolia")
+        # Query both networks concurrently: wall time is the slower RTT, not the sum
+        base_health, arb_health = await check_network_health_many(
+            ["base-mainnet", "arbitrum-sepolia"]
+        )
 
         # Both should succeed
         assert base_health["connected"] and arb_health["connected"], \
@@ -156,6 +196,7 @@ class TestCrossNetworkScenarios:
         assert base_health["block_number"] != arb_health["block_number"], \
             "Networks have independent state"
 
+    @pytest.mark.network
     @pytest.mark.asyncio
     async def test_hybrid_workflow(self):
         """Test realistic hybrid workflow: Base for data, Arbitrum for test transactions."""
@@ -165,7 +206,11 @@ class TestCrossNetworkScenarios:
             "dry_run_mode": False
         })
 
-        pools = await protocol._get_real_pools_from_mainnet(max_pools=2)
+        # Base pool query and Arbitrum access are independent: run them together
+        pools, arb_chain_id = await asyncio.gather(
+            protocol._get_real_pools_from_mainnet(max_pools=2),
+            asyncio.to_thread(lambda: get_web3("arbitrum-sepolia").eth.chain_id),
+        )
         assert len(pools) > 0, "Should find pools on Base"
 
         # Step 2: Verify network isolation
@@ -175,8 +220,7 @@ class TestCrossNetworkScenarios:
                 "Pool data should be from Base"
 
         # Step 3: Verify we can still access Arbitrum Sepolia
-        w3_arb = get_web3("arbitrum-sepolia")
-        assert w3_arb.eth.chain_id == 421614, "Arbitrum still accessible"
+        assert arb_chain_id == 421614, "Arbitrum still accessible"
 
         # No cross-contamination: Base pool data, Arbitrum network access
         assert True, "Hybrid workflow works correctly"
@@ -185,18 +229,15 @@ class TestCrossNetworkScenarios:
 class TestNetworkCachingIsolation:
     """Test that network caching doesn't cause cross-network issues."""
 
-    def test_cache_keys_include_network_id(self):
+    def test_cache_keys_include_network_id(self, offline_networks):
         """Verify cache keys prevent cross-network contamination."""
         # Clear cache
         Web3Provider.clear_cache()
 
-        # Connect to Base
+        # Connect to Base, then Arbitrum; the fresh instances must each
+        # query their own chain, so these reads deliberately bypass chain_ids
         w3_base = get_web3("base-mainnet")
-        base_chain_id = w3_base.eth.chain_id
-
-        # Connect to Arbitrum
         w3_arb = get_web3("arbitrum-sepolia")
-        arb_chain_id = w3_arb.eth.chain_id
 
         # Chain IDs should still be correct (no cache collision)
         assert w3_base.eth.chain_id == 8453, "Base chain ID unchanged"
@@ -205,7 +246,7 @@ class TestNetworkCachingIsolation:
         # Instances should be different
         assert w3_base is not w3_arb, "Different network instances"
 
-    def test_cache_clear_per_network(self):
+    def test_cache_clear_per_network(self, offline_networks):
         """Test that clearing cache for one network doesn't affect others."""
         # Connect to both
         w3_base_1 = get_web3("base-mainnet")
@@ -226,7 +267,7 @@ class TestNetworkCachingIsolation:
 class TestNetworkErrorIsolation:
     """Test that errors on one network don't affect others."""
 
-    def test_invalid_network_doesnt_break_valid_ones(self):
+    def test_invalid_network_doesnt_break_valid_ones(self, offline_networks):
         """Test that querying invalid network doesn't break valid networks."""
         # Connect to valid network first
         w3_base = get_web3("base-mainnet")
@@ -5,11 +5,19 @@ Phase 3 Sprint 2: Tests for scanning all 4 protocols (Aerodrome, Morpho, Aave V3
 
 import pytest
 from decimal import Decimal
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from src.agents.yield_scanner import YieldScannerAgent, YieldOpportunity
 
+# Filter and comparison thresholds
+_MIN_APY_5 = Decimal("5.0")
+_MIN_APY_3 = Decimal("3.0")
+_MIN_TVL_500K = Decimal("500000")  # $500k minimum
+_MIN_TVL_100K = Decimal("100000")
+_CURRENT_APY_4 = Decimal("4.0")
+_UNBEATABLE_APY = Decimal("100.0")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def scanner_config():
     """Configuration for yield scanner with all protocols."""
     return {
@@ -21,369 +29,265 @@ def scanner_config():
     }
 
 
-# ===== INITIALIZATION TESTS =====
+@pytest.fixture(scope="module", autouse=True)
+def _mock_web3():
+    """Patch get_web3 in the lending protocol modules for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        for module in ("src.protocols.aave", "src.protocols.moonwell", "src.protocols.morpho"):
+            mp.setattr(f"{module}.get_web3", MagicMock())
+        yield
 
 
-@pytest.mark.asyncio
-async def test_scanner_initialization(scanner_config):
-    """Test that YieldScanner initializes with all 4 protocols."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
+@pytest.fixture(scope="module")
+def scanner(scanner_config):
+    """Scanner shared by every test in the module.
 
-        scanner = YieldScannerAgent(scanner_config)
+    Tests that change scanner state must do so through monkeypatch. Under
+    pytest-xdist each worker builds its own instance; run with
+    --dist=loadfile to keep the module on one worker.
+    """
+    return YieldScannerAgent(scanner_config)
 
-        # Should have 4 protocols: Aerodrome, Morpho, Aave V3, Moonwell
-        assert len(scanner.protocols) == 4
-        protocol_names = [p.name for p in scanner.protocols]
-        assert "Aerodrome" in protocol_names
-        assert "Morpho" in protocol_names
-        assert "Aave V3" in protocol_names
-        assert "Moonwell" in protocol_names
 
+@pytest.fixture(scope="module")
+async def all_opportunities(scanner):
+    """Result of one scan_all_protocols() run, shared by read-only tests."""
+    return await scanner.scan_all_protocols()
 
-@pytest.mark.asyncio
-async def test_scanner_dry_run_mode_enabled(scanner_config):
-    """Test that scanner respects dry run mode."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
 
-        scanner = YieldScannerAgent(scanner_config)
-        assert scanner.dry_run_mode is True
+@pytest.fixture(scope="module")
+def best_usdc_apy(all_opportunities):
+    """Highest USDC APY in the mock data."""
+    return max(opp.apy for opp in all_opportunities if "USDC" in opp.upper_tokens)
 
 
-# ===== MULTI-PROTOCOL SCANNING TESTS =====
+# ===== INITIALIZATION TESTS =====
 
 
-@pytest.mark.asyncio
-async def test_scan_all_protocols_returns_opportunities(scanner_config):
-    """Test that scan_all_protocols returns opportunities from all protocols."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
+async def test_scanner_initialization(scanner):
+    """Test that YieldScanner initializes with all 4 protocols."""
+    # Should have 4 protocols: Aerodrome, Morpho, Aave V3, Moonwell
+    assert len(scanner.protocols) == 4
+    protocol_names = [p.name for p in scanner.protocols]
+    assert "Aerodrome" in protocol_names
+    assert "Morpho" in protocol_names
+    assert "Aave V3" in protocol_names
+    assert "Moonwell" in protocol_names
 
-        scanner = YieldScannerAgent(scanner_config)
-        opportunities = await scanner.scan_all_protocols()
 
-        # Should return a list
-        assert isinstance(opportunities, list)
-        # Should have opportunities from mock data
-        assert len(opportunities) > 0
+async def test_scanner_dry_run_mode_enabled(scanner):
+    """Test that scanner respects dry run mode."""
+    assert scanner.dry_run_mode is True
 
 
-@pytest.mark.asyncio
-async def test_scan_all_protocols_sorted_by_apy(scanner_config):
-    """Test that opportunities are sorted by APY (highest first)."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
+# ===== MULTI-PROTOCOL SCANNING TESTS =====
 
-        scanner = YieldScannerAgent(scanner_config)
-        opportunities = await scanner.scan_all_protocols()
 
-        # Check that opportunities are sorted descending by APY
-        for i in range(len(opportunities) - 1):
-            assert opportunities[i].apy >= opportunities[i + 1].apy
+async def test_scan_all_protocols_returns_opportunities(all_opportunities):
+    """Test that scan_all_protocols returns opportunities from all protocols."""
+    # Should return a list
+    assert isinstance(all_opportunities, list)
+    # Should have opportunities from mock data
+    assert len(all_opportunities) > 0
 
 
-@pytest.mark.asyncio
-async def test_scan_includes_all_protocol_types(scanner_config):
-    """Test that scan includes both DEX and Lending protocols."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
+async def test_scan_all_protocols_sorted_by_apy(all_opportunities):
+    """Test that opportunities are sorted by APY (highest first)."""
+    # Check that opportunities are sorted descending by APY
+    apys = [opp.apy for opp in all_opportunities]
+    for a, b in zip(apys, apys[1:]):
+        assert a >= b, f"unsorted: {a} < {b}"
 
-        scanner = YieldScannerAgent(scanner_config)
-        opportunities = await scanner.scan_all_protocols()
 
-        protocols_found = {opp.protocol for opp in opportunities}
+async def test_scan_includes_all_protocol_types(all_opportunities):
+    """Test that scan includes both DEX and Lending protocols."""
+    protocols_found = {opp.protocol for opp in all_opportunities}
 
-        # Should have opportunities from multiple protocols
-        assert len(protocols_found) >= 2
+    # Should have opportunities from multiple protocols
+    assert len(protocols_found) >= 2
 
 
-@pytest.mark.asyncio
-async def test_scan_handles_protocol_failure_gracefully(scanner_config):
+async def test_scan_handles_protocol_failure_gracefully(scanner, monkeypatch):
     """Test that scan continues if one protocol fails."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
+    # Make one protocol fail, and keep the recorded failure off the shared
+    # scanner's circuit breaker
+    monkeypatch.setattr(
+        scanner.protocols[0], "get_pools", MagicMock(side_effect=Exception("Protocol error"))
+    )
+    monkeypatch.setattr(scanner.circuit_breaker, "circuits", {})
 
-        scanner = YieldScannerAgent(scanner_config)
-
-        # Make one protocol fail
-        scanner.protocols[0].get_pools = MagicMock(side_effect=Exception("Protocol error"))
-
-        # Should still return opportunities from other protocols
-        opportunities = await scanner.scan_all_protocols()
-        assert isinstance(opportunities, list)
+    # Should still return opportunities from other protocols
+    opportunities = await scanner.scan_all_protocols()
+    assert isinstance(opportunities, list)
 
 
 # ===== FIND BEST YIELD TESTS =====
 
 
-@pytest.mark.asyncio
-async def test_find_best_yield_for_token(scanner_config):
+async def test_find_best_yield_for_token(scanner):
     """Test finding best yield for a specific token across all protocols."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
+    # Find best USDC yield
+    best = await scanner.find_best_yield("USDC")
 
-        # Find best USDC yield
-        best = await scanner.find_best_yield("USDC")
+    # Should return an opportunity
+    assert best is not None
+    assert isinstance(best, YieldOpportunity)
+    assert "USDC" in best.upper_tokens
 
-        # Should return an opportunity
-        assert best is not None
-        assert isinstance(best, YieldOpportunity)
-        assert "USDC" in [t.upper() for t in best.tokens]
 
-
-@pytest.mark.asyncio
-async def test_find_best_yield_returns_highest_apy(scanner_config):
+async def test_find_best_yield_returns_highest_apy(scanner, best_usdc_apy):
     """Test that find_best_yield returns the highest APY for the token."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
-
-        best = await scanner.find_best_yield("USDC")
+    best = await scanner.find_best_yield("USDC")
 
-        # Get all USDC opportunities
-        all_opps = await scanner.scan_all_protocols()
-        usdc_opps = [opp for opp in all_opps if "USDC" in [t.upper() for t in opp.tokens]]
+    # Best should have the highest APY
+    assert best.apy == best_usdc_apy
 
-        # Best should have the highest APY
-        if len(usdc_opps) > 0:
-            max_apy = max(opp.apy for opp in usdc_opps)
-            assert best.apy == max_apy
 
-
-@pytest.mark.asyncio
-async def test_find_best_yield_nonexistent_token(scanner_config):
+async def test_find_best_yield_nonexistent_token(scanner):
     """Test finding best yield for a token that doesn't exist."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
+    # Try to find yield for non-existent token
+    best = await scanner.find_best_yield("NONEXISTENT")
 
-        # Try to find yield for non-existent token
-        best = await scanner.find_best_yield("NONEXISTENT")
-
-        # Should return None
-        assert best is None
+    # Should return None
+    assert best is None
 
 
 # ===== FILTERING TESTS =====
 
 
-@pytest.mark.asyncio
-async def test_filter_by_min_apy(scanner_config):
+async def test_filter_by_min_apy(scanner):
     """Test filtering opportunities by minimum APY."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
-
-        # Get opportunities with minimum APY
-        min_apy = Decimal("5.0")
-        filtered = await scanner.get_best_opportunities(min_apy=min_apy)
+    # Get opportunities with minimum APY
+    min_apy = _MIN_APY_5
+    filtered = await scanner.get_best_opportunities(min_apy=min_apy)
 
-        # All returned opportunities should meet minimum
-        for opp in filtered:
-            assert opp.apy >= min_apy
+    # All returned opportunities should meet minimum
+    for opp in filtered:
+        assert opp.apy >= min_apy
 
 
-@pytest.mark.asyncio
-async def test_filter_by_min_tvl(scanner_config):
+async def test_filter_by_min_tvl(scanner):
     """Test filtering opportunities by minimum TVL."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
+    # Get opportunities with minimum TVL
+    min_tvl = _MIN_TVL_500K
+    filtered = await scanner.get_best_opportunities(min_tvl=min_tvl)
 
-        scanner = YieldScannerAgent(scanner_config)
+    # All returned opportunities should meet minimum
+    for opp in filtered:
+        assert opp.tvl >= min_tvl
 
-        # Get opportunities with minimum TVL
-        min_tvl = Decimal("500000")  # $500k minimum
-        filtered = await scanner.get_best_opportunities(min_tvl=min_tvl)
 
-        # All returned opportunities should meet minimum
-        for opp in filtered:
-            assert opp.tvl >= min_tvl
-
-
-@pytest.mark.asyncio
-async def test_filter_by_token(scanner_config):
+async def test_filter_by_token(scanner):
     """Test filtering opportunities by specific token."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
+    # Get only USDC opportunities
+    filtered = await scanner.get_best_opportunities(token="USDC")
 
-        # Get only USDC opportunities
-        filtered = await scanner.get_best_opportunities(token="USDC")
+    # All returned opportunities should include USDC
+    for opp in filtered:
+        assert "USDC" in opp.upper_tokens
 
-        # All returned opportunities should include USDC
-        for opp in filtered:
-            assert "USDC" in [t.upper() for t in opp.tokens]
 
-
-@pytest.mark.asyncio
-async def test_filter_combined_criteria(scanner_config):
+async def test_filter_combined_criteria(scanner):
     """Test filtering with multiple criteria combined."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
-
-        # Filter with multiple criteria
-        filtered = await scanner.get_best_opportunities(
-            token="USDC",
-            min_apy=Decimal("3.0"),
-            min_tvl=Decimal("100000"),
-        )
+    # Filter with multiple criteria
+    filtered = await scanner.get_best_opportunities(
+        token="USDC",
+        min_apy=_MIN_APY_3,
+        min_tvl=_MIN_TVL_100K,
+    )
 
-        # All opportunities should meet all criteria
-        for opp in filtered:
-            assert "USDC" in [t.upper() for t in opp.tokens]
-            assert opp.apy >= Decimal("3.0")
-            assert opp.tvl >= Decimal("100000")
+    # All opportunities should meet all criteria
+    for opp in filtered:
+        assert "USDC" in opp.upper_tokens
+        assert opp.apy >= _MIN_APY_3
+        assert opp.tvl >= _MIN_TVL_100K
 
 
 # ===== COMPARISON TESTS =====
 
 
-@pytest.mark.asyncio
-async def test_compare_current_position(scanner_config):
+async def test_compare_current_position(scanner):
     """Test comparing current position against alternatives."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
+    # Compare a hypothetical current position
+    comparison = await scanner.compare_current_position(
+        current_protocol="Morpho",
+        current_pool_id="morpho-usdc-market-1",
+        current_apy=_CURRENT_APY_4,
+    )
 
-        scanner = YieldScannerAgent(scanner_config)
+    # Should return comparison results
+    assert "current" in comparison
+    assert "recommendation" in comparison
+    assert comparison["current"]["apy"] == _CURRENT_APY_4
 
-        # Compare a hypothetical current position
-        comparison = await scanner.compare_current_position(
-            current_protocol="Morpho",
-            current_pool_id="morpho-usdc-market-1",
-            current_apy=Decimal("4.0"),
-        )
 
-        # Should return comparison results
-        assert "current" in comparison
-        assert "recommendation" in comparison
-        assert comparison["current"]["apy"] == Decimal("4.0")
-
-
-@pytest.mark.asyncio
-async def test_compare_current_position_optimal(scanner_config):
+async def test_compare_current_position_optimal(scanner):
     """Test comparison when current position is already optimal."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
+    # Use a very high APY that's better than anything available
+    comparison = await scanner.compare_current_position(
+        current_protocol="Morpho",
+        current_pool_id="test-pool",
+        current_apy=_UNBEATABLE_APY,
+    )
 
-        # Use a very high APY that's better than anything available
-        comparison = await scanner.compare_current_position(
-            current_protocol="Morpho",
-            current_pool_id="test-pool",
-            current_apy=Decimal("100.0"),
-        )
-
-        # Should recommend OPTIMAL (no better alternatives)
-        assert comparison["recommendation"] == "OPTIMAL"
+    # Should recommend OPTIMAL (no better alternatives)
+    assert comparison["recommendation"] == "OPTIMAL"
 
 
 # ===== ENHANCED YIELD COMPARISON TESTS =====
 
 
-@pytest.mark.asyncio
-async def test_compare_yields_all_tokens(scanner_config):
+async def test_compare_yields_all_tokens(scanner):
     """Test enhanced yield comparison analytics across all tokens."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
-
-        # Get comprehensive analytics
-        analytics = await scanner.compare_yields()
+    # Get comprehensive analytics
+    analytics = await scanner.compare_yields()
 
-        # Should return comprehensive statistics
-        assert "token" in analytics
-        assert "total_opportunities" in analytics
-        assert "best" in analytics
-        assert "worst" in analytics
-        assert "statistics" in analytics
-        assert "protocol_breakdown" in analytics
+    # Should return comprehensive statistics
+    assert "token" in analytics
+    assert "total_opportunities" in analytics
+    assert "best" in analytics
+    assert "worst" in analytics
+    assert "statistics" in analytics
+    assert "protocol_breakdown" in analytics
 
 
-@pytest.mark.asyncio
-async def test_compare_yields_specific_token(scanner_config):
+async def test_compare_yields_specific_token(scanner):
     """Test enhanced yield comparison for specific token."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
+    # Get analytics for USDC
+    analytics = await scanner.compare_yields(token="USDC")
 
-        scanner = YieldScannerAgent(scanner_config)
+    # Should return USDC-specific analytics
+    assert analytics["token"] == "USDC"
+    assert "best" in analytics
+    assert "statistics" in analytics
 
-        # Get analytics for USDC
-        analytics = await scanner.compare_yields(token="USDC")
 
-        # Should return USDC-specific analytics
-        assert analytics["token"] == "USDC"
-        assert "best" in analytics
-        assert "statistics" in analytics
-
-
-@pytest.mark.asyncio
-async def test_compare_yields_statistics(scanner_config):
+async def test_compare_yields_statistics(scanner):
     """Test that yield comparison includes all required statistics."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
+    analytics = await scanner.compare_yields()
+    stats = analytics["statistics"]
 
-        analytics = await scanner.compare_yields()
-        stats = analytics["statistics"]
+    # Should include all key statistics
+    assert "average_apy" in stats
+    assert "median_apy" in stats
+    assert "spread" in stats
+    assert "volatility" in stats
+    assert "advantage_over_avg" in stats
+    assert "advantage_pct" in stats
 
-        # Should include all key statistics
-        assert "average_apy" in stats
-        assert "median_apy" in stats
-        assert "spread" in stats
-        assert "volatility" in stats
-        assert "advantage_over_avg" in stats
-        assert "advantage_pct" in stats
 
-
-@pytest.mark.asyncio
-async def test_compare_yields_protocol_breakdown(scanner_config):
+async def test_compare_yields_protocol_breakdown(scanner):
     """Test that yield comparison includes protocol breakdown."""
-    with patch("src.protocols.aave.get_web3"), \
-         patch("src.protocols.moonwell.get_web3"), \
-         patch("src.protocols.morpho.get_web3"):
-
-        scanner = YieldScannerAgent(scanner_config)
-
-        analytics = await scanner.compare_yields()
-        breakdown = analytics["protocol_breakdown"]
-
-        # Should have breakdown for multiple protocols
-        assert len(breakdown) > 0
-
-        # Each protocol should have required fields
-        for protocol, stats in breakdown.items():
-            assert "count" in stats
-            assert "avg_apy" in stats
-            assert "max_apy" in stats
-            assert "min_apy" in stats
-            assert "total_tvl" in stats
+    analytics = await scanner.compare_yields()
+    breakdown = analytics["protocol_breakdown"]
+
+    # Should have breakdown for multiple protocols
+    assert len(breakdown) > 0
+
+    # Each protocol should have required fields
+    for protocol, stats in breakdown.items():
+        assert "count" in stats
+        assert "avg_apy" in stats
+        assert "max_apy" in stats
+        assert "min_apy" in stats
+        assert "total_tvl" in stats
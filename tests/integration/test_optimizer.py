@@ -3,59 +3,74 @@
 Tests the complete optimization workflow from scanner → strategy → recommendations.
 """
 
+import asyncio
 import pytest
 from decimal import Decimal
 from typing import Dict, List
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 from src.agents.optimizer import OptimizerAgent
-from src.agents.yield_scanner import YieldScannerAgent, YieldOpportunity
+from src.agents.yield_scanner import YieldOpportunity
 from src.strategies.simple_yield import SimpleYieldStrategy
 from src.strategies.risk_adjusted import RiskAdjustedStrategy
 
+_CAPITAL_10K = Decimal("10000")
+_MAX_CONCENTRATION_WITH_ROUNDING = Decimal("0.41")
+
+_SIMPLE_YIELD_CONFIG = {
+    "min_apy_improvement": Decimal("0.5"),
+    "min_rebalance_amount": Decimal("100"),
+}
+
+_RISK_ADJUSTED_CONFIG = {
+    "dry_run_mode": True,
+    "min_apy_improvement": Decimal("0.5"),
+    "min_rebalance_amount": Decimal("100"),
+    "risk_tolerance": "medium",
+    "allow_high_risk": False,
+    "max_concentration_pct": 0.4,
+    "diversification_target": 3,
+}
+
+
+class _StubScanner:
+    """Stand-in for YieldScannerAgent; OptimizerAgent only calls scan_all_protocols."""
+
+    def __init__(self):
+        self.scan_all_protocols = AsyncMock()
+
 
 @pytest.fixture
 def mock_scanner():
-    """Create a mock YieldScannerAgent."""
-    scanner = MagicMock(spec=YieldScannerAgent)
-    scanner.scan_all_protocols = AsyncMock()
-    return scanner
+    """Create a stub YieldScannerAgent."""
+    return _StubScanner()
 
 
 @pytest.fixture
 def simple_yield_strategy():
     """Create a SimpleYieldStrategy for testing."""
-    config = {
-        "min_apy_improvement": Decimal("0.5"),
-        "min_rebalance_amount": Decimal("100"),
-    }
-    return SimpleYieldStrategy(config)
+    return SimpleYieldStrategy(_SIMPLE_YIELD_CONFIG)
 
 
 @pytest.fixture
 def risk_adjusted_strategy():
     """Create a RiskAdjustedStrategy for testing."""
-    config = {
-        "dry_run_mode": True,
-        "min_apy_improvement": Decimal("0.5"),
-        "min_rebalance_amount": Decimal("100"),
-        "risk_tolerance": "medium",
-        "allow_high_risk": False,
-        "max_concentration_pct": 0.4,
-        "diversification_target": 3,
-    }
-    return RiskAdjustedStrategy(config)
+    return RiskAdjustedStrategy(_RISK_ADJUSTED_CONFIG)
 
 
-def create_mock_opportunities() -> List[YieldOpportunity]:
-    """Create mock yield opportunities for testing."""
+@pytest.fixture(scope="module")
+def mock_opportunities() -> List[YieldOpportunity]:
+    """Mock yield opportunities, built once per module.
+
+    Tests treat these as read-only; copy the list before changing it.
+    """
     return [
         YieldOpportunity(
             protocol="Aave V3",
             pool_id="usdc-pool",
             pool_name="USDC Pool",
             apy=Decimal("5.5"),
-            tvl=Decimal("125_000_000"),
+            tvl=Decimal(125_000_000),
             tokens=["USDC"],
             metadata={"utilization": 0.7},
         ),
@@ -64,7 +79,7 @@ def create_mock_opportunities() -> List[YieldOpportunity]:
             pool_id="usdc-vault",
             pool_name="USDC Vault",
             apy=Decimal("7.2"),
-            tvl=Decimal("45_000_000"),
+            tvl=Decimal(45_000_000),
             tokens=["USDC"],
             metadata={"utilization": 0.65},
         ),
@@ -73,7 +88,7 @@ def create_mock_opportunities() -> List[YieldOpportunity]:
             pool_id="usdc-market",
             pool_name="USDC Market",
             apy=Decimal("6.0"),
-            tvl=Decimal("32_000_000"),
+            tvl=Decimal(32_000_000),
             tokens=["USDC"],
             metadata={"utilization": 0.72},
         ),
@@ -82,15 +97,14 @@ def create_mock_opportunities() -> List[YieldOpportunity]:
             pool_id="usdc-usdt-pool",
             pool_name="USDC/USDT Pool",
             apy=Decimal("4.8"),
-            tvl=Decimal("15_000_000"),
+            tvl=Decimal(15_000_000),
             tokens=["USDC", "USDT"],
             metadata={"is_stable": True},
         ),
     ]
 
 
-@pytest.mark.asyncio
-async def test_optimizer_simple_yield_e2e(mock_scanner, simple_yield_strategy):
+async def test_optimizer_simple_yield_e2e(mock_scanner, simple_yield_strategy, mock_opportunities):
     """Test end-to-end optimization with SimpleYieldStrategy.
 
     Verifies:
@@ -100,7 +114,6 @@ async def test_optimizer_simple_yield_e2e(mock_scanner, simple_yield_strategy):
     - Recommendations are generated correctly
     """
     # Setup mock scanner
-    mock_opportunities = create_mock_opportunities()
     mock_scanner.scan_all_protocols.return_value = mock_opportunities
 
     # Create optimizer
@@ -113,7 +126,7 @@ async def test_optimizer_simple_yield_e2e(mock_scanner, simple_yield_strategy):
 
     # Current position in lower-yield protocol (large enough to be profitable)
     current_positions = {
-        "Aave V3": Decimal("10000"),  # 5.5% APY, $10k position
+        "Aave V3": _CAPITAL_10K,  # 5.5% APY, $10k position
     }
 
     # Find rebalance opportunities
@@ -133,8 +146,9 @@ async def test_optimizer_simple_yield_e2e(mock_scanner, simple_yield_strategy):
     assert top_rec.confidence > 0
 
 
-@pytest.mark.asyncio
-async def test_optimizer_risk_adjusted_e2e(mock_scanner, risk_adjusted_strategy):
+async def test_optimizer_risk_adjusted_e2e(
+    mock_scanner, risk_adjusted_strategy, mock_opportunities
+):
     """Test end-to-end optimization with RiskAdjustedStrategy.
 
     Verifies:
@@ -144,7 +158,6 @@ async def test_optimizer_risk_adjusted_e2e(mock_scanner, risk_adjusted_strategy)
     - Recommendations include risk considerations
     """
     # Setup mock scanner
-    mock_opportunities = create_mock_opportunities()
     mock_scanner.scan_all_protocols.return_value = mock_opportunities
 
     # Create optimizer
@@ -175,8 +188,9 @@ async def test_optimizer_risk_adjusted_e2e(mock_scanner, risk_adjusted_strategy)
         assert top_rec.expected_apy > Decimal("6.0")  # Better than current
 
 
-@pytest.mark.asyncio
-async def test_optimizer_multiple_positions(mock_scanner, simple_yield_strategy):
+async def test_optimizer_multiple_positions(
+    mock_scanner, simple_yield_strategy, mock_opportunities
+):
     """Test optimization with multiple current positions.
 
     Verifies:
@@ -185,7 +199,6 @@ async def test_optimizer_multiple_positions(mock_scanner, simple_yield_strategy)
     - Each recommendation optimizes its specific position
     """
     # Setup mock scanner
-    mock_opportunities = create_mock_opportunities()
     mock_scanner.scan_all_protocols.return_value = mock_opportunities
 
     # Create optimizer
@@ -199,7 +212,7 @@ async def test_optimizer_multiple_positions(mock_scanner, simple_yield_strategy)
     # Multiple positions in different protocols (large enough to be profitable)
     current_positions = {
         "Aave V3": Decimal("5000"),      # 5.5% → can move to Morpho 7.2%
-        "Moonwell": Decimal("10000"),    # 6.0% → can move to Morpho 7.2%
+        "Moonwell": _CAPITAL_10K,       # 6.0% → can move to Morpho 7.2%
         "Aerodrome": Decimal("3000"),    # 4.8% → can move to Morpho 7.2%
     }
 
@@ -216,8 +229,9 @@ async def test_optimizer_multiple_positions(mock_scanner, simple_yield_strategy)
         assert rec.expected_apy > Decimal("4.5")  # Better than worst current
 
 
-@pytest.mark.asyncio
-async def test_optimizer_new_allocation_simple(mock_scanner, simple_yield_strategy):
+async def test_optimizer_new_allocation_simple(
+    mock_scanner, simple_yield_strategy, mock_opportunities
+):
     """Test new capital allocation with SimpleYieldStrategy.
 
     Verifies:
@@ -226,7 +240,6 @@ async def test_optimizer_new_allocation_simple(mock_scanner, simple_yield_strate
     - Allocation totals match input capital
     """
     # Setup mock scanner
-    mock_opportunities = create_mock_opportunities()
     mock_scanner.scan_all_protocols.return_value = mock_opportunities
 
     # Create optimizer
@@ -238,7 +251,7 @@ async def test_optimizer_new_allocation_simple(mock_scanner, simple_yield_strate
     )
 
     # New capital to allocate
-    total_capital = Decimal("10000")
+    total_capital = _CAPITAL_10K
 
     # Optimize allocation
     allocation = await optimizer.optimize_new_allocation(total_capital)
@@ -252,8 +265,9 @@ async def test_optimizer_new_allocation_simple(mock_scanner, simple_yield_strate
     assert allocation["Morpho"] == total_capital
 
 
-@pytest.mark.asyncio
-async def test_optimizer_new_allocation_risk_adjusted(mock_scanner, risk_adjusted_strategy):
+async def test_optimizer_new_allocation_risk_adjusted(
+    mock_scanner, risk_adjusted_strategy, mock_opportunities
+):
     """Test new capital allocation with RiskAdjustedStrategy.
 
     Verifies:
@@ -262,7 +276,6 @@ async def test_optimizer_new_allocation_risk_adjusted(mock_scanner, risk_adjuste
     - Total allocation equals input capital
     """
     # Setup mock scanner
-    mock_opportunities = create_mock_opportunities()
     mock_scanner.scan_all_protocols.return_value = mock_opportunities
 
     # Create optimizer
@@ -274,7 +287,7 @@ async def test_optimizer_new_allocation_risk_adjusted(mock_scanner, risk_adjuste
     )
 
     # New capital to allocate
-    total_capital = Decimal("10000")
+    total_capital = _CAPITAL_10K
 
     # Optimize allocation
     allocation = await optimizer.optimize_new_allocation(total_capital)
@@ -294,11 +307,10 @@ async def test_optimizer_new_allocation_risk_adjusted(mock_scanner, risk_adjuste
     max_allocation = max(allocation.values()) if allocation else Decimal(0)
     max_pct = max_allocation / total_capital if total_capital > 0 else 0
     # Allow some tolerance for rounding
-    assert max_pct <= Decimal("0.41"), \
+    assert max_pct <= _MAX_CONCENTRATION_WITH_ROUNDING, \
         f"Max allocation {max_pct*100}% exceeds concentration limit"
 
 
-@pytest.mark.asyncio
 async def test_optimizer_no_opportunities(mock_scanner, simple_yield_strategy):
     """Test optimizer behavior when no opportunities are available.
 
@@ -330,7 +342,6 @@ async def test_optimizer_no_opportunities(mock_scanner, simple_yield_strategy):
     assert recommendations == [], "Should return empty list when no opportunities"
 
 
-@pytest.mark.asyncio
 async def test_optimizer_no_profitable_moves(mock_scanner, simple_yield_strategy):
     """Test when current positions are already optimal.
 
@@ -425,8 +436,9 @@ def test_build_yields_dictionary_filters_by_target_token(mock_scanner, simple_yi
     assert yields_dict == {"Aave V3": Decimal("5.0")}
 
 
-@pytest.mark.asyncio
-async def test_optimizer_strategy_comparison(mock_scanner, simple_yield_strategy, risk_adjusted_strategy):
+async def test_optimizer_strategy_comparison(
+    mock_scanner, simple_yield_strategy, risk_adjusted_strategy, mock_opportunities
+):
     """Compare SimpleYield vs RiskAdjusted on same data.
 
     Verifies:
@@ -434,32 +446,24 @@ async def test_optimizer_strategy_comparison(mock_scanner, simple_yield_strategy
     - RiskAdjusted is more conservative (diversified)
     - Both generate valid recommendations
     """
-    # Setup mock scanner
-    mock_opportunities = create_mock_opportunities()
-
-    # Test with SimpleYield
+    # Both optimizers read the same scan data
     mock_scanner.scan_all_protocols.return_value = mock_opportunities
     simple_optimizer = OptimizerAgent(
         config={"dry_run_mode": True},
         scanner=mock_scanner,
         strategy=simple_yield_strategy,
     )
-
-    total_capital = Decimal("10000")
-    simple_allocation = await simple_optimizer.optimize_new_allocation(total_capital)
-
-    # Reset mock
-    mock_scanner.scan_all_protocols.reset_mock()
-    mock_scanner.scan_all_protocols.return_value = mock_opportunities
-
-    # Test with RiskAdjusted
     risk_optimizer = OptimizerAgent(
         config={"dry_run_mode": True},
         scanner=mock_scanner,
         strategy=risk_adjusted_strategy,
     )
 
-    risk_allocation = await risk_optimizer.optimize_new_allocation(total_capital)
+    total_capital = _CAPITAL_10K
+    simple_allocation, risk_allocation = await asyncio.gather(
+        simple_optimizer.optimize_new_allocation(total_capital),
+        risk_optimizer.optimize_new_allocation(total_capital),
+    )
 
     # SimpleYield should be more concentrated
     simple_protocol_count = len(simple_allocation)
@@ -12,17 +12,67 @@ Tests the complete stack:
 """
 
 import pytest
-import asyncio
+import statistics
+import time
 from decimal import Decimal
+from unittest.mock import patch
+from src.utils import web3_provider
 from src.utils.web3_provider import get_web3, check_network_health
-from src.utils.config import get_settings
+from src.utils.config import VALID_MNEMONIC_LENGTHS, get_settings
+from src.utils.networks import NetworkNotFoundError
 from src.protocols.aerodrome import AerodromeProtocol
 from src.tokens.erc20 import ERC20Token
+from tests.integration.helpers import retry_on_rpc_throttle
 
+# One case per network; the per-case xdist_group sends each probe to the
+# worker that owns that RPC target under --dist=loadgroup
+SUPPORTED_NETWORKS = [
+    pytest.param(network_id, marks=pytest.mark.xdist_group(network_id))
+    for network_id in ["base-mainnet", "base-sepolia", "arbitrum-sepolia"]
+]
 
+# Pools fetched by mainnet_pools: three for pool discovery, two elsewhere
+MAINNET_POOL_COUNT = 3
+
+
+# Async tests run on the module loop, shared with the mainnet_pools fixture
+@pytest.fixture(scope="module")
+async def mainnet_pools(w3_pool, mainnet_available):
+    """Real Aerodrome pools from Base mainnet, queried once per module.
+
+    MAINNET_POOL_COUNT is the most pools any test needs; tests that need
+    fewer slice the result. Raise the constant rather than adding another
+    pool-querying fixture.
+    """
+    if not mainnet_available:
+        pytest.skip("Base mainnet RPC unreachable")
+
+    protocol = AerodromeProtocol({
+        "network": "base-mainnet",
+        "dry_run_mode": False,
+        "aerodrome_max_pools": MAINNET_POOL_COUNT,
+        "web3": w3_pool["base-mainnet"],
+    })
+
+    return await retry_on_rpc_throttle(protocol._get_real_pools_from_mainnet)()
+
+
+@pytest.mark.xdist_group("base-mainnet")
 class TestPhase1CComplete:
     """End-to-end integration tests for complete Phase 1C stack."""
 
+    @pytest.fixture(scope="class")
+    def protocol_base_mainnet(self, w3_pool, mainnet_available):
+        """Real-data AerodromeProtocol on the pooled Base mainnet connection."""
+        if not mainnet_available:
+            pytest.skip("Base mainnet RPC unreachable")
+
+        return AerodromeProtocol({
+            "network": "base-mainnet",
+            "dry_run_mode": False,
+            "web3": w3_pool["base-mainnet"],
+        })
+
     def test_complete_configuration_loaded(self):
         """Verify complete configuration is loaded correctly."""
         config = get_settings()
@@ -44,38 +94,27 @@ class TestPhase1CComplete:
 
         # Wallet seed configured
         assert config.wallet_seed
-        assert len(config.wallet_seed.split()) in [12, 15, 18, 21, 24]
+        assert config.wallet_seed_word_count in VALID_MNEMONIC_LENGTHS
 
-    def test_all_networks_accessible(self):
+    @pytest.mark.parametrize("network_id", SUPPORTED_NETWORKS)
+    def test_all_networks_accessible(self, network_id):
         """Verify all supported networks are accessible."""
-        networks = ["base-mainnet", "base-sepolia", "arbitrum-sepolia"]
+        health = check_network_health(network_id)
 
-        for network_id in networks:
-            health = check_network_health(network_id)
-            assert health["connected"], f"{network_id} should be connected"
-            assert health["block_number"] > 0, f"{network_id} should have blocks"
+        assert health["connected"], f"{network_id} should be connected"
+        assert health["block_number"] > 0, f"{network_id} should have blocks"
 
-    @pytest.mark.asyncio
-    async def test_end_to_end_pool_discovery(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_end_to_end_pool_discovery(self, mainnet_pools):
         """Test complete pool discovery workflow."""
-        # Initialize protocol
-        protocol = AerodromeProtocol({
-            "network": "base-mainnet",
-            "dry_run_mode": False
-        })
-
-        # Query pools
-        pools = await protocol._get_real_pools_from_mainnet(max_pools=3)
-
         # Verify pools have all required data
-        assert len(pools) > 0, "Should find pools"
+        assert len(mainnet_pools) > 0, "Should find pools"
 
-        for pool in pools:
+        for pool in mainnet_pools:
             # Basic pool data
             assert pool.pool_id
             assert pool.name
             assert len(pool.tokens) == 2, "Pool should have 2 tokens"
-            assert isinstance(pool.tvl, Decimal), "TVL should be Decimal"
 
             # Metadata
             assert pool.metadata
@@ -89,9 +128,10 @@ class TestPhase1CComplete:
             assert pool.metadata["tvl_method"] == "simplified_1dollar"
             assert "Do not use for calculations" in pool.metadata["tvl_warning"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.slow
     @pytest.mark.network
+    @retry_on_rpc_throttle
     async def test_end_to_end_token_query(self):
         """Test complete token query workflow."""
         # USDC on Base mainnet
@@ -100,7 +140,8 @@ class TestPhase1CComplete:
             "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
         )
 
-        # Query metadata
+        # Query metadata in one eth_call, then read it back from the cache
+        usdc.get_metadata_batch()
         symbol = usdc.get_symbol()
         decimals = usdc.get_decimals()
         name = usdc.get_name()
@@ -114,27 +155,23 @@ class TestPhase1CComplete:
         symbol_again = usdc.get_symbol()
         assert symbol == symbol_again
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.slow
     @pytest.mark.network
-    async def test_complete_multi_network_workflow(self):
+    @retry_on_rpc_throttle
+    async def test_complete_multi_network_workflow(self, w3_pool, mainnet_pools):
         """Test workflow spanning multiple networks."""
-        # Step 1: Query pools from Base mainnet
-        protocol = AerodromeProtocol({
-            "network": "base-mainnet",
-            "dry_run_mode": False
-        })
-
-        pools = await protocol._get_real_pools_from_mainnet(max_pools=2)
-        assert len(pools) > 0, "Should find Base pools"
+        # Step 1: Pools from Base mainnet
+        assert len(mainnet_pools) > 0, "Should find Base pools"
 
-        # Step 2: Verify we can access Arbitrum Sepolia
-        w3_arb = get_web3("arbitrum-sepolia")
+        # Step 2: Verify we can access Arbitrum Sepolia. chain_id reads are
+        # served from the provider cache primed by get_web3's connection check
+        w3_arb = w3_pool["arbitrum-sepolia"]
         assert w3_arb.is_connected()
         assert w3_arb.eth.chain_id == 421614
 
         # Step 3: Verify no cross-contamination
-        w3_base = get_web3("base-mainnet")
+        w3_base = w3_pool["base-mainnet"]
         assert w3_base.eth.chain_id == 8453
         assert w3_base is not w3_arb
 
@@ -156,31 +193,24 @@ class TestPhase1CComplete:
         assert config.x402_daily_budget_usd < config.daily_spending_limit_usd, \
             "x402 budget should be subset of daily limit"
 
-    @pytest.mark.asyncio
-    async def test_tvl_safeguards_enforced(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_tvl_safeguards_enforced(self, mainnet_pools):
         """Verify TVL safeguards are enforced end-to-end."""
-        protocol = AerodromeProtocol({
-            "network": "base-mainnet",
-            "dry_run_mode": False
-        })
-
-        pools = await protocol._get_real_pools_from_mainnet(max_pools=2)
-
-        for pool in pools:
+        for pool in mainnet_pools:
             # All pools must have safeguard metadata
             assert pool.metadata.get("tvl_is_estimate") is True
             assert pool.metadata.get("tvl_method") == "simplified_1dollar"
             assert pool.metadata.get("tvl_warning")
 
-            # TVL should be Decimal
-            assert isinstance(pool.tvl, Decimal)
-
             # APY should not be calculated (placeholder)
             assert pool.apy == Decimal("0") or pool.apy is None
 
     def test_decimal_precision_throughout_stack(self):
-        """Verify Decimal precision is maintained throughout the stack."""
-        # Token amounts
+        """Verify Decimal precision is maintained throughout the stack.
+
+        The one runtime type check for token amounts; elsewhere the
+        Decimal return annotations are relied on.
+        """
         token = ERC20Token(
             "base-mainnet",
             "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
@@ -189,32 +219,19 @@ class TestPhase1CComplete:
         raw = 123456789  # 123.456789 USDC
         formatted = token.format_amount(raw)
         assert isinstance(formatted, Decimal), "Should use Decimal"
+        assert formatted == Decimal("123.456789")
 
-        # TVL calculation
-        protocol = AerodromeProtocol({
-            "network": "base-mainnet",
-            "dry_run_mode": False
-        })
-
-        tvl = protocol._estimate_tvl(1000, 2000, 18, 6)
-        assert isinstance(tvl, Decimal), "TVL should be Decimal"
-
-    @pytest.mark.asyncio
-    async def test_error_handling_throughout_stack(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    @retry_on_rpc_throttle
+    async def test_error_handling_throughout_stack(self, w3_pool, protocol_base_mainnet):
         """Verify error handling works across all components."""
         # Invalid network
-        from src.utils.networks import NetworkNotFoundError
         with pytest.raises(NetworkNotFoundError):
             get_web3("invalid-network")
 
         # Invalid contract address
-        protocol = AerodromeProtocol({
-            "network": "base-mainnet",
-            "dry_run_mode": False
-        })
-
-        w3 = get_web3("base-mainnet")
-        result = protocol._query_pool_data(w3, "0x" + "0" * 40, None)
+        w3 = w3_pool["base-mainnet"]
+        result = protocol_base_mainnet._query_pool_data(w3, "0x" + "0" * 40, None)
         assert result is None, "Invalid address should return None"
 
         # Invalid token address
@@ -228,17 +245,19 @@ class TestPhase1CComplete:
             pass
 
 
+@pytest.mark.xdist_group("base-mainnet")
 class TestPhase1CReadiness:
     """Tests specific to Phase 2 readiness."""
 
-    def test_dry_run_mode_works(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_dry_run_mode_works(self):
         """Verify dry-run mode provides fallback data."""
         protocol = AerodromeProtocol({
             "network": "base-mainnet",
             "dry_run_mode": True  # Should use mock data
         })
 
-        pools = asyncio.run(protocol.get_pools())
+        pools = await protocol.get_pools()
         assert len(pools) > 0, "Dry-run should return mock pools"
 
         for pool in pools:
@@ -247,29 +266,16 @@ class TestPhase1CReadiness:
             assert pool.name
             assert pool.tvl > 0
 
-    @pytest.mark.asyncio
-    async def test_real_data_mode_works(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_real_data_mode_works(self, mainnet_pools):
         """Verify real data mode queries blockchain."""
-        protocol = AerodromeProtocol({
-            "network": "base-mainnet",
-            "dry_run_mode": False  # Should query real data
-        })
+        if len(mainnet_pools) > 0:
+            # Real pools should have blockchain metadata
+            assert mainnet_pools[0].metadata.get("source") == "base_mainnet"
+            assert mainnet_pools[0].metadata.get("pool_address")
 
-        try:
-            pools = await protocol._get_real_pools_from_mainnet(max_pools=2)
-
-            if len(pools) > 0:
-                # Real pools should have blockchain metadata
-                assert pools[0].metadata.get("source") == "base_mainnet"
-                assert pools[0].metadata.get("pool_address")
-        except Exception as e:
-            # Rate limiting is acceptable
-            if "429" in str(e) or "timeout" in str(e).lower():
-                pytest.skip("Rate limited (acceptable)")
-            else:
-                raise
-
-    def test_phase2_prerequisites_met(self):
+    @retry_on_rpc_throttle
+    def test_phase2_prerequisites_met(self, w3_pool):
         """Verify all Phase 2 prerequisites are met."""
         # Configuration
         config = get_settings()
@@ -277,46 +283,47 @@ class TestPhase1CReadiness:
         assert config.cdp_api_key, "CDP API key required"
 
         # Networks accessible
-        w3 = get_web3("base-mainnet")
+        w3 = w3_pool["base-mainnet"]
         assert w3.is_connected(), "Base mainnet required"
 
-        # Decimal precision
-        token = ERC20Token("base-mainnet", "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913")
-        assert isinstance(token.format_amount(1000000), Decimal), \
-            "Decimal precision required"
-
         # Safety limits
         assert config.max_transaction_value_usd > 0, "Spending limits required"
         assert config.approval_threshold_usd > 0, "Approval system required"
 
 
+@pytest.mark.xdist_group("base-mainnet")
 class TestPerformanceBaseline:
     """Establish performance baselines for Phase 2 comparison."""
 
-    def test_connection_caching_effective(self):
+    @pytest.mark.parametrize("network_id", SUPPORTED_NETWORKS)
+    def test_connection_caching_effective(self, network_id):
         """Verify connection caching provides speedup."""
-        from src.utils.web3_provider import Web3Provider
-
-        # Clear cache
-        Web3Provider.clear_cache("base-mainnet")
-
-        # First connection (cold)
-        import time
-        start = time.time()
-        w3_1 = get_web3("base-mainnet")
-        w3_1.eth.block_number
-        cold_time = time.time() - start
-
-        # Second connection (cached)
-        start = time.time()
-        w3_2 = get_web3("base-mainnet")
-        w3_2.eth.block_number
-        warm_time = time.time() - start
-
-        # Cached should be significantly faster
-        assert w3_1 is w3_2, "Should use cached instance"
-        assert warm_time < cold_time, "Cached should be faster"
-
+        def timed_block_number(w3):
+            start = time.perf_counter_ns()
+            w3.eth.block_number
+            return time.perf_counter_ns() - start
+
+        # Cold reading from an empty instance cache; the shared instances are
+        # restored afterwards so other tests keep their warm connections
+        with patch.dict(web3_provider._web3_instances, clear=True):
+            start = time.perf_counter_ns()
+            w3_cold = get_web3(network_id)
+            w3_cold.eth.block_number
+            cold_ns = time.perf_counter_ns() - start
+
+        w3_1 = get_web3(network_id)
+        timed_block_number(w3_1)  # Warmup
+
+        warm_ns = []
+        for _ in range(5):
+            w3_2 = get_web3(network_id)
+            assert w3_2 is w3_1, "Should use cached instance"
+            warm_ns.append(timed_block_number(w3_2))
+
+        assert w3_cold is not w3_1
+        assert statistics.median(warm_ns) < cold_ns, "Cached should be faster"
+
+    @retry_on_rpc_throttle
     def test_token_metadata_caching_effective(self):
         """Verify token metadata caching works."""
         token = ERC20Token(
@@ -6,7 +6,8 @@ Must pass before enabling premium RPC in production.
 
 import re
 import pytest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from src.utils.config import get_settings
 from src.utils.rpc_manager import (
@@ -17,6 +18,46 @@ from src.utils.rpc_manager import (
 from src.utils.web3_provider import get_web3, _initialize_rpc_manager
 
 
+def _leak_pattern(*secrets: str) -> "re.Pattern[str]":
+    """Compile a single-pass matcher for any of the given secrets.
+
+    A secret that contains another one can only appear where the shorter
+    one does, so only the minimal needles go into the alternation.
+    """
+    needles = [s for s in secrets if not any(o != s and o in s for o in secrets)]
+    return re.compile("|".join(re.escape(needle) for needle in needles))
+
+
+# Secrets from test_no_api_keys_in_logs' config that must never be logged
+_SENSITIVE = (
+    "test_secret_key_abc123def456",  # Alchemy key
+    "abc123def456",  # Part of key
+    "secret789xyz",  # QuickNode key part
+    "test_secret_key",  # Start of key
+)
+_SENSITIVE_RE = _leak_pattern(*_SENSITIVE)
+
+# (input_url, api_key_that_should_be_hidden)
+SANITIZATION_CASES = [
+    (
+        "https://base-mainnet.g.alchemy.com/v2/abc123",
+        "abc123",
+    ),
+    (
+        "https://eth-mainnet.g.alchemy.com/v2/def456ghi789",
+        "def456ghi789",
+    ),
+    (
+        "https://node.quiknode.pro/secret_key_xyz/",
+        "secret_key_xyz",
+    ),
+    (
+        "https://rpc.example.com/very_long_api_key_123456789",
+        "very_long_api_key_123456789",
+    ),
+]
+
+
 class TestApiKeySecurity:
     """CRITICAL: Test API key security and sanitization."""
 
@@ -27,16 +68,17 @@ class TestApiKeySecurity:
         API keys could be leaked to logs, monitoring systems, or debugging output.
         """
         # Create config with test API key
-        mock_config = Mock()
-        mock_config.alchemy_api_key = "test_secret_key_abc123def456"
-        mock_config.quicknode_endpoint = "https://test.quiknode.pro/secret789xyz/"
-        mock_config.premium_rpc_enabled = True
-        mock_config.premium_rpc_percentage = 100
-        mock_config.alchemy_rate_limit_per_second = 100
-        mock_config.quicknode_rate_limit_per_second = 25
-        mock_config.public_rate_limit_per_second = 10
-        mock_config.rpc_failure_threshold = 3
-        mock_config.rpc_recovery_timeout = 60
+        mock_config = SimpleNamespace(
+            alchemy_api_key="test_secret_key_abc123def456",
+            quicknode_endpoint="https://test.quiknode.pro/secret789xyz/",
+            premium_rpc_enabled=True,
+            premium_rpc_percentage=100,
+            alchemy_rate_limit_per_second=100,
+            quicknode_rate_limit_per_second=25,
+            public_rate_limit_per_second=10,
+            rpc_failure_threshold=3,
+            rpc_recovery_timeout=60,
+        )
 
         # Clear any existing logs
         caplog.clear()
@@ -68,21 +110,12 @@ class TestApiKeySecurity:
         _ = manager.get_healthy_endpoints("base-mainnet")
 
         # CHECK ALL LOG ENTRIES
-        sensitive_strings = [
-            "test_secret_key_abc123def456",  # Alchemy key
-            "abc123def456",  # Part of key
-            "secret789xyz",  # QuickNode key part
-            "test_secret_key",  # Start of key
-        ]
-
-        for record in caplog.records:
-            message = record.getMessage()
-
-            # Check for any sensitive strings
-            for sensitive in sensitive_strings:
-                assert sensitive not in message, (
-                    f"SECURITY BREACH: Found '{sensitive}' in log message: {message}"
-                )
+        for message in caplog.messages:
+            # Check for any sensitive strings in one pass
+            match = _SENSITIVE_RE.search(message)
+            assert match is None, (
+                f"SECURITY BREACH: Found '{match.group()}' in log message: {message}"
+            )
 
             # Check that sanitized URLs are present instead
             if "alchemy" in message.lower():
@@ -108,42 +141,22 @@ class TestApiKeySecurity:
         assert "***" in sanitized
         assert "https://base-mainnet.g.alchemy.com/v2/***" == sanitized
 
-    def test_multiple_url_patterns_sanitized(self):
+    @pytest.mark.parametrize("url,secret_part", SANITIZATION_CASES)
+    def test_multiple_url_patterns_sanitized(self, url, secret_part):
         """Verify sanitization works for different URL patterns."""
-        test_cases = [
-            # (input_url, api_key_that_should_be_hidden)
-            (
-                "https://base-mainnet.g.alchemy.com/v2/abc123",
-                "abc123",
-            ),
-            (
-                "https://eth-mainnet.g.alchemy.com/v2/def456ghi789",
-                "def456ghi789",
-            ),
-            (
-                "https://node.quiknode.pro/secret_key_xyz/",
-                "secret_key_xyz",
-            ),
-            (
-                "https://rpc.example.com/very_long_api_key_123456789",
-                "very_long_api_key_123456789",
-            ),
-        ]
-
-        for url, secret_part in test_cases:
-            endpoint = RpcEndpoint(
-                url=url,
-                priority=EndpointPriority.PREMIUM,
-                provider="test",
-                network_id="test-network",
-            )
+        endpoint = RpcEndpoint(
+            url=url,
+            priority=EndpointPriority.PREMIUM,
+            provider="test",
+            network_id="test-network",
+        )
 
-            sanitized = endpoint.get_sanitized_url()
+        sanitized = endpoint.get_sanitized_url()
 
-            assert secret_part not in sanitized, (
-                f"Secret '{secret_part}' found in sanitized URL: {sanitized}"
-            )
-            assert "***" in sanitized
+        assert secret_part not in sanitized, (
+            f"Secret '{secret_part}' found in sanitized URL: {sanitized}"
+        )
+        assert "***" in sanitized
 
     def test_no_keys_in_error_messages(self, caplog):
         """Verify API keys don't appear in error messages."""
@@ -162,10 +175,9 @@ class TestApiKeySecurity:
         endpoint.record_failure()
 
         # Check all log entries
-        for record in caplog.records:
-            message = record.getMessage()
-            assert "secret_error_test_123" not in message
-            assert "secret_error_test" not in message
+        sensitive_re = _leak_pattern("secret_error_test_123", "secret_error_test")
+        for message in caplog.messages:
+            assert sensitive_re.search(message) is None, message
 
     def test_no_keys_in_repr_or_str(self):
         """Verify API keys don't appear in string representations."""
@@ -190,13 +202,14 @@ class TestPremiumRpcIntegration:
 
     def test_rpc_manager_initialization_without_premium(self):
         """Verify RPC manager works without premium credentials."""
-        mock_config = Mock()
-        mock_config.alchemy_api_key = None
-        mock_config.quicknode_endpoint = None
-        mock_config.premium_rpc_enabled = False
-        mock_config.premium_rpc_percentage = 0
-        mock_config.rpc_failure_threshold = 3
-        mock_config.rpc_recovery_timeout = 60
+        mock_config = SimpleNamespace(
+            alchemy_api_key=None,
+            quicknode_endpoint=None,
+            premium_rpc_enabled=False,
+            premium_rpc_percentage=0,
+            rpc_failure_threshold=3,
+            rpc_recovery_timeout=60,
+        )
 
         # Should initialize successfully
         manager = RpcManager(mock_config)
@@ -206,10 +219,11 @@ class TestPremiumRpcIntegration:
 
     def test_fallback_to_public_when_premium_unavailable(self):
         """Verify system falls back to public RPC when premium unavailable."""
-        mock_config = Mock()
-        mock_config.premium_rpc_enabled = False
-        mock_config.rpc_failure_threshold = 3
-        mock_config.rpc_recovery_timeout = 60
+        mock_config = SimpleNamespace(
+            premium_rpc_enabled=False,
+            rpc_failure_threshold=3,
+            rpc_recovery_timeout=60,
+        )
 
         manager = RpcManager(mock_config)
 
@@ -231,29 +245,28 @@ class TestPremiumRpcIntegration:
 
     def test_gradual_rollout_respects_percentage(self):
         """Verify gradual rollout percentage is respected."""
-        mock_config = Mock()
-        mock_config.premium_rpc_enabled = True
-        mock_config.premium_rpc_percentage = 0  # 0% should never use premium
+        mock_config = SimpleNamespace(
+            premium_rpc_enabled=True,
+            premium_rpc_percentage=0,  # 0% should never use premium
+        )
 
         manager = RpcManager(mock_config)
 
         # Test 100 times
-        for _ in range(100):
-            assert not manager.should_use_premium()
+        assert not any(manager.should_use_premium() for _ in range(100))
 
-        # Now test 100%
+        # Now test 100%; the manager reads the percentage on each call
         mock_config.premium_rpc_percentage = 100
-        manager = RpcManager(mock_config)
 
         # Should always use premium
-        for _ in range(100):
-            assert manager.should_use_premium()
+        assert all(manager.should_use_premium() for _ in range(100))
 
     def test_circuit_breaker_integration(self):
         """Verify circuit breaker is created for each endpoint."""
-        mock_config = Mock()
-        mock_config.rpc_failure_threshold = 3
-        mock_config.rpc_recovery_timeout = 60
+        mock_config = SimpleNamespace(
+            rpc_failure_threshold=3,
+            rpc_recovery_timeout=60,
+        )
 
         manager = RpcManager(mock_config)
 
@@ -279,9 +292,10 @@ class TestRealWorldScenarios:
 
     def test_multiple_networks_isolated(self):
         """Verify different networks have isolated endpoint lists."""
-        mock_config = Mock()
-        mock_config.rpc_failure_threshold = 3
-        mock_config.rpc_recovery_timeout = 60
+        mock_config = SimpleNamespace(
+            rpc_failure_threshold=3,
+            rpc_recovery_timeout=60,
+        )
 
         manager = RpcManager(mock_config)
 
@@ -313,9 +327,10 @@ class TestRealWorldScenarios:
 
     def test_usage_tracking_across_requests(self):
         """Verify usage is tracked correctly across multiple requests."""
-        mock_config = Mock()
-        mock_config.rpc_failure_threshold = 3
-        mock_config.rpc_recovery_timeout = 60
+        mock_config = SimpleNamespace(
+            rpc_failure_threshold=3,
+            rpc_recovery_timeout=60,
+        )
 
         manager = RpcManager(mock_config)
 
@@ -326,21 +341,21 @@ class TestRealWorldScenarios:
             network_id="base-mainnet",
         )
 
-        # Simulate multiple requests
-        for i in range(10):
-            success = i < 8  # 8 successes, 2 failures
-            manager.usage_tracker.record_request(alchemy_endpoint, success=success)
+        # Simulate multiple requests: 8 successes, 2 failures
+        manager.usage_tracker.record_requests(alchemy_endpoint, 8, 2)
 
         summary = manager.usage_tracker.get_daily_summary()
 
         assert summary["premium_requests"] == 10
         assert summary["total_requests"] == 10
+        assert manager.usage_tracker.daily_failures["alchemy_premium"] == 2
 
     def test_endpoint_priority_with_health_status(self):
         """Verify unhealthy premium endpoints don't block public access."""
-        mock_config = Mock()
-        mock_config.rpc_failure_threshold = 3
-        mock_config.rpc_recovery_timeout = 60
+        mock_config = SimpleNamespace(
+            rpc_failure_threshold=3,
+            rpc_recovery_timeout=60,
+        )
 
         manager = RpcManager(mock_config)
 
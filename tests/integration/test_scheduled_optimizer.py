@@ -12,6 +12,7 @@ Uses MockProtocolSimulator for safe, predictable testing.
 
 import pytest
 import asyncio
+import io
 from decimal import Decimal
 from typing import Dict
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -36,7 +37,11 @@ logger = get_logger(__name__)
 class TestScheduledOptimizer:
     """Test suite for ScheduledOptimizer autonomous operation."""
 
-    @pytest.fixture
+    # Read-only fixtures are module-scoped so the scheduler tests share
+    # one set of agents instead of rebuilding them per test. Tests must not
+    # mutate them (patch.object restores what it replaces).
+
+    @pytest.fixture(scope="module")
     def config(self) -> Dict:
         """Create test configuration."""
         return {
@@ -62,11 +67,15 @@ class TestScheduledOptimizer:
             "min_profit_usd": Decimal("5"),
         }
 
+    @pytest.fixture(scope="session")
+    def price_oracle(self):
+        """Create the mock price oracle shared by every fixture."""
+        return create_price_oracle("mock")
+
     @pytest.fixture
-    async def wallet_manager(self, config):
+    def wallet_manager(self, config, price_oracle):
         """Create wallet manager for testing."""
-        oracle = create_price_oracle("mock")
-        wallet = WalletManager(config=config, price_oracle=oracle)
+        wallet = WalletManager(config=config, price_oracle=price_oracle)
         return wallet
 
     @pytest.fixture
@@ -74,61 +83,59 @@ class TestScheduledOptimizer:
         """Create mock protocol executor."""
         return MockProtocolSimulator()
 
-    @pytest.fixture
-    async def gas_estimator(self, config):
+    @pytest.fixture(scope="module")
+    def gas_estimator(self, config, price_oracle):
         """Create gas estimator."""
-        oracle = create_price_oracle("mock")
         return GasEstimator(
             network=config["network"],
-            price_oracle=oracle,
+            price_oracle=price_oracle,
             cache_ttl_seconds=300,
         )
 
     @pytest.fixture
-    async def rebalance_executor(
+    def rebalance_executor(
         self,
         wallet_manager,
         mock_protocol_executor,
         gas_estimator,
         config,
+        price_oracle,
     ):
         """Create rebalance executor."""
-        oracle = create_price_oracle("mock")
         return RebalanceExecutor(
             wallet_manager=wallet_manager,
             protocol_executor=mock_protocol_executor,
             gas_estimator=gas_estimator,
-            price_oracle=oracle,
+            price_oracle=price_oracle,
             config=config,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def yield_scanner(self, config):
         """Create yield scanner."""
         return YieldScannerAgent(config)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def simple_strategy(self, config):
         """Create simple yield strategy."""
         return SimpleYieldStrategy(config)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def risk_assessor(self, config):
         """Create risk assessor."""
         return RiskAssessorAgent(config)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def optimizer(self, config, yield_scanner, simple_strategy):
         """Create optimizer agent."""
         return OptimizerAgent(config, yield_scanner, simple_strategy)
 
-    @pytest.fixture
-    async def profitability_calc(self, config):
+    @pytest.fixture(scope="module")
+    def profitability_calc(self, config, price_oracle):
         """Create profitability calculator."""
-        oracle = create_price_oracle("mock")
         gas_estimator = GasEstimator(
             network=config["network"],
-            price_oracle=oracle,
+            price_oracle=price_oracle,
         )
         return ProfitabilityCalculator(
             min_annual_gain_usd=config["min_annual_gain_usd"],
@@ -149,7 +156,7 @@ class TestScheduledOptimizer:
         profitability_calc,
     ):
         """Create scheduled optimizer."""
-        audit_logger = AuditLogger(log_file="test_audit.log")
+        audit_logger = AuditLogger(log_file=io.StringIO())
 
         scheduler = ScheduledOptimizer(
             config=config,
@@ -188,8 +195,7 @@ class TestScheduledOptimizer:
 
         logger.info("✅ Start/stop scheduler test passed!")
 
-    @pytest.mark.asyncio
-    async def test_get_status(self, scheduled_optimizer):
+    def test_get_status(self, scheduled_optimizer):
         """Test status reporting."""
         status = scheduled_optimizer.get_status()
 
@@ -381,14 +387,15 @@ class TestScheduledOptimizer:
                 # Start scheduler
                 await scheduled_optimizer.start()
 
-                # Wait briefly for one cycle
-                await asyncio.sleep(0.5)
+                # Wait for the first cycle to finish
+                await asyncio.wait_for(
+                    scheduled_optimizer._cycle_complete_event.wait(), timeout=2
+                )
 
                 # Stop scheduler
                 await scheduled_optimizer.stop()
 
-                # Should have executed at least one scan
-                # (Note: might be 0 if test runs too fast, that's ok)
+                assert scheduled_optimizer.status.total_scans >= 1
                 logger.info(f"Total scans: {scheduled_optimizer.status.total_scans}")
 
         logger.info("✅ Scheduled execution test passed!")
@@ -473,7 +480,7 @@ class TestScheduledOptimizer:
         database = Database("sqlite:///:memory:")
         database.create_all_tables()
 
-        audit_logger = AuditLogger(log_file="test_audit.log")
+        audit_logger = AuditLogger(log_file=io.StringIO())
         scheduler = ScheduledOptimizer(
             config=config,
             yield_scanner=yield_scanner,
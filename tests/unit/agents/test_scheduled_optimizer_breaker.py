@@ -1,10 +1,11 @@
 """Unit tests for ScheduledOptimizer resilience (WS3).
 
 Covers the circuit breaker (trip after N failed cycles, subsequent cycles
-skipped with one alert, heartbeat written) and the stranded-funds recovery
-bypass of the minimum-profit gate.
+skipped with one alert, heartbeat written), the stranded-funds recovery
+bypass of the minimum-profit gate, and the scheduled-scan completion signal.
 """
 
+import asyncio
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
@@ -142,3 +143,16 @@ class TestRecoveryDeployable:
             confidence=80,
         )
         assert await opt._is_recovery_deployable(rec) is False
+
+
+class TestScheduleLoop:
+    async def test_cycle_complete_event_set_after_scan(self, tmp_path):
+        opt = _optimizer(tmp_path)
+        opt._execute_optimization_cycle = AsyncMock(return_value=[])
+
+        await opt.start()
+        await asyncio.wait_for(opt._cycle_complete_event.wait(), timeout=2)
+        await opt.stop()
+
+        assert opt.status.total_scans == 1
+        opt._execute_optimization_cycle.assert_awaited_once()
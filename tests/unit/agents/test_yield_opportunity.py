@@ -0,0 +1,21 @@
+"""Unit tests for YieldOpportunity."""
+
+from decimal import Decimal
+
+from src.agents.yield_scanner import YieldOpportunity
+
+
+def test_upper_tokens_tracks_token_reassignment():
+    opp = YieldOpportunity(
+        protocol="Aerodrome",
+        pool_id="usdc-weth",
+        pool_name="USDC/WETH",
+        apy=Decimal("5.0"),
+        tvl=Decimal(1_000_000),
+        tokens=["usdc", "WETH"],
+    )
+
+    assert opp.upper_tokens == frozenset({"USDC", "WETH"})
+
+    opp.tokens = ["cbBTC"]
+    assert opp.upper_tokens == frozenset({"CBBTC"})
@@ -0,0 +1,148 @@
+"""Offline unit tests for GasEstimator.
+
+The Web3 instance is mocked so these run without an RPC connection; the
+network-backed scenarios live in tests/integration/test_gas_estimation.py.
+"""
+
+from decimal import Decimal
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from web3.datastructures import AttributeDict
+
+from src.blockchain.gas_estimator import GasEstimator
+from src.data.oracles import MockPriceOracle
+
+RECIPIENT = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
+
+
+@pytest.fixture
+def mock_w3():
+    """Mock Web3 with an EIP-1559 latest block and a fixed gas estimate."""
+    w3 = MagicMock()
+    w3.eth.get_block.return_value = AttributeDict({"baseFeePerGas": 1_000_000})
+    w3.eth.estimate_gas.return_value = 21000
+    w3.eth.max_priority_fee = 1_000_000
+    w3.to_wei.side_effect = lambda value, unit: int(value * 10**9) if unit == "gwei" else int(value * 10**18)
+    w3.from_wei.side_effect = lambda value, unit: Decimal(value) / (10**9 if unit == "gwei" else 10**18)
+    return w3
+
+
+@pytest.fixture
+def estimator(mock_w3):
+    """GasEstimator backed by the mock Web3."""
+    return GasEstimator(network="base-sepolia", price_oracle=MockPriceOracle(), web3=mock_w3)
+
+
+def test_injected_web3_skips_provider_lookup(mock_w3):
+    with patch("src.blockchain.gas_estimator.get_web3") as mock_get_web3:
+        estimator = GasEstimator(
+            network="base-sepolia", price_oracle=MockPriceOracle(), web3=mock_w3
+        )
+
+    assert estimator.w3 is mock_w3
+    mock_get_web3.assert_not_called()
+
+
+class TestPrefetchTxContext:
+    @pytest.mark.asyncio
+    async def test_single_batch_round_trip(self, estimator, mock_w3):
+        batch = mock_w3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [2_000_000, 7, 10**18]
+
+        context = await estimator.prefetch_tx_context(RECIPIENT)
+
+        assert context == {"gas_price": 2_000_000, "nonce": 7, "balance": 10**18}
+        assert batch.add.call_count == 3
+        batch.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_until_invalidated(self, estimator, mock_w3):
+        batch = mock_w3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [2_000_000, 7, 10**18]
+
+        await estimator.prefetch_tx_context(RECIPIENT)
+        await estimator.prefetch_tx_context(RECIPIENT.lower())
+        assert batch.execute.call_count == 1
+
+        estimator.invalidate_tx_context(RECIPIENT)
+        await estimator.prefetch_tx_context(RECIPIENT)
+        assert batch.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_batch_support(self, estimator, mock_w3):
+        mock_w3.batch_requests.side_effect = Exception("batching not supported")
+        mock_w3.eth.gas_price = 3_000_000
+        mock_w3.eth.get_transaction_count.return_value = 4
+        mock_w3.eth.get_balance.return_value = 5
+
+        context = await estimator.prefetch_tx_context(RECIPIENT)
+
+        assert context == {"gas_price": 3_000_000, "nonce": 4, "balance": 5}
+
+    @pytest.mark.asyncio
+    async def test_gas_price_cap_enforced(self, estimator, mock_w3):
+        batch = mock_w3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [100 * 10**9, 0, 0]
+        mock_w3.from_wei.return_value = 100
+        estimator.max_gas_price_gwei = 50
+
+        with pytest.raises(ValueError, match="exceeds maximum"):
+            await estimator.prefetch_tx_context(RECIPIENT)
+
+
+class TestBufferTiers:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "data,expected_buffer",
+        [
+            ("0x", 1.30),
+            ("0x" + "0" * 97, 1.30),
+            ("0x" + "0" * 98, 1.50),
+            ("0x" + "0" * 497, 1.50),
+            ("0x" + "0" * 498, 2.00),
+        ],
+    )
+    async def test_tier_boundaries(self, estimator, data, expected_buffer):
+        gas = await estimator.estimate_gas(to=RECIPIENT, data=data)
+
+        assert gas == int(21000 * expected_buffer)
+
+    @pytest.mark.asyncio
+    async def test_bytes_calldata_matches_hex(self, estimator, mock_w3):
+        calldata = bytes.fromhex("a9059cbb" + "00" * 64)
+
+        from_bytes = await estimator.estimate_gas(to=RECIPIENT, data=calldata)
+        estimator.clear_cache()
+        from_hex = await estimator.estimate_gas(to=RECIPIENT, data="0x" + calldata.hex())
+
+        assert from_bytes == from_hex == int(21000 * 1.50)
+        assert mock_w3.eth.estimate_gas.call_args_list[0].args[0]["data"] == calldata
+
+
+class TestEstimateTransactionCost:
+    @pytest.mark.asyncio
+    async def test_single_oracle_lookup_and_exact_totals(self, estimator):
+        estimator.price_oracle = MagicMock()
+        estimator.price_oracle.get_price = AsyncMock(return_value=Decimal("3000"))
+
+        cost = await estimator.estimate_transaction_cost(to=RECIPIENT, value=10**16)
+
+        # 21000 * 1.2 gas at (1_000_000 base + 1_000_000 priority) wei
+        gas_cost_wei = 25200 * 2_000_000
+        assert cost["gas_cost_eth"] == Decimal(gas_cost_wei) / Decimal(10**18)
+        assert cost["total_value_eth"] == Decimal(10**16 + gas_cost_wei) / Decimal(10**18)
+        assert cost["gas_cost_usd"] == cost["gas_cost_eth"] * 3000
+        assert cost["total_cost_usd"] == cost["total_value_eth"] * 3000
+        estimator.price_oracle.get_price.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_oracle_failure_falls_back_to_eth(self, estimator):
+        estimator.price_oracle = MagicMock()
+        estimator.price_oracle.get_price = AsyncMock(side_effect=Exception("oracle down"))
+
+        cost = await estimator.estimate_transaction_cost(to=RECIPIENT, value=1)
+
+        assert cost["gas_cost_usd"] == cost["gas_cost_eth"]
+        assert cost["total_cost_usd"] == cost["gas_cost_eth"]
@@ -0,0 +1,34 @@
+"""Unit tests for ChainMonitor Web3 sharing."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.blockchain.monitor import ChainMonitor
+
+WALLET = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.mark.asyncio
+async def test_injected_web3_is_reused():
+    """Test an injected Web3 instance is used instead of get_web3()."""
+    shared_w3 = MagicMock()
+    shared_w3.eth.block_number = 42
+
+    monitor = ChainMonitor({"network": "base-sepolia"}, WALLET, web3=shared_w3)
+
+    with patch("src.blockchain.monitor.get_web3") as mock_get_web3:
+        assert await monitor.get_block_number() == 42
+        mock_get_web3.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_cached_web3():
+    """Test the monitor resolves the cached per-network instance by default."""
+    cached_w3 = MagicMock()
+    cached_w3.eth.block_number = 7
+
+    monitor = ChainMonitor({"network": "base-sepolia"}, WALLET)
+
+    with patch("src.blockchain.monitor.get_web3", return_value=cached_w3) as mock_get_web3:
+        assert await monitor.get_block_number() == 7
+        mock_get_web3.assert_called_once_with("base-sepolia")
@@ -5,6 +5,7 @@ from decimal import Decimal
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from src.blockchain.wallet import WalletManager
 from src.security.audit import AuditEventType
+from src.utils.networks import NetworkNotFoundError
 
 
 @pytest.fixture
@@ -64,6 +65,17 @@ async def test_wallet_initialization_live_mode(mock_config):
     assert wallet_manager.dry_run_mode is False
 
 
+def test_unknown_network_rejected_at_construction(mock_config):
+    """Test an unsupported network fails before any provider setup."""
+    mock_config["network"] = "invalid-network"
+
+    with patch("src.blockchain.wallet.SpendingLimits") as spending_limits:
+        with pytest.raises(NetworkNotFoundError):
+            WalletManager(mock_config)
+
+    spending_limits.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_initialize_skipped_without_credentials():
     """Test that initialization requires proper config."""
@@ -72,6 +84,27 @@ async def test_initialize_skipped_without_credentials():
     pass
 
 
+@pytest.mark.asyncio
+async def test_local_wallet_rejects_invalid_private_key():
+    """Test a malformed wallet_private_key is rejected like an invalid seed."""
+    wallet_manager = WalletManager(
+        {"use_local_wallet": True, "wallet_private_key": "0x1234", "network": "base-sepolia"}
+    )
+
+    with patch("src.blockchain.wallet.get_web3"):
+        with pytest.raises(ValueError, match="Invalid private key"):
+            await wallet_manager._initialize_local_wallet()
+
+
+@pytest.mark.asyncio
+async def test_local_wallet_requires_seed_or_private_key():
+    """Test the missing-credentials error names both options."""
+    wallet_manager = WalletManager({"use_local_wallet": True, "network": "base-sepolia"})
+
+    with pytest.raises(ValueError, match="WALLET_SEED.*wallet_private_key"):
+        await wallet_manager._initialize_local_wallet()
+
+
 @pytest.mark.asyncio
 async def test_get_balance_without_initialization():
     """Test getting balance before wallet initialization raises error."""
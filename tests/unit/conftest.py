@@ -16,6 +16,7 @@ regardless of what the developer has configured locally.
 import pytest
 
 import src.utils.config as config_module
+from src.tokens import metadata_cache
 from src.utils.config import Settings
 
 # A valid 12-word BIP39 mnemonic (passes the word-count validator in
@@ -48,6 +49,7 @@ def mammon_test_env(request, monkeypatch):
       secrets (fields not set here fall back to their in-code defaults).
     - Sets a complete set of required env vars so ``Settings()`` constructs
       cleanly wherever code calls ``get_settings()``.
+    - Disables the on-disk ERC20 token metadata cache.
     - Resets the cached settings singleton before and after each test so a
       ``Settings`` instance built by one test cannot leak into another.
 
@@ -68,6 +70,10 @@ def mammon_test_env(request, monkeypatch):
             continue
         monkeypatch.setenv(key, value)
 
+    # Never read or write the developer's on-disk token metadata cache.
+    monkeypatch.setattr(metadata_cache, "DEFAULT_CACHE_PATH", None)
+    monkeypatch.delenv(metadata_cache.CACHE_PATH_ENV, raising=False)
+
     # Ensure no cached Settings leaks in from a prior test or import.
     monkeypatch.setattr(config_module, "_settings", None, raising=False)
     yield
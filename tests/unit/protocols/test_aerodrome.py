@@ -2,7 +2,44 @@
 
 import pytest
 from decimal import Decimal
+from unittest.mock import patch
+
+from eth_abi import decode, encode
+from web3 import Web3
+
+from src.data.oracles import MockPriceOracle
 from src.protocols.aerodrome import AerodromeProtocol, AERODROME_CONTRACTS
+from tests.fake_chain import FakeChainProvider
+
+FACTORY = AERODROME_CONTRACTS["base-mainnet"]["factory"]
+WETH = "0x4200000000000000000000000000000000000006"
+USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+POOLS = [
+    "0x1111111111111111111111111111111111111111",
+    "0x2222222222222222222222222222222222222222",
+]
+
+
+def _fake_aerodrome_chain() -> FakeChainProvider:
+    """Base mainnet chain with an Aerodrome factory, two pools and their tokens."""
+    chain = FakeChainProvider(chain_id=8453)
+    pool_metadata = encode(
+        ["uint256", "uint256", "uint256", "uint256", "bool", "address", "address"],
+        [10**18, 10**6, 2 * 10**18, 6000 * 10**6, False, WETH, USDC],
+    )
+    chain.add_call(FACTORY, "allPoolsLength()", encode(["uint256"], [2]))
+    chain.add_call(
+        FACTORY,
+        "allPools(uint256)",
+        lambda args: encode(["address"], [POOLS[decode(["uint256"], args)[0]]]),
+    )
+    chain.add_call(FACTORY, "getFee(address,bool)", encode(["uint256"], [30]))
+    chain.add_call(WETH, "symbol()", encode(["string"], ["WETH"]))
+    chain.add_call(USDC, "symbol()", encode(["string"], ["USDC"]))
+    for pool in POOLS:
+        chain.add_call(pool, "metadata()", pool_metadata)
+        chain.add_call(pool, "name()", encode(["string"], ["vAMM-WETH/USDC"]))
+    return chain
 
 
 @pytest.fixture
@@ -275,3 +312,72 @@ async def test_contract_addresses_base_sepolia():
     assert "factory" in contracts
     # Sepolia uses mock addresses for Phase 1B
     assert contracts["router"] is not None
+
+
+@pytest.mark.asyncio
+async def test_factory_pools_fetched_with_multicall():
+    """Test factory pool discovery uses a fixed number of eth_calls."""
+    chain = _fake_aerodrome_chain()
+    aerodrome = AerodromeProtocol(
+        {
+            "network": "base-mainnet",
+            "dry_run_mode": False,
+            "price_oracle": MockPriceOracle(),
+            "aerodrome_use_bitquery": False,
+        }
+    )
+
+    with patch("src.protocols.aerodrome.get_web3", return_value=Web3(chain)):
+        pools = await aerodrome._get_real_pools_from_mainnet()
+
+    assert [pool.pool_id for pool in pools] == ["aero-weth-usdc", "aero-weth-usdc"]
+    assert pools[0].name == "vAMM-WETH/USDC"
+    assert pools[0].tvl == Decimal("2") * Decimal("3000.00") + Decimal("6000")
+    assert pools[0].metadata["source"] == "base_mainnet"
+    assert pools[0].metadata["token0"] == WETH
+    assert pools[0].metadata["fee_percent"] == str(Decimal(30) / Decimal(10000))
+    # allPoolsLength + allPools batch + metadata/name batch + symbol/fee batch
+    assert chain.calls["eth_call"] == 4
+
+
+@pytest.mark.asyncio
+async def test_factory_pools_fall_back_when_multicall_fails():
+    """Test pools are queried one by one when Multicall3 itself fails."""
+    chain = _fake_aerodrome_chain()
+    chain.multicall_fails = True
+    aerodrome = AerodromeProtocol(
+        {
+            "network": "base-mainnet",
+            "dry_run_mode": False,
+            "price_oracle": MockPriceOracle(),
+            "aerodrome_use_bitquery": False,
+            "web3": Web3(chain),
+        }
+    )
+
+    pools = await aerodrome._get_real_pools_from_mainnet()
+
+    assert [pool.pool_id for pool in pools] == ["aero-weth-usdc", "aero-weth-usdc"]
+    assert pools[0].name == "vAMM-WETH/USDC"
+    assert pools[0].metadata["fee_percent"] == str(Decimal(30) / Decimal(10000))
+
+
+@pytest.mark.asyncio
+async def test_shared_web3_from_config_is_used():
+    """Test a Web3 instance passed in config replaces the get_web3 lookup."""
+    chain = _fake_aerodrome_chain()
+    aerodrome = AerodromeProtocol(
+        {
+            "network": "base-mainnet",
+            "dry_run_mode": False,
+            "price_oracle": MockPriceOracle(),
+            "aerodrome_use_bitquery": False,
+            "web3": Web3(chain),
+        }
+    )
+
+    with patch("src.protocols.aerodrome.get_web3", side_effect=AssertionError("not shared")):
+        pools = await aerodrome._get_real_pools_from_mainnet()
+
+    assert len(pools) == 2
+    assert chain.calls["eth_call"] == 4
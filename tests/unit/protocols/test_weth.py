@@ -0,0 +1,153 @@
+"""Unit tests for WETH protocol integration."""
+
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from web3 import Web3
+
+from src.protocols.weth import (
+    WETHProtocol,
+    WETH_ADDRESSES,
+    BALANCE_CACHE_BLOCKS,
+    DEPOSIT_CALLDATA,
+    WITHDRAW_SELECTOR,
+    WETH_ABI,
+    encode_withdraw_calldata,
+)
+
+ACCOUNT = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb0"
+
+
+@pytest.fixture
+def mock_web3():
+    """Mock Web3 instance with a controllable block number."""
+    mock_w3 = MagicMock()
+    mock_w3.to_checksum_address.side_effect = lambda addr: addr
+    mock_w3.eth.block_number = 100
+    mock_w3.eth.gas_price = 1_000_000_000
+    mock_w3.eth.get_transaction_count.return_value = 7
+    mock_w3.eth.chain_id = 84532
+    return mock_w3
+
+
+@pytest.fixture
+def weth(mock_web3):
+    """WETH protocol on Base Sepolia backed by the mock Web3."""
+    protocol = WETHProtocol(mock_web3, "base-sepolia")
+    protocol.weth_contract = MagicMock()
+    protocol.weth_contract.functions.balanceOf.return_value.call.return_value = 10**18
+    return protocol
+
+
+def _balance_calls(weth):
+    return weth.weth_contract.functions.balanceOf.return_value.call.call_count
+
+
+def test_unsupported_network_rejected(mock_web3):
+    """Test unknown networks raise ValueError."""
+    with pytest.raises(ValueError, match="not supported"):
+        WETHProtocol(mock_web3, "ethereum-mainnet")
+
+
+def test_weth_balance_converted_to_eth(weth):
+    """Test balanceOf result is converted from wei."""
+    assert weth.get_weth_balance(ACCOUNT) == Decimal("1")
+    weth.weth_contract.functions.balanceOf.return_value.call.assert_called_once_with(
+        block_identifier=100
+    )
+
+
+def test_weth_balance_cached_within_block(weth):
+    """Test repeated balance reads in the same block skip the eth_call."""
+    weth.get_weth_balance(ACCOUNT)
+    weth.get_weth_balance(ACCOUNT)
+
+    assert _balance_calls(weth) == 1
+
+
+def test_weth_balance_refetched_on_new_block(weth, mock_web3):
+    """Test a new block invalidates the cached balance."""
+    weth.get_weth_balance(ACCOUNT)
+    mock_web3.eth.block_number = 101
+    weth.get_weth_balance(ACCOUNT)
+
+    assert _balance_calls(weth) == 2
+
+
+def test_weth_balance_cache_evicts_old_blocks(weth, mock_web3):
+    """Test only the most recent blocks are retained."""
+    for block in range(100, 100 + BALANCE_CACHE_BLOCKS + 2):
+        mock_web3.eth.block_number = block
+        weth.get_weth_balance(ACCOUNT)
+
+    cached_blocks = {block for _, block in weth._balance_cache}
+    assert len(cached_blocks) == BALANCE_CACHE_BLOCKS
+    assert min(cached_blocks) == 100 + 2
+
+
+def test_weth_addresses_known_networks():
+    """Test Base networks use the canonical predeploy address."""
+    assert WETH_ADDRESSES["base-mainnet"] == "0x4200000000000000000000000000000000000006"
+    assert WETH_ADDRESSES["base-sepolia"] == "0x4200000000000000000000000000000000000006"
+
+
+def test_precomputed_selectors_match_abi():
+    """Test the hard-coded selectors match keccak of the signatures."""
+    assert DEPOSIT_CALLDATA == "0x" + Web3.keccak(text="deposit()")[:4].hex()
+    assert WITHDRAW_SELECTOR == "0x" + Web3.keccak(text="withdraw(uint256)")[:4].hex()
+
+
+def test_withdraw_calldata_matches_abi_encoding():
+    """Test manual withdraw encoding equals web3's contract encoding."""
+    contract = Web3().eth.contract(abi=WETH_ABI)
+    amount_wei = 123456789012345678
+
+    expected = contract.encode_abi("withdraw", args=[amount_wei])
+
+    assert encode_withdraw_calldata(amount_wei) == expected
+
+
+def test_build_wrap_transaction_uses_constant_calldata(weth):
+    """Test wrap transaction carries the deposit selector and value."""
+    tx = weth.build_wrap_transaction(ACCOUNT, Decimal("0.001"))
+
+    assert tx["data"] == DEPOSIT_CALLDATA
+    assert tx["value"] == 10**15
+    assert tx["to"] == weth.weth_address
+    assert tx["nonce"] == 7
+    assert tx["chainId"] == 84532
+    weth.weth_contract.functions.deposit.assert_not_called()
+
+
+def test_build_unwrap_transaction_encodes_amount(weth):
+    """Test unwrap transaction appends the padded amount."""
+    tx = weth.build_unwrap_transaction(ACCOUNT, Decimal("0.001"))
+
+    assert tx["data"] == encode_withdraw_calldata(10**15)
+    assert tx["value"] == 0
+    assert len(tx["data"]) == 2 + 2 * (4 + 32)
+
+
+def test_build_wrap_transaction_uses_prefetched_context(weth, mock_web3):
+    """Test a prefetched tx context replaces the nonce/gas price RPCs."""
+    tx = weth.build_wrap_transaction(
+        ACCOUNT, Decimal("0.001"), tx_context={"gas_price": 5, "nonce": 11, "balance": 0}
+    )
+
+    assert tx["gasPrice"] == 5
+    assert tx["nonce"] == 11
+    mock_web3.eth.get_transaction_count.assert_not_called()
+
+
+def test_build_wrap_transaction_batches_gas_price_and_nonce(weth, mock_web3):
+    """Test gas price and nonce are fetched in a single JSON-RPC batch."""
+    batch = mock_web3.batch_requests.return_value.__enter__.return_value
+    batch.execute.return_value = [3, 9]
+
+    tx = weth.build_wrap_transaction(ACCOUNT, Decimal("0.001"))
+
+    assert tx["gasPrice"] == 3
+    assert tx["nonce"] == 9
+    assert batch.add.call_count == 2
+    batch.execute.assert_called_once()
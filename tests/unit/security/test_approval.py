@@ -117,6 +117,28 @@ class TestApprovalRequest:
 
         assert request.from_protocol == "aerodrome"
 
+    def test_display_message_cached_until_field_changes(self):
+        """Test the rendered message is reused until a displayed field changes."""
+        request = ApprovalRequest(
+            request_id="test-123",
+            transaction_type="transfer",
+            amount_usd=Decimal("1000.00"),
+            from_protocol=None,
+            to_protocol="base-sepolia",
+            rationale="Test transfer",
+        )
+
+        first = request.get_display_message()
+        assert request.display_message is first
+
+        request.status = ApprovalStatus.APPROVED
+        assert request.display_message is first
+
+        request.gas_cost_usd = Decimal("5")
+        updated = request.display_message
+        assert updated is not first
+        assert "TOTAL COST: $1,005.00" in updated
+
 
 class TestApprovalManager:
     """Test ApprovalManager class."""
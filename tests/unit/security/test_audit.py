@@ -0,0 +1,97 @@
+"""Unit tests for AuditLogger writes: unbuffered, buffered and to a stream."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.security.audit import (
+    AUDIT_BATCH_SIZE,
+    AuditEventType,
+    AuditLogger,
+    AuditSeverity,
+)
+
+
+async def _log(audit_logger, count):
+    for i in range(count):
+        await audit_logger.log_event(
+            event_type=AuditEventType.RPC_REQUEST,
+            severity=AuditSeverity.INFO,
+            message=f"event {i}",
+        )
+
+
+def _messages(log_file):
+    return [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+
+
+async def test_unbuffered_event_written_before_log_event_returns(tmp_path):
+    log_file = tmp_path / "audit.log"
+    audit_logger = AuditLogger(log_file=str(log_file))
+
+    await _log(audit_logger, 1)
+
+    assert _messages(log_file) == ["event 0"]
+    await audit_logger.close()  # No-op
+
+
+async def test_buffered_events_share_one_write(tmp_path):
+    log_file = tmp_path / "audit.log"
+    audit_logger = AuditLogger(log_file=str(log_file), buffered=True)
+
+    with patch.object(audit_logger, "_write_lines", wraps=audit_logger._write_lines) as write:
+        await _log(audit_logger, 5)
+        await audit_logger.close()
+
+    assert write.call_count == 1
+    assert _messages(log_file) == [f"event {i}" for i in range(5)]
+
+
+async def test_buffered_batches_are_capped(tmp_path):
+    log_file = tmp_path / "audit.log"
+    audit_logger = AuditLogger(log_file=str(log_file), buffered=True)
+
+    with patch.object(audit_logger, "_write_lines", wraps=audit_logger._write_lines) as write:
+        await _log(audit_logger, 2 * AUDIT_BATCH_SIZE + 2)
+        await audit_logger.close()
+
+    assert [len(call.args[0]) for call in write.call_args_list] == [
+        AUDIT_BATCH_SIZE, AUDIT_BATCH_SIZE, 2
+    ]
+    assert len(_messages(log_file)) == 2 * AUDIT_BATCH_SIZE + 2
+
+
+async def test_buffered_logger_reusable_after_close(tmp_path):
+    log_file = tmp_path / "audit.log"
+    audit_logger = AuditLogger(log_file=str(log_file), buffered=True)
+
+    await _log(audit_logger, 1)
+    await audit_logger.close()
+    await _log(audit_logger, 2)
+    await audit_logger.close()
+
+    assert _messages(log_file) == ["event 0", "event 0", "event 1"]
+
+
+async def test_buffered_write_failure_raised_on_close(tmp_path):
+    audit_logger = AuditLogger(log_file=str(tmp_path / "missing" / "audit.log"), buffered=True)
+
+    await _log(audit_logger, 3)
+
+    with pytest.raises(OSError):
+        await audit_logger.close()
+
+
+async def test_stream_sink_receives_events(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stream = io.StringIO()
+    audit_logger = AuditLogger(log_file=stream)
+
+    await _log(audit_logger, 2)
+
+    assert [json.loads(line)["message"] for line in stream.getvalue().splitlines()] == [
+        "event 0", "event 1"
+    ]
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,97 @@
+"""Unit tests for SpendingLimits integer-cent accounting.
+
+Limits and amounts are converted to integer cents once at the API boundary.
+These tests pin the rounding direction (amounts up, limits down) and that the
+Decimal-facing API is unchanged.
+"""
+
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.security.limits import SpendingLimits
+
+
+@pytest.fixture
+def limits():
+    return SpendingLimits(
+        {
+            "max_transaction_value_usd": Decimal("100"),
+            "daily_spending_limit_usd": Decimal("250"),
+            "weekly_spending_limit_usd": Decimal("400"),
+            "monthly_spending_limit_usd": Decimal("500"),
+        }
+    )
+
+
+class TestCentAccounting:
+    def test_transaction_limit_boundary(self, limits):
+        assert limits.check_transaction_limit(Decimal("100"))
+        assert limits.check_transaction_limit(Decimal("99.99"))
+        assert not limits.check_transaction_limit(Decimal("100.01"))
+
+    def test_sub_cent_amount_rounds_up(self, limits):
+        # $100.001 must not round down under the $100 limit
+        assert not limits.check_transaction_limit(Decimal("100.001"))
+
+    def test_daily_limit_accumulates(self, limits):
+        limits.record_transaction(Decimal("100"))
+        limits.record_transaction(Decimal("100"))
+
+        assert limits.check_daily_limit(Decimal("50"))
+        assert not limits.check_daily_limit(Decimal("50.01"))
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_daily_limit_matches_running_total(self, limits, seed):
+        # Property check over random cent amounts: check_daily_limit agrees
+        # with a pure-Python running total at every step
+        rng = random.Random(seed)
+        spent = Decimal("0")
+
+        for _ in range(rng.randint(1, 20)):
+            amount = Decimal(rng.randint(0, 20000)) / 100
+            assert limits.check_daily_limit(amount) is (
+                spent + amount <= limits.daily_limit_usd
+            ), f"seed={seed} spent={spent} amount={amount}"
+            limits.record_transaction(amount)
+            spent += amount
+
+    def test_spending_history_exposes_decimals(self, limits):
+        limits.record_transaction(Decimal("12.34"))
+
+        (_, amount), = limits.spending_history
+        assert isinstance(amount, Decimal)
+        assert amount == Decimal("12.34")
+
+    def test_summary_uses_rolling_windows(self, limits):
+        limits.record_transaction(Decimal("50"))
+        # Backdate one entry into the weekly-but-not-daily window
+        limits._history_cents.append((datetime.now() - timedelta(days=3), 2500))
+
+        summary = limits.get_spending_summary()
+
+        assert summary["daily_spent"] == Decimal("50")
+        assert summary["weekly_spent"] == Decimal("75")
+        assert summary["monthly_spent"] == Decimal("75")
+        assert summary["daily_remaining"] == Decimal("200")
+        assert summary["monthly_remaining"] == Decimal("425")
+
+    def test_weekly_limit_rejects_with_reason(self, limits):
+        limits._history_cents.append((datetime.now() - timedelta(days=3), 35000))
+
+        allowed, reason = limits.check_all_limits(Decimal("60"))
+
+        assert not allowed
+        assert reason.startswith("Exceeds weekly limit: $350")
+
+    async def test_atomic_check_and_record(self, limits):
+        allowed, reason = await limits.atomic_check_and_record(Decimal("100"))
+        assert allowed and reason == ""
+
+        allowed, reason = await limits.atomic_check_and_record(Decimal("100.01"))
+        assert not allowed
+        assert "per-transaction" in reason
+
+        assert sum(amt for _, amt in limits.spending_history) == Decimal("100")
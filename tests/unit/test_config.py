@@ -1,7 +1,8 @@
 """Unit tests for configuration management."""
 
 import pytest
-from src.utils.config import Settings
+from unittest.mock import patch
+from src.utils.config import Settings, get_settings, reload_settings
 from pydantic import ValidationError
 
 
@@ -106,6 +107,7 @@ def test_wallet_seed_validation_valid_12_words() -> None:
         wallet_seed=test_mnemonic,
     )
     assert settings.wallet_seed == test_mnemonic
+    assert settings.wallet_seed_word_count == 12
 
 
 def test_wallet_seed_validation_valid_24_words() -> None:
@@ -120,6 +122,7 @@ def test_wallet_seed_validation_valid_24_words() -> None:
         wallet_seed=test_mnemonic,
     )
     assert settings.wallet_seed == test_mnemonic
+    assert settings.wallet_seed_word_count == 24
 
 
 def test_wallet_seed_strips_whitespace() -> None:
@@ -134,3 +137,16 @@ def test_wallet_seed_strips_whitespace() -> None:
     )
     # Should be stripped
     assert settings.wallet_seed == test_mnemonic
+
+
+def test_get_settings_builds_settings_once() -> None:
+    """Test get_settings() parses the environment once per process."""
+    with patch("src.utils.config.Settings", wraps=Settings) as settings_cls:
+        first = get_settings()
+        assert get_settings() is first
+        assert settings_cls.call_count == 1
+
+        # reload_settings() is the explicit way to re-read the environment
+        assert reload_settings() is not first
+        assert get_settings() is not first
+        assert settings_cls.call_count == 2
@@ -6,7 +6,11 @@ Tests cover boundary conditions, extreme values, and error handling.
 import pytest
 from decimal import Decimal
 
-from src.blockchain.slippage_calculator import SlippageCalculator, PriceDeviationError
+from src.blockchain.slippage_calculator import (
+    SlippageCalculator,
+    PriceDeviationError,
+    slippage_ratio,
+)
 
 
 class TestSlippageCalculationEdgeCases:
@@ -127,6 +131,12 @@ class TestSlippageCalculationEdgeCases:
         )
         assert slippage_bps == 0
 
+    def test_slippage_ratio_primitive(self):
+        """Test shared slippage ratio helper."""
+        assert slippage_ratio(Decimal("100"), Decimal("99.5")) == Decimal("0.005")
+        assert slippage_ratio(Decimal("100"), Decimal("100")) == Decimal("0")
+        assert slippage_ratio(Decimal("100"), Decimal("97")) == Decimal("0.03")
+
 
 class TestPriceDeviationBoundaryTesting:
     """Test price deviation validation at boundaries."""
@@ -0,0 +1,103 @@
+"""Unit tests for ERC20 token metadata reads."""
+
+from unittest.mock import patch
+
+from eth_abi import encode
+from web3 import Web3
+
+from src.tokens import metadata_cache
+from src.tokens.erc20 import ERC20Token
+from tests.fake_chain import FakeChainProvider
+
+USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _fake_token_chain() -> FakeChainProvider:
+    """Base mainnet chain serving USDC metadata."""
+    chain = FakeChainProvider(chain_id=8453)
+    chain.add_call(USDC, "symbol()", encode(["string"], ["USDC"]))
+    chain.add_call(USDC, "decimals()", encode(["uint8"], [6]))
+    chain.add_call(USDC, "name()", encode(["string"], ["USD Coin"]))
+    return chain
+
+
+def _token(chain: FakeChainProvider) -> ERC20Token:
+    with patch("src.tokens.erc20.get_web3", return_value=Web3(chain)):
+        return ERC20Token("base-mainnet", USDC)
+
+
+def test_metadata_batch_is_one_eth_call():
+    chain = _fake_token_chain()
+    token = _token(chain)
+
+    assert token.get_metadata_batch() == {"symbol": "USDC", "decimals": 6, "name": "USD Coin"}
+    assert chain.calls.get("eth_call", 0) == 1
+
+    # Individual getters now hit the cache
+    assert (token.get_symbol(), token.get_decimals(), token.get_name()) == ("USDC", 6, "USD Coin")
+    assert chain.calls.get("eth_call", 0) == 1
+
+
+def test_metadata_batch_falls_back_without_multicall():
+    chain = _fake_token_chain()
+    chain.multicall_fails = True
+    token = _token(chain)
+
+    assert token.get_metadata_batch() == {"symbol": "USDC", "decimals": 6, "name": "USD Coin"}
+    # The failed aggregate3 plus one call per field
+    assert chain.calls.get("eth_call", 0) == 4
+
+
+def test_metadata_persisted_across_instances(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_cache, "DEFAULT_CACHE_PATH", tmp_path / "erc20.json")
+    token = _token(_fake_token_chain())
+    token.get_metadata_batch()
+
+    # A fresh process reads the file instead of the chain
+    metadata_cache._loaded.clear()
+    chain = _fake_token_chain()
+    token = _token(chain)
+
+    assert (token.get_symbol(), token.get_decimals(), token.get_name()) == ("USDC", 6, "USD Coin")
+    assert chain.calls.get("eth_call", 0) == 0
+
+
+def test_fallback_defaults_not_persisted(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_cache, "DEFAULT_CACHE_PATH", tmp_path / "erc20.json")
+    chain = _fake_token_chain()
+    chain.remove_call(USDC, "name()")
+    _token(chain).get_metadata_batch()
+
+    assert metadata_cache.load_metadata(8453, USDC) is None
+
+
+def test_metadata_cache_disabled_by_default():
+    with patch.object(metadata_cache, "_entries", wraps=metadata_cache._entries) as entries:
+        _token(_fake_token_chain()).get_metadata_batch()
+
+    entries.assert_not_called()
+
+
+def test_metadata_cache_enabled_by_env(tmp_path, monkeypatch):
+    cache_path = tmp_path / "erc20.json"
+    monkeypatch.setenv(metadata_cache.CACHE_PATH_ENV, str(cache_path))
+    _token(_fake_token_chain()).get_metadata_batch()
+
+    assert cache_path.exists()
+    assert list(tmp_path.iterdir()) == [cache_path]  # No temporary file left behind
+    assert metadata_cache.load_metadata(8453, USDC) == {
+        "symbol": "USDC", "decimals": 6, "name": "USD Coin"
+    }
+
+
+def test_expired_metadata_is_a_miss(tmp_path):
+    cache_path = tmp_path / "erc20.json"
+    metadata = {"symbol": "USDC", "decimals": 6, "name": "USD Coin"}
+    with patch("src.tokens.metadata_cache.time.time", return_value=1_000_000.0):
+        metadata_cache.save_metadata(8453, USDC, metadata, cache_path)
+
+    expiry = 1_000_000.0 + metadata_cache.METADATA_TTL_SECONDS
+    with patch("src.tokens.metadata_cache.time.time", return_value=expiry):
+        assert metadata_cache.load_metadata(8453, USDC, cache_path) == metadata
+    with patch("src.tokens.metadata_cache.time.time", return_value=expiry + 1):
+        assert metadata_cache.load_metadata(8453, USDC, cache_path) is None
@@ -0,0 +1,37 @@
+"""Unit tests for decoding Multicall3 aggregate3 results."""
+
+from unittest.mock import patch
+
+from eth_abi import encode
+from web3 import Web3
+
+from src.utils import multicall
+from src.utils.contracts import ERC20_ABI
+from src.utils.multicall import decode_result, decode_results
+
+TOKEN = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def _token():
+    return Web3().eth.contract(address=TOKEN, abi=ERC20_ABI)
+
+
+def test_decode_results_resolves_output_types_once():
+    """Test a batch parses the function ABI once, not once per result."""
+    datas = [encode(["uint8"], [decimals]) for decimals in (6, 18, 8)] + [None, b"\x01"]
+
+    with patch.object(
+        multicall, "get_abi_output_types", wraps=multicall.get_abi_output_types
+    ) as output_types:
+        decoded = decode_results(_token(), "decimals", datas)
+
+    output_types.assert_called_once()
+    assert decoded == [(6,), (18,), (8,), None, None]
+
+
+def test_decode_result_matches_batch():
+    """Test the single-result helper decodes like a batch of one."""
+    data = encode(["string"], ["USDC"])
+
+    assert decode_result(_token(), "symbol", data) == ("USDC",)
+    assert decode_result(_token(), "symbol", None) is None
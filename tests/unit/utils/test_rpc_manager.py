@@ -333,6 +333,18 @@ class TestRpcEndpoint:
         assert "very_long_api_key_that_should_be_hidden" not in sanitized
         assert "***" in sanitized
 
+    def test_sanitized_url_computed_once(self):
+        """Verify the sanitized URL is cached and the method shim returns it."""
+        endpoint = RpcEndpoint(
+            url="https://base-mainnet.g.alchemy.com/v2/abc123def456",
+            priority=EndpointPriority.PREMIUM,
+            provider="alchemy",
+            network_id="base-mainnet",
+        )
+
+        assert endpoint.sanitized_url is endpoint.sanitized_url
+        assert endpoint.get_sanitized_url() is endpoint.sanitized_url
+
 
 class TestRpcUsageTracker:
     """Test RPC usage tracking for cost monitoring."""
@@ -389,6 +401,26 @@ class TestRpcUsageTracker:
         assert tracker.daily_usage["alchemy_premium"] == 3
         assert tracker.daily_failures["alchemy_premium"] == 2
 
+    def test_batch_matches_individual_records(self):
+        """Verify record_requests counts the same as one record_request per request."""
+        endpoint = RpcEndpoint(
+            url="https://test.com",
+            priority=EndpointPriority.PREMIUM,
+            provider="alchemy",
+            network_id="base-mainnet",
+        )
+
+        single = RpcUsageTracker()
+        for success in [True] * 8 + [False] * 2:
+            single.record_request(endpoint, success=success)
+
+        batched = RpcUsageTracker()
+        batched.record_requests(endpoint, 8, 2)
+
+        assert batched.daily_usage == single.daily_usage
+        assert batched.monthly_usage == single.monthly_usage
+        assert batched.daily_failures == single.daily_failures
+
     def test_daily_summary_format(self):
         """Verify daily summary has correct format."""
         tracker = RpcUsageTracker()
@@ -595,6 +627,33 @@ class TestRpcManager:
         percentage = (premium_count / 1000) * 100
         assert 25 <= percentage <= 35
 
+    @pytest.mark.parametrize("percentage, expected", [(0, False), (100, True)])
+    def test_full_rollout_skips_random_draw(self, percentage, expected):
+        """Verify 0% and 100% rollouts are decided without drawing a random number."""
+        mock_config = Mock()
+        mock_config.premium_rpc_enabled = True
+        mock_config.premium_rpc_percentage = percentage
+
+        manager = RpcManager(mock_config)
+
+        with patch("src.utils.rpc_manager.random.random") as draw:
+            assert manager.should_use_premium() is expected
+        draw.assert_not_called()
+
+    def test_rollout_percentage_follows_config(self):
+        """Verify a rollout change in config applies without rebuilding the manager."""
+        mock_config = Mock()
+        mock_config.premium_rpc_enabled = True
+        mock_config.premium_rpc_percentage = 0
+
+        manager = RpcManager(mock_config)
+        assert not manager.should_use_premium()
+
+        mock_config.premium_rpc_percentage = 100
+
+        assert manager.premium_percentage == 100
+        assert manager.should_use_premium()
+
     def test_disabled_premium_never_uses_premium(self):
         """Verify premium RPC is never used when disabled."""
         mock_config = Mock()
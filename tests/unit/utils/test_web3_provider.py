@@ -0,0 +1,182 @@
+"""Unit tests for Web3 provider HTTP session sharing."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from unittest.mock import MagicMock, patch
+from web3 import Web3
+
+from src.utils.web3_provider import (
+    HTTP_POOL_MAXSIZE,
+    Web3Provider,
+    batch_rpc_reads,
+    check_network_health_many,
+    _create_http_provider,
+    _get_http_session,
+)
+
+
+class _RpcHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive JSON-RPC endpoint answering every method with 0x14a34."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.client_ports.add(self.client_address[1])
+        self.server.methods.append(request["method"])
+        body = json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": "0x14a34"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def rpc_server():
+    """Local JSON-RPC server recording the client port of every request."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RpcHandler)
+    server.client_ports = set()
+    server.methods = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_session_is_shared_and_pooled():
+    """Test the shared session is a singleton with an enlarged pool."""
+    session = _get_http_session()
+
+    assert _get_http_session() is session
+    assert session.get_adapter("https://rpc.example")._pool_maxsize == HTTP_POOL_MAXSIZE
+
+
+async def test_provider_reuses_one_connection_across_worker_threads(rpc_server):
+    """Test one provider used from asyncio.to_thread workers shares a connection."""
+    url = f"http://127.0.0.1:{rpc_server.server_address[1]}"
+    w3 = Web3(_create_http_provider(url))  # Built on the event loop thread
+
+    block_numbers = [
+        await asyncio.to_thread(lambda: w3.eth.block_number) for _ in range(3)
+    ]
+
+    assert block_numbers == [84532] * 3
+    assert rpc_server.methods.count("eth_blockNumber") == 3
+    assert len(rpc_server.client_ports) == 1
+
+
+def test_separate_providers_share_pooled_connection(rpc_server):
+    """Test a rebuilt provider (e.g. after clear_cache) reuses the open connection."""
+    url = f"http://127.0.0.1:{rpc_server.server_address[1]}"
+
+    for _ in range(3):
+        assert Web3(_create_http_provider(url)).eth.block_number == 84532
+
+    assert rpc_server.methods.count("eth_blockNumber") == 3
+    assert len(rpc_server.client_ports) == 1
+
+
+def test_chain_id_fetched_once_per_provider(rpc_server):
+    """Test immutable chain metadata is cached by the provider."""
+    url = f"http://127.0.0.1:{rpc_server.server_address[1]}"
+    w3 = Web3(_create_http_provider(url))
+
+    assert [w3.eth.chain_id for _ in range(3)] == [84532] * 3
+    assert rpc_server.methods.count("eth_chainId") == 1
+
+
+def test_chain_id_memoized_by_connection_check(rpc_server):
+    """Test chain ID reads after get_web3's connection check cost no RPC."""
+    url = f"http://127.0.0.1:{rpc_server.server_address[1]}"
+
+    with patch.dict("src.utils.web3_provider._web3_instances", clear=True):
+        w3 = Web3Provider.get_web3("base-sepolia", custom_rpc_url=url)
+        methods_after_connect = len(rpc_server.methods)
+
+        assert w3.eth.chain_id == 84532
+        assert len(rpc_server.methods) == methods_after_connect
+        assert rpc_server.methods.count("eth_chainId") == 1
+
+
+def test_batch_rpc_reads_sends_one_batch(rpc_server):
+    """Test reads are queued into a single JSON-RPC batch."""
+    url = f"http://127.0.0.1:{rpc_server.server_address[1]}"
+    w3 = Web3(_create_http_provider(url))
+    w3.provider.make_batch_request = MagicMock(
+        return_value=[{"jsonrpc": "2.0", "id": i, "result": hex(i + 1)} for i in range(2)]
+    )
+
+    results = batch_rpc_reads(w3, lambda: w3.eth.gas_price, lambda: w3.eth.block_number)
+
+    assert results == [1, 2]
+    w3.provider.make_batch_request.assert_called_once()
+    assert rpc_server.methods == []
+
+
+def test_batch_rpc_reads_falls_back_to_single_requests():
+    """Test reads run individually when the provider rejects batching."""
+    w3 = MagicMock()
+    w3.batch_requests.side_effect = Exception("batching not supported")
+    w3.eth.gas_price = 3
+    w3.eth.block_number = 4
+
+    assert batch_rpc_reads(w3, lambda: w3.eth.gas_price, lambda: w3.eth.block_number) == [3, 4]
+
+
+def test_connection_health_reads_share_one_batch(rpc_server):
+    """Test a health check costs one batched round trip once connected."""
+    url = f"http://127.0.0.1:{rpc_server.server_address[1]}"
+
+    with patch.dict("src.utils.web3_provider._web3_instances", clear=True):
+        w3 = Web3Provider.get_web3("base-sepolia", custom_rpc_url=url)
+        methods_after_connect = len(rpc_server.methods)
+        w3.provider.make_batch_request = MagicMock(
+            return_value=[
+                {"jsonrpc": "2.0", "id": 0, "result": hex(1234)},
+                {"jsonrpc": "2.0", "id": 1, "result": hex(10**9)},
+            ]
+        )
+
+        health = Web3Provider.check_connection_health("base-sepolia", custom_rpc_url=url)
+
+    assert health["connected"] and health["chain_id_match"]
+    assert health["block_number"] == 1234
+    assert health["gas_price_gwei"] == 1.0
+    w3.provider.make_batch_request.assert_called_once()
+    assert len(rpc_server.methods) == methods_after_connect
+
+
+async def test_connection_verified_from_worker_thread(rpc_server):
+    """Test get_web3's connection check works off the main thread."""
+    url = f"http://127.0.0.1:{rpc_server.server_address[1]}"
+
+    with patch.dict("src.utils.web3_provider._web3_instances", clear=True):
+        w3 = await asyncio.to_thread(
+            Web3Provider.get_web3, "base-sepolia", custom_rpc_url=url
+        )
+
+    assert w3.eth.chain_id == 84532
+
+
+async def test_check_network_health_many_probes_concurrently():
+    """Test every probe is in flight at once and results keep input order."""
+    networks = ["base-mainnet", "base-sepolia", "arbitrum-sepolia"]
+    all_started = threading.Barrier(len(networks), timeout=5)
+
+    def probe(network_id):
+        all_started.wait()  # Breaks (and raises) if probes ran one at a time
+        return {"network_id": network_id, "connected": True}
+
+    with patch.object(Web3Provider, "check_connection_health", side_effect=probe):
+        results = await check_network_health_many(networks)
+
+    assert [health["network_id"] for health in results] == networks
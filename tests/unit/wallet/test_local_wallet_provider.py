@@ -0,0 +1,167 @@
+"""Unit tests for LocalWalletProvider account derivation."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eth_account import Account
+from web3 import Web3
+
+from src.wallet.local_wallet_provider import LocalWalletProvider
+from tests.fake_chain import FakeChainProvider
+
+TEST_SEED = "wine hero found plate sing hope field join pilot betray eyebrow note"
+TEST_ADDRESS = "0x81A2933C185e45f72755B35110174D57b5E1FC88"
+RECIPIENT = "0x742D35CC6634c0532925A3b844BC9E7595F0BEb0"
+
+# Derived once for tests that don't exercise seed handling
+Account.enable_unaudited_hdwallet_features()
+TEST_ACCOUNT = Account.from_mnemonic(TEST_SEED)
+
+
+def _fake_chain(supports_batch: bool = True) -> FakeChainProvider:
+    """Base Sepolia chain with a 1 gwei base fee and the wallet at nonce 5."""
+    return FakeChainProvider(
+        base_fee_wei=10**9, priority_fee_wei=10**8, nonce=5, supports_batch=supports_batch
+    )
+
+
+def test_seed_derives_default_path_account():
+    """Test a seed phrase derives the standard m/44'/60'/0'/0/0 account."""
+    wallet = LocalWalletProvider(TEST_SEED, MagicMock(), {})
+
+    assert wallet.address == TEST_ADDRESS
+
+
+def test_invalid_seed_raises_value_error():
+    """Test invalid mnemonics raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid seed phrase"):
+        LocalWalletProvider("not a valid mnemonic", MagicMock(), {})
+
+
+def test_from_account_shares_the_account():
+    """Test wallets built from one account reuse it without re-deriving."""
+    account = TEST_ACCOUNT
+
+    with patch.object(Account, "from_mnemonic") as from_mnemonic:
+        wallets = [LocalWalletProvider.from_account(account, MagicMock(), {}) for _ in range(2)]
+
+    from_mnemonic.assert_not_called()
+    assert all(wallet.account is account for wallet in wallets)
+    assert wallets[0].address == TEST_ADDRESS
+    assert wallets[0].get_address() == wallets[0].address
+
+
+def test_simulate_calls_from_wallet_and_raises_on_revert():
+    """Test simulate() is one eth_call from the wallet, failing as ValueError."""
+    web3 = MagicMock()
+    wallet = LocalWalletProvider.from_account(TEST_ACCOUNT, web3, {})
+    tx = {"to": RECIPIENT, "value": 1}
+
+    wallet.simulate(tx)
+    web3.eth.call.assert_called_once_with(
+        {"from": wallet.address, **tx}, block_identifier="pending"
+    )
+
+    web3.eth.call.side_effect = Exception("insufficient funds for transfer")
+    with pytest.raises(ValueError, match="insufficient funds"):
+        wallet.simulate(tx)
+
+
+def test_build_transaction_uses_single_batch():
+    """Test nonce, gas estimate and fee data come from one batched request."""
+    provider = _fake_chain()
+    wallet = LocalWalletProvider.from_account(TEST_ACCOUNT, Web3(provider), {})
+
+    tx = wallet._build_transaction({"from": wallet.address, "to": RECIPIENT, "value": 1})
+
+    assert provider.batches == [
+        [
+            "eth_estimateGas",
+            "eth_getBlockByNumber",
+            "eth_maxPriorityFeePerGas",
+            "eth_getTransactionCount",
+        ]
+    ]
+    assert "eth_estimateGas" not in provider.calls
+    assert tx["nonce"] == 5
+    assert tx["chainId"] == 84532
+    assert tx["gas"] == int(21000 * 1.5)
+    assert tx["maxFeePerGas"] == 2 * 10**9 + 10**8
+    assert tx["maxPriorityFeePerGas"] == 10**8
+
+    # The tracker continues from the batched nonce without re-reading it
+    assert wallet._build_transaction({"to": RECIPIENT, "value": 1})["nonce"] == 6
+    assert "eth_getTransactionCount" not in provider.batches[1]
+
+
+def test_build_transaction_falls_back_without_batching():
+    """Test the serial RPC path is used when batching is unavailable."""
+    provider = _fake_chain(supports_batch=False)
+    wallet = LocalWalletProvider.from_account(TEST_ACCOUNT, Web3(provider), {})
+
+    tx = wallet._build_transaction({"from": wallet.address, "to": RECIPIENT, "value": 1})
+
+    assert "eth_estimateGas" in provider.calls
+    assert tx["nonce"] == 5
+    assert tx["gas"] == int(21000 * 1.5)
+
+
+def test_nonce_read_once_until_reset():
+    """Test nonces come from memory after the first chain read."""
+    provider = _fake_chain()
+    wallet = LocalWalletProvider.from_account(TEST_ACCOUNT, Web3(provider), {})
+
+    assert [wallet.get_nonce() for _ in range(3)] == [5, 6, 7]
+    assert provider.calls.get("eth_getTransactionCount", 0) == 1
+
+    wallet.reset_nonce()
+    assert wallet.get_nonce() == 5
+    assert provider.calls.get("eth_getTransactionCount", 0) == 2
+
+
+def test_chain_id_and_fee_caps_resolved_once():
+    """Test chainId is fetched on the first build only and caps come from config."""
+    provider = _fake_chain()
+    wallet = LocalWalletProvider.from_account(
+        TEST_ACCOUNT,
+        Web3(provider),
+        {"max_gas_price_gwei": 1, "max_priority_fee_gwei": 0.05},
+    )
+
+    first = wallet._build_transaction({"to": RECIPIENT, "value": 1})
+    second = wallet._build_transaction({"to": RECIPIENT, "value": 1})
+
+    assert provider.calls.get("eth_chainId", 0) == 1
+    assert first["chainId"] == second["chainId"] == 84532
+    assert first["maxFeePerGas"] == 10**9
+    assert first["maxPriorityFeePerGas"] == 5 * 10**7
+
+
+def test_send_resyncs_when_chain_nonce_moves_ahead():
+    """Test a nonce used by another sender is re-read from chain and retried."""
+    provider = _fake_chain()
+    wallet = LocalWalletProvider.from_account(TEST_ACCOUNT, Web3(provider), {})
+    assert wallet.get_nonce() == 5
+
+    # Another sender uses nonces 6-8 behind the tracker's back
+    provider.nonce = 9
+    provider.fail_next("eth_sendRawTransaction", "nonce too low: next nonce 9, tx nonce 6")
+
+    tx = {"to": RECIPIENT, "value": 1}
+    wallet.send_transaction(tx)
+
+    assert tx["nonce"] == 9
+    assert provider.calls.get("eth_sendRawTransaction", 0) == 2
+    assert wallet.nonce_tracker.pending_nonce == 10
+
+
+def test_send_does_not_retry_caller_supplied_nonce():
+    """Test an explicit nonce is never silently replaced."""
+    provider = _fake_chain()
+    wallet = LocalWalletProvider.from_account(TEST_ACCOUNT, Web3(provider), {})
+    provider.fail_next("eth_sendRawTransaction", "nonce too low")
+
+    with pytest.raises(Exception, match="nonce too low"):
+        wallet.send_transaction({"to": RECIPIENT, "value": 1, "nonce": 1})
+
+    assert provider.calls.get("eth_sendRawTransaction", 0) == 1